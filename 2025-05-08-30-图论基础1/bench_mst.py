@@ -0,0 +1,81 @@
+"""
+最小生成树算法对比：Kruskal、Borůvka、堆 Prim、稠密 Prim
+
+同样的点数下按不同的平均度数（稀疏到稠密）生成随机连通无向图，核对
+Kruskal 与 Borůvka 选出的边完全相同、各算法的总权值相同，输出用时。
+稠密 Prim 要建 n×n 矩阵，只在点数不超过 DENSE_LIMIT 时运行。用法：python bench_mst.py [点数 ...]
+"""
+import sys
+import time
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from kruskal import edge_array, kruskal_select, boruvka_select
+from prim import prim_heap, prim_dense
+
+DENSE_LIMIT = 5000
+
+
+def random_graph(n, m, max_w=10**6, seed=0):
+    """n 个点、约 m 条不重复边的随机连通无向图（先连一棵随机树保证连通）"""
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(n)
+    tree_u = perm[1:]
+    tree_v = perm[rng.integers(0, np.arange(1, n))]  # 每个点连到排在它前面的某个点
+    if 4 * m >= n * (n - 1):
+        # 稠密：直接打乱全部点对，避免随机抽样重复太多
+        u, v = np.triu_indices(n, 1)
+        p = rng.permutation(len(u))
+        u, v = u[p], v[p]
+    else:
+        extra = max(m - (n - 1), 0)
+        u = rng.integers(0, n, int(extra * 1.1) + 16)
+        v = rng.integers(0, n, len(u))
+    u, v = np.concatenate((tree_u, u)), np.concatenate((tree_v, v))
+    lo, hi = np.minimum(u, v), np.maximum(u, v)
+    keep = lo != hi
+    # 按 lo * n + hi 去重，保留第一次出现（树边排在最前面）
+    _, first = np.unique(lo[keep] * n + hi[keep], return_index=True)
+    first = np.sort(first)[:m]
+    e = np.empty(len(first), dtype=[('u', np.int32), ('v', np.int32), ('w', np.int64)])
+    e['u'], e['v'] = lo[keep][first], hi[keep][first]
+    e['w'] = rng.integers(1, max_w, len(first))
+    return e
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run(sizes=(2000, 20000)):
+    print(f"{'点数':>7} {'边数':>9} {'平均度':>6} {'Kruskal':>9} {'Borůvka':>9} {'堆Prim':>9} {'稠密Prim':>9}")
+    for n in sizes:
+        # 点数不超过 DENSE_LIMIT 时最后再测一次完全图
+        degrees = [d for d in (2, 8, 32, 128, 512) if d < n - 1] + ([n - 1] if n <= DENSE_LIMIT else [])
+        for degree in degrees:
+            m = n * degree // 2
+            e = edge_array(random_graph(n, m))
+            idx_k, t_k = timed(kruskal_select, e, n)
+            idx_b, t_b = timed(boruvka_select, e, n)
+            assert np.array_equal(idx_k, idx_b)
+            total = int(e['w'][idx_k].sum())
+            g = CSRGraph.from_edges(n, np.column_stack((e['u'], e['v'], e['w'])))
+            mst, t_p = timed(prim_heap, g, 0)
+            w = dict(zip(zip(e['u'].tolist(), e['v'].tolist()), e['w'].tolist()))
+            assert sum(w[(min(a, b), max(a, b))] for a, b in mst) == total
+            t_d = '-'
+            if n <= DENSE_LIMIT:
+                matrix = np.zeros((n, n), dtype=np.int64)
+                matrix[e['u'], e['v']] = e['w']
+                matrix[e['v'], e['u']] = e['w']
+                mst, t = timed(prim_dense, matrix, 0)
+                assert sum(w[(min(a, b), max(a, b))] for a, b in mst) == total
+                t_d = f'{t:.3f}s'
+            print(f"{n:>7} {len(e):>9} {2 * len(e) / n:>6.0f} {t_k:>8.3f}s {t_b:>8.3f}s {t_p:>8.3f}s {t_d:>9}")
+
+
+if __name__ == "__main__":
+    run([int(x) for x in sys.argv[1:]] or (2000, 20000))
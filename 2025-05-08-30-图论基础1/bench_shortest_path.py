@@ -0,0 +1,134 @@
+"""
+单源最短路算法对比：二叉堆 Dijkstra、SPFA（FIFO / SLF+LLL）、Bellman-Ford、0-1 BFS
+
+在几类生成的图上核对各算法的距离一致，输出用时、成功松弛次数、队列操作次数，
+并把用时画成 shortest_path_bench.svg。0-1 BFS 只在边权为 0/1 的图上运行；浮点边权的图上距离按舍入误差内一致核对。
+用法：python bench_shortest_path.py [规模]，规模约为点数，默认 20000
+"""
+import sys
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import rcParams
+
+from csr_graph import CSRGraph
+from dijkstra import dijkstra_csr
+from shortest_path import spfa, bellman_ford, zero_one_bfs
+
+rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'Microsoft YaHei']
+rcParams['axes.unicode_minus'] = False
+
+
+def grid_graph(n, max_w=100, seed=0):
+    """约 n 个点的正方形网格，四连通，随机边权"""
+    rng = np.random.default_rng(seed)
+    side = max(int(n ** 0.5), 2)
+    ids = np.arange(side * side).reshape(side, side)
+    u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    w = rng.integers(1, max_w + 1, len(u))
+    return CSRGraph.from_edges(side * side, np.column_stack((u, v, w)))
+
+
+def random_graph(n, degree=4, max_w=100, seed=0):
+    """n 个点、每点平均 degree 条出边的随机有向图，0 -> 1 -> ... -> n-1 的链保证都可达"""
+    rng = np.random.default_rng(seed)
+    m = n * degree
+    u = np.concatenate((np.arange(n - 1), rng.integers(0, n, m)))
+    v = np.concatenate((np.arange(1, n), rng.integers(0, n, m)))
+    w = rng.integers(1, max_w + 1, len(u))
+    return CSRGraph.from_edges(n, np.column_stack((u, v, w)), directed=True)
+
+
+def zero_one_graph(n, degree=4, seed=0):
+    """同 random_graph，但边权随机取 0 或 1"""
+    rng = np.random.default_rng(seed)
+    g = random_graph(n, degree, seed=seed)
+    g.weights = rng.integers(0, 2, g.m)
+    return g
+
+
+def float_graph(n, degree=4, max_w=100, seed=0):
+    """同 random_graph，但边权是 (0, max_w) 内的随机浮点数，用来检查浮点误差下各算法都能正常结束"""
+    rng = np.random.default_rng(seed)
+    g = random_graph(n, degree, seed=seed)
+    g.weights = rng.random(g.m) * max_w
+    return g
+
+
+def spfa_killer(n):
+    """
+    让 SPFA 反复松弛的图：起点 -> a1 -> a2 -> ... -> at（边权 0）是一条"梯子"，
+    ai -> h 的边权随 i 减小，所以每往下走一层都能把 h 改得更近；
+    h 后面接一条长链，h 的每次改进都会沿链重新传一遍，松弛次数约为 t × 链长
+    """
+    t = max(int(n ** 0.5), 2)
+    chain = n - t - 2
+    ladder = np.arange(1, t + 1)
+    h = t + 1
+    tail = np.arange(h, n)
+    u = np.concatenate(([0], ladder[:-1], ladder, tail[:-1]))
+    v = np.concatenate(([1], ladder[1:], np.full(t, h), tail[1:]))
+    w = np.concatenate(([0], np.zeros(t - 1, dtype=np.int64), 2 * (t - ladder) + 1, np.ones(chain, dtype=np.int64)))
+    return CSRGraph.from_edges(n, np.column_stack((u, v, w)), directed=True)
+
+
+FAMILIES = [
+    ('网格', grid_graph),
+    ('随机稀疏', random_graph),
+    ('SPFA杀手', spfa_killer),
+    ('0-1边权', zero_one_graph),
+    ('浮点边权', float_graph),
+]
+
+ALGORITHMS = [
+    ('Dijkstra', dijkstra_csr),
+    ('SPFA', lambda g, s, stats: spfa(g, s, slf=False, lll=False, stats=stats)),
+    ('SPFA+SLF+LLL', spfa),
+    ('Bellman-Ford', bellman_ford),
+    ('0-1 BFS', zero_one_bfs),
+]
+
+
+def run(n=20000, svg='shortest_path_bench.svg'):
+    results = {}  # (图, 算法) -> 用时
+    print(f"{'图':<8} {'点数':>7} {'边数':>8} {'算法':<13} {'用时':>9} {'松弛次数':>10} {'队列操作':>10}")
+    for family, make in FAMILIES:
+        g = make(n)
+        expected = None
+        for name, func in ALGORITHMS:
+            if name == '0-1 BFS' and not np.isin(g.weights, (0, 1)).all():
+                continue
+            stats = {}
+            start = time.perf_counter()
+            dist, _ = func(g, 0, stats=stats)
+            elapsed = time.perf_counter() - start
+            if expected is None:
+                expected = dist
+            # 浮点边权下不同算法的加法顺序不同，距离只要求在舍入误差内一致
+            assert np.allclose(dist, expected), (family, name)
+            results[(family, name)] = elapsed
+            print(f"{family:<8} {g.n:>7} {g.m:>8} {name:<13} {elapsed:>8.3f}s "
+                  f"{stats['relaxations']:>10} {stats['queue_ops']:>10}")
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+    width = 0.8 / len(ALGORITHMS)
+    colors = ['steelblue', 'salmon', 'orange', 'gray', 'green']
+    for k, (name, _) in enumerate(ALGORITHMS):
+        xs = [i + (k - (len(ALGORITHMS) - 1) / 2) * width for i, (family, _) in enumerate(FAMILIES)
+              if (family, name) in results]
+        ys = [results[(family, name)] for family, _ in FAMILIES if (family, name) in results]
+        ax.bar(xs, ys, width=width, color=colors[k], label=name)
+    ax.set_xticks(range(len(FAMILIES)))
+    ax.set_xticklabels([family for family, _ in FAMILIES])
+    ax.set_yscale('log')
+    ax.set_ylabel('用时（秒）')
+    ax.set_title(f'单源最短路用时（约 {n} 个点）')
+    ax.legend(fontsize=9)
+    fig.savefig(svg, format='svg', bbox_inches='tight')
+    print(f"用时对比已保存为 {svg}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
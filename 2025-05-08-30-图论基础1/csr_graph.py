@@ -0,0 +1,59 @@
+"""
+压缩稀疏行（CSR）存图
+
+点 u 的出边是 indices[indptr[u]:indptr[u+1]]，对应边权在 weights 的同一段里。
+三个数组都是 NumPy 数组，n 个点 m 条边只占 O(n + m) 内存，适合百万点级别的稀疏图；
+邻接矩阵则要 O(n²)。
+"""
+import numpy as np
+
+
+class CSRGraph:
+    def __init__(self, indptr, indices, weights):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = np.asarray(weights)
+        self.n = len(self.indptr) - 1
+
+    @property
+    def m(self):
+        """边数（无向图每条边按两条有向边计）"""
+        return len(self.indices)
+
+    @classmethod
+    def from_edges(cls, n, edges, directed=False):
+        """
+        由边表构造
+
+        参数:
+        edges: [(u, v, w), ...] 或形状为 (m, 3) 的数组
+        directed: False 时每条边存两个方向
+
+        同一起点的边保持输入顺序
+        """
+        arr = np.asarray(edges).reshape(-1, 3)
+        src = arr[:, 0].astype(np.int64)
+        dst = arr[:, 1].astype(np.int64)
+        w = arr[:, 2]
+        if not directed:
+            # 交错排列 (u->v, v->u)，稳定排序后每个点的边仍按边表出现的先后
+            src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+            w = np.repeat(w, 2)
+        order = np.argsort(src, kind='stable')
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(indptr, dst[order], w[order])
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """由邻接矩阵构造，非 0 元素视为边，每个点的边按终点编号从小到大排列"""
+        matrix = np.asarray(matrix)
+        rows, cols = np.nonzero(matrix)
+        indptr = np.zeros(len(matrix) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(matrix)), out=indptr[1:])
+        return cls(indptr, cols, matrix[rows, cols])
+
+    def neighbors(self, u):
+        """(终点数组, 边权数组)"""
+        a, b = self.indptr[u], self.indptr[u + 1]
+        return self.indices[a:b], self.weights[a:b]
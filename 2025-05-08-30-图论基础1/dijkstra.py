@@ -1,47 +1,95 @@
+import heapq
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib import rcParams
 
+from chain_graph import ChainGraph
+from csr_graph import CSRGraph
+
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'Microsoft YaHei']
 rcParams['axes.unicode_minus'] = False
 rcParams['font.size'] = 20  # 全局字号
 
-def dijkstra_algorithm(graph, start, end):
-    n = len(graph)
+def dijkstra_csr(g, start, targets=None, trace=None, stats=None):
+    """
+    CSR 图上的二叉堆 Dijkstra，O((n + m) log n)
+
+    参数:
+    g: csr_graph.CSRGraph 或 chain_graph.ChainGraph（先转成 CSR），边权非负
+    targets: None 时求出到所有点的最短路；传一个点时它出堆即停；传一组点时它们全部出堆后停止
+    trace: 可选的 list，传入时每确定一个点追加一帧 (dist, prev, visited)，停止时再追加一帧，
+           与 create_animation 使用的格式相同；大图不要传
+    stats: 可选的 dict，结束后写入 relaxations（成功松弛次数）与 queue_ops（入堆加出堆次数）
+
+    返回:
+    (dist, prev)：dist[v] 为最短距离（未确定的点是当时的临时值或 inf），prev[v] 为最短路上的前驱
+    """
+    if isinstance(g, ChainGraph):
+        g = g.to_csr()
+    indptr, indices, weights = g.indptr.tolist(), g.indices.tolist(), g.weights.tolist()
+    n = g.n
     dist = [float('inf')] * n
     prev = [-1] * n
     visited = [False] * n
+    if targets is None:
+        remaining = n
+        is_target = None
+    else:
+        wanted = {targets} if isinstance(targets, (int, np.integer)) else set(targets)
+        remaining = len(wanted)
+        is_target = [False] * n
+        for v in wanted:
+            is_target[v] = True
     dist[start] = 0
-    steps = []  # 记录每一步的状态
-    while True:
-        u = -1
-        min_dist = float('inf')
-        for i in range(n):
-            if not visited[i] and dist[i] < min_dist:
-                min_dist = dist[i]
-                u = i
-        if u == -1 or u == end:
-            break
+    heap = [(0, start)]
+    push, pop = heapq.heappush, heapq.heappop
+    relaxations = pops = 0
+    while heap and remaining:
+        d, u = pop(heap)
+        pops += 1
+        if visited[u] or d > dist[u]:
+            continue
+        if is_target is None or is_target[u]:
+            remaining -= 1
+            # 单个终点出堆时不再标记和扩展，与原来的矩阵版一致
+            if not remaining and is_target is not None:
+                break
         visited[u] = True
-        # 记录当前状态
-        steps.append((dist[:], prev[:], visited[:]))
-        for v in range(n):
-            if graph[u][v] > 0 and not visited[v]:
-                if dist[u] + graph[u][v] < dist[v]:
-                    dist[v] = dist[u] + graph[u][v]
-                    prev[v] = u
-    # 最后一步也记录
-    steps.append((dist[:], prev[:], visited[:]))
-    # 回溯最短路径
+        if trace is not None:
+            trace.append((dist[:], prev[:], visited[:]))
+        a, b = indptr[u], indptr[u + 1]
+        # 边权非负，已确定的点不会再被严格松弛，不必检查 visited
+        for v, w in zip(indices[a:b], weights[a:b]):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                push(heap, (nd, v))
+                relaxations += 1
+    if trace is not None:
+        trace.append((dist[:], prev[:], visited[:]))
+    if stats is not None:
+        # 起点入堆一次，之后每次成功松弛恰好入堆一次
+        stats.update(relaxations=relaxations, queue_ops=1 + relaxations + pops)
+    return dist, prev
+
+def shortest_path(prev, end):
+    """沿 prev 回溯出到 end 的路径（end 不可达时只含 end 本身）"""
     path = []
     cur = end
     while cur != -1:
         path.append(cur)
         cur = prev[cur]
-    path = path[::-1]
-    return steps, path
+    return path[::-1]
+
+def dijkstra_algorithm(graph, start, end):
+    """邻接矩阵接口：转成 CSR 后运行 dijkstra_csr，返回 (每一步的状态, 最短路径)"""
+    steps = []  # 记录每一步的状态
+    _, prev = dijkstra_csr(CSRGraph.from_matrix(graph), start, end, trace=steps)
+    return steps, shortest_path(prev, end)
 
 def create_animation():
     n = 7
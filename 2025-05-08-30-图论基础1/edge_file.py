@@ -0,0 +1,187 @@
+"""
+二进制边表文件：大图从磁盘读入
+
+文件格式（小端）：32 字节文件头 + m 条定长记录
+- 文件头：magic、点数 n、边数 m、是否有向（后三项为 int64）
+- 每条边：u、v（int32），w、cap，共 24 字节；magic 为 b'EDGELST1' 时 w、cap 是 int64，
+  为 b'EDGELSTF' 时是 float64（有小数边权的文件）
+
+read_csr 用 np.memmap 打开文件，分块做两遍计数排序建 CSR：第一遍统计出度得到 indptr，
+第二遍把每块的终点、边权写到各自的位置上，全程只有 NumPy 数组，不产生 Python 元组，
+内存占用是 CSR 本身加上一块的大小。文本边表（每行 "u v [w [cap]]"，# 或 % 开头为注释）
+由 convert_text 流式转成二进制文件，open_edges 遇到文本文件时只转换一次，之后直接读缓存的 .bin。
+read_csr 的结果可直接交给 dijkstra_csr、prim_heap；open_edges 得到的数组带 u、v、w 字段，可直接交给 kruskal_select。
+用法：python edge_file.py 文本边表 [输出文件]
+"""
+import os
+import sys
+from itertools import islice
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+MAGIC = b'EDGELST1'
+MAGIC_FLOAT = b'EDGELSTF'
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('n', '<i8'), ('m', '<i8'), ('directed', '<i8')])
+EDGE_DTYPE = np.dtype([('u', '<i4'), ('v', '<i4'), ('w', '<i8'), ('cap', '<i8')])
+EDGE_DTYPE_FLOAT = np.dtype([('u', '<i4'), ('v', '<i4'), ('w', '<f8'), ('cap', '<f8')])
+EDGE_DTYPES = {MAGIC: EDGE_DTYPE, MAGIC_FLOAT: EDGE_DTYPE_FLOAT}
+CHUNK = 1 << 22  # 每块处理的边数
+
+
+def write_edges(path, n, u, v, w=None, cap=None, directed=True):
+    """把 u、v、w、cap 四列写成二进制边表，w、cap 缺省为 0；其中有浮点数时按浮点格式写"""
+    is_float = any(c is not None and np.asarray(c).dtype.kind == 'f' for c in (w, cap))
+    magic = MAGIC_FLOAT if is_float else MAGIC
+    e = np.zeros(len(u), dtype=EDGE_DTYPES[magic])
+    e['u'], e['v'] = u, v
+    if w is not None:
+        e['w'] = w
+    if cap is not None:
+        e['cap'] = cap
+    header = np.array([(magic, n, len(e), directed)], dtype=HEADER_DTYPE)
+    with open(path, 'wb') as f:
+        header.tofile(f)
+        e.tofile(f)
+
+
+def _read_header(path):
+    """返回 (n, m, directed, 每条边的 dtype)"""
+    header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+    if len(header) == 0 or header['magic'][0] not in EDGE_DTYPES:
+        raise ValueError(f'{path} 不是二进制边表文件')
+    h = header[0]
+    return int(h['n']), int(h['m']), bool(h['directed']), EDGE_DTYPES[h['magic']]
+
+
+def read_header(path):
+    """返回 (n, m, directed)"""
+    return _read_header(path)[:3]
+
+
+def open_edges(path):
+    """
+    以只读 memmap 打开边表，文本文件先转换为同名 .bin（已有且比文本新时直接使用）
+
+    返回:
+    (n, directed, edges)：edges 是字段为 u、v、w、cap 的 memmap 结构化数组
+    """
+    with open(path, 'rb') as f:
+        is_binary = f.read(len(MAGIC)) in EDGE_DTYPES
+    if not is_binary:
+        bin_path = path + '.bin'
+        if not os.path.exists(bin_path) or os.path.getmtime(bin_path) < os.path.getmtime(path):
+            convert_text(path, bin_path)
+        path = bin_path
+    n, m, directed, dtype = _read_header(path)
+    edges = np.memmap(path, dtype=dtype, mode='r', offset=HEADER_DTYPE.itemsize, shape=(m,))
+    return n, directed, edges
+
+
+def _chunk_arcs(edges, a, b, directed, weight):
+    """第 a..b 条边对应的 (起点, 终点, 边权)，无向图交错排列 (u->v, v->u)，与 CSRGraph.from_edges 一致"""
+    block = edges[a:b]
+    src, dst, w = block['u'], block['v'], block[weight]
+    if not directed:
+        src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+        w = np.repeat(w, 2)
+    return src.astype(np.int64), dst, w
+
+
+def read_csr(path, weight='w', directed=None, chunk=CHUNK):
+    """
+    从边表文件分块构造 CSRGraph
+
+    参数:
+    weight: 作为边权的列，'w' 或 'cap'
+    directed: 缺省按文件头；False 时每条边存两个方向
+
+    同一起点的边保持文件中的顺序，结果与 CSRGraph.from_edges 相同
+    """
+    n, file_directed, edges = open_edges(path)
+    directed = file_directed if directed is None else directed
+    m = len(edges)
+    # 第一遍：出度
+    deg = np.zeros(n, dtype=np.int64)
+    for a in range(0, m, chunk):
+        src, _, _ = _chunk_arcs(edges, a, a + chunk, directed, weight)
+        deg += np.bincount(src, minlength=n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(deg, out=indptr[1:])
+    # 第二遍：按块把边放到各自起点的下一个空位
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    weights = np.empty(indptr[-1], dtype=edges.dtype[weight])
+    cursor = indptr[:-1].copy()
+    for a in range(0, m, chunk):
+        src, dst, w = _chunk_arcs(edges, a, a + chunk, directed, weight)
+        order = np.argsort(src, kind='stable')
+        s = src[order]
+        # 块内每条边在同起点边中的序号
+        first = np.searchsorted(s, s, side='left')
+        pos = cursor[s] + np.arange(len(s)) - first
+        indices[pos] = dst[order]
+        weights[pos] = w[order]
+        cursor += np.bincount(src, minlength=n)
+    return CSRGraph(indptr, indices, weights)
+
+
+def convert_text(src_path, dst_path, n=None, directed=True, chunk_lines=1 << 20):
+    """
+    流式把文本边表转成二进制边表，每次只读 chunk_lines 行
+
+    w、cap 都是整数时写成整数格式；遇到小数时改用浮点格式，之前已写入的边原地改写
+    （两种格式每条边长度相同）。
+
+    参数:
+    n: 点数，缺省为最大编号 + 1
+
+    返回:
+    边数
+    """
+    m, max_id, cols, magic = 0, -1, None, MAGIC
+    with open(src_path) as fin, open(dst_path, 'wb') as fout:
+        fout.write(b'\0' * HEADER_DTYPE.itemsize)  # 先占位，写完边再回填
+        while True:
+            lines = list(islice(fin, chunk_lines))
+            if not lines:
+                break
+            lines = [line for line in lines if line.strip() and line[0] not in '#%']
+            if not lines:
+                continue
+            if cols is None:
+                cols = len(lines[0].split())
+                if not 2 <= cols <= 4:
+                    raise ValueError(f'每行应为 "u v [w [cap]]"，实际有 {cols} 列')
+            tokens = ' '.join(lines).split()
+            try:
+                arr = np.array(tokens, dtype=np.int64).reshape(-1, cols)
+            except ValueError:
+                arr = np.array(tokens, dtype=np.float64).reshape(-1, cols)
+                if magic == MAGIC:
+                    magic = MAGIC_FLOAT
+                    fout.flush()
+                    done = np.fromfile(dst_path, dtype=EDGE_DTYPE, count=m, offset=HEADER_DTYPE.itemsize)
+                    fout.seek(HEADER_DTYPE.itemsize)
+                    done.astype(EDGE_DTYPE_FLOAT).tofile(fout)
+            e = np.zeros(len(arr), dtype=EDGE_DTYPES[magic])
+            for name, col in zip(EDGE_DTYPE.names, arr.T):
+                e[name] = col
+            e.tofile(fout)
+            m += len(arr)
+            max_id = max(max_id, int(arr[:, :2].max()))
+        header = np.array([(magic, max_id + 1 if n is None else n, m, directed)], dtype=HEADER_DTYPE)
+        fout.seek(0)
+        header.tofile(fout)
+    return m
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    src = sys.argv[1]
+    dst = sys.argv[2] if len(sys.argv) > 2 else src + '.bin'
+    m = convert_text(src, dst)
+    n, _, _ = read_header(dst)
+    print(f'{src} -> {dst}：{n} 个点，{m} 条边')
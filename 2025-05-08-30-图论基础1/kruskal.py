@@ -9,31 +9,83 @@ rcParams['axes.unicode_minus'] = False
 rcParams['font.size'] = 20  # 全局字号
 
 # Kruskal算法实现
-class UnionFind:
-    def __init__(self, n):
-        self.parent = list(range(n))
-    def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-    def union(self, x, y):
-        fx, fy = self.find(x), self.find(y)
-        if fx == fy:
-            return False
-        self.parent[fx] = fy
-        return True
+from chain_graph import ChainGraph
+from union_find import UnionFind
 
-def kruskal_algorithm(edges, n):
-    # edges: [(u, v, w), ...]
-    edges_sorted = sorted(edges, key=lambda x: x[2])
+def edge_array(edges):
+    """
+    把 [(u, v, w), ...] 或 ChainGraph 转成字段为 u、v、w 的结构化 NumPy 数组（已经是结构化数组时原样返回）
+    """
+    if isinstance(edges, np.ndarray) and edges.dtype.names:
+        return edges
+    if isinstance(edges, ChainGraph):
+        return edges.edge_array()
+    arr = np.asarray(edges).reshape(-1, 3)
+    w_type = np.int64 if np.issubdtype(arr.dtype, np.integer) else np.float64
+    e = np.empty(len(arr), dtype=[('u', np.int32), ('v', np.int32), ('w', w_type)])
+    e['u'], e['v'], e['w'] = arr[:, 0], arr[:, 1], arr[:, 2]
+    return e
+
+def kruskal_select(e, n, chunk=None):
+    """
+    Kruskal，返回选中的边在 e 中的下标（按加入顺序）
+
+    边按 (w, 下标) 排序：argsort 稳定排序，权值相同的边保持输入顺序。
+    排好序的边分块交给 UnionFind.union_many，连通后不再处理后面的块
+    """
+    order = np.argsort(e['w'], kind='stable')
+    us, vs = e['u'][order], e['v'][order]
+    uf = UnionFind(n)
+    chunk = chunk or max(4 * n, 1024)
+    picked = []
+    for start in range(0, len(order), chunk):
+        merged = uf.union_many(us[start:start + chunk], vs[start:start + chunk])
+        picked.append(order[start:start + chunk][merged])
+        if uf.count <= 1:
+            break
+    return np.concatenate(picked) if picked else np.zeros(0, dtype=np.int64)
+
+def boruvka_select(e, n):
+    """
+    Borůvka，返回选中的边在 e 中的下标，顺序与 kruskal_select 相同
+
+    每一轮每个连通块选一条最便宜的出边，全部用向量运算完成：边事先按 (w, 下标) 排好序，
+    把每条边的两个端点所在块交错排成一列，np.unique 取每个块第一次出现的位置就是它最便宜的边。
+    用同一个全序比较边，最小生成树唯一，所以结果和 Kruskal 完全一样
+    """
+    order = np.argsort(e['w'], kind='stable')
+    rank = np.arange(len(order))  # 当前剩余边在排序后的位置
+    us = e['u'][order].astype(np.int64)
+    vs = e['v'][order].astype(np.int64)
     uf = UnionFind(n)
-    mst_edges = []
-    for u, v, w in edges_sorted:
-        if uf.union(u, v):
-            mst_edges.append((u, v))
-        if len(mst_edges) == n - 1:
+    comp = np.arange(n)
+    picked = []
+    while True:
+        cu, cv = comp[us], comp[vs]
+        cross = cu != cv  # 块内的边以后也不会再用，直接丢掉
+        rank, us, vs, cu, cv = rank[cross], us[cross], vs[cross], cu[cross], cv[cross]
+        if len(rank) == 0:
             break
-    return mst_edges
+        _, first = np.unique(np.column_stack((cu, cv)).ravel(), return_index=True)
+        cheapest = np.unique(first // 2)
+        picked.append(rank[cheapest])
+        uf.union_many(cu[cheapest], cv[cheapest])
+        comp = uf.find_many(comp).astype(np.int64)
+    if not picked:
+        return np.zeros(0, dtype=np.int64)
+    return order[np.sort(np.concatenate(picked))]
+
+def kruskal_algorithm(edges, n):
+    # edges: [(u, v, w), ...] 或 edge_array 得到的结构化数组
+    e = edge_array(edges)
+    idx = kruskal_select(e, n)
+    return list(zip(e['u'][idx].tolist(), e['v'][idx].tolist()))
+
+def boruvka_algorithm(edges, n):
+    """与 kruskal_algorithm 接口和结果都相同的 Borůvka 版本"""
+    e = edge_array(edges)
+    idx = boruvka_select(e, n)
+    return list(zip(e['u'][idx].tolist(), e['v'][idx].tolist()))
 
 def create_animation():
     # 固定图结构和权重，节点数7
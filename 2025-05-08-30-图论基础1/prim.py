@@ -1,37 +1,91 @@
+import heapq
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib import rcParams
 
+from chain_graph import ChainGraph
+
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'Microsoft YaHei']
 rcParams['axes.unicode_minus'] = False
 rcParams['font.size'] = 20  # 全局字号
 
-def prim_algorithm(graph, start_node=0):
+def prim_dense(graph, start_node=0, trace=None):
+    """
+    稠密图 Prim，O(n²) 但每一步都是 NumPy 向量运算：argmin 选点，np.minimum 整行更新 key
+
+    参数:
+    graph: n×n 邻接矩阵，非 0 元素为边权
+    trace: 可选的 list，传入时每加入一个点追加 (u, parent[u], key[u])
+
+    返回:
+    最小生成树的边 [(parent, u), ...]，按加入顺序；图不连通时只含 start_node 所在的连通块
+    """
+    graph = np.asarray(graph)
     n = len(graph)
-    visited = [False] * n
-    parent = [-1] * n
-    key = [float('inf')] * n
+    key = np.full(n, np.inf)  # 已加入的点 key 置为 inf，argmin 不会再选到
+    parent = np.full(n, -1)
+    visited = np.zeros(n, dtype=bool)
     key[start_node] = 0
     mst_edges = []
-    
     for _ in range(n):
-        min_key = float('inf')
-        u = -1
-        for v in range(n):
-            if not visited[v] and key[v] < min_key:
-                min_key = key[v]
-                u = v
+        u = int(np.argmin(key))
+        if key[u] == np.inf:
+            break
+        if trace is not None:
+            trace.append((u, int(parent[u]), key[u].item()))
         visited[u] = True
+        key[u] = np.inf
         if parent[u] != -1:
-            mst_edges.append((parent[u], u))
-        for v in range(n):
-            if graph[u][v] > 0 and not visited[v] and graph[u][v] < key[v]:
-                parent[v] = u
-                key[v] = graph[u][v]
+            mst_edges.append((int(parent[u]), u))
+        row = np.where(graph[u] > 0, graph[u], np.inf)
+        better = (row < key) & ~visited
+        parent[better] = u
+        np.minimum(key, row, out=key, where=~visited)
+    return mst_edges
+
+def prim_heap(g, start_node=0, trace=None):
+    """
+    稀疏图上的懒惰删除堆 Prim，O(m log m)
+
+    参数:
+    g: csr_graph.CSRGraph（无向图，每条边两个方向都要存）或无向的 chain_graph.ChainGraph
+    trace: 同 prim_dense
+
+    选点顺序和 prim_dense 相同（key 相同时编号小的先出堆，parent 取最早给出该 key 的点），结果一致
+    """
+    if isinstance(g, ChainGraph):
+        g = g.to_csr()
+    indptr, indices, weights = g.indptr.tolist(), g.indices.tolist(), g.weights.tolist()
+    n = g.n
+    key = [float('inf')] * n
+    visited = [False] * n
+    key[start_node] = 0
+    heap = [(0, start_node, -1)]
+    mst_edges = []
+    while heap:
+        k, u, p = heapq.heappop(heap)
+        if visited[u]:
+            continue
+        if trace is not None:
+            trace.append((u, p, k))
+        visited[u] = True
+        if p != -1:
+            mst_edges.append((p, u))
+        for i in range(indptr[u], indptr[u + 1]):
+            v, w = indices[i], weights[i]
+            # 只有严格变小才入堆，堆里不会出现同一个点相同 key 的多个 parent
+            if w < key[v] and not visited[v]:
+                key[v] = w
+                heapq.heappush(heap, (w, v, u))
     return mst_edges
 
+def prim_algorithm(graph, start_node=0, trace=None):
+    """邻接矩阵接口，使用向量化的稠密 Prim"""
+    return prim_dense(graph, start_node, trace)
+
 def create_animation():
     # 固定图结构和权重，节点数7
     n = 7
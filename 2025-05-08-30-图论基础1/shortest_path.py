@@ -0,0 +1,151 @@
+"""
+Dijkstra 之外的单源最短路：SPFA（可选 SLF / LLL 优化）、Bellman-Ford、0-1 BFS
+
+都在 csr_graph.CSRGraph（或 ChainGraph）上运行，返回与 dijkstra_csr 相同的 (dist, prev)；
+stats 参数与 dijkstra_csr 相同，结束后写入 relaxations（成功松弛次数）与 queue_ops（入队加出队次数）。
+- SPFA：Bellman-Ford 的队列优化版，允许负权，最坏 O(nm)
+  SLF（Small Label First）：新入队的点比队首近时放到队首；
+  LLL（Large Label Last）：队首比队列中的平均距离远时先挪到队尾
+- Bellman-Ford：每一轮用 NumPy 对全部边同时松弛，某一轮没有变化就提前结束，最多 n - 1 轮
+- 0-1 BFS：边权只有 0 和 1 时用双端队列代替堆，O(n + m)
+存在从起点可达的负圈时 SPFA 与 Bellman-Ford 抛出 ValueError。
+"""
+from collections import deque
+
+import numpy as np
+
+from chain_graph import ChainGraph
+
+INF = float('inf')
+
+
+def spfa(g, start, slf=True, lll=True, stats=None):
+    """slf、lll 分别打开 SLF、LLL 优化，都关掉就是普通的 FIFO 队列"""
+    if isinstance(g, ChainGraph):
+        g = g.to_csr()
+    indptr, indices, weights = g.indptr.tolist(), g.indices.tolist(), g.weights.tolist()
+    n = g.n
+    dist = [INF] * n
+    prev = [-1] * n
+    inq = [False] * n
+    cnt = [0] * n  # 入队次数，超过 n 次说明有负圈
+    dist[start] = 0
+    q = deque([start])
+    inq[start] = True
+    total = 0  # 队列中各点距离之和，LLL 用
+    relaxations, queue_ops = 0, 1
+    while q:
+        u = q.popleft()
+        queue_ops += 1
+        if lll:
+            # 最多把队列轮转一圈：浮点边权下 total 有舍入误差，不设上限可能一直轮转下去
+            for _ in range(len(q)):
+                if dist[u] * (len(q) + 1) <= total:
+                    break
+                q.append(u)
+                u = q.popleft()
+                queue_ops += 2
+        inq[u] = False
+        du = dist[u]
+        total -= du
+        if not q:
+            total = 0  # 队列空了就清掉累积的舍入误差
+        a, b = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[a:b], weights[a:b]):
+            nd = du + w
+            if nd < dist[v]:
+                relaxations += 1
+                prev[v] = u
+                if inq[v]:
+                    total -= dist[v] - nd
+                    dist[v] = nd
+                    continue
+                dist[v] = nd
+                cnt[v] += 1
+                if cnt[v] > n:
+                    raise ValueError('图中存在从起点可达的负圈')
+                inq[v] = True
+                total += nd
+                queue_ops += 1
+                if slf and q and nd < dist[q[0]]:
+                    q.appendleft(v)
+                else:
+                    q.append(v)
+    if stats is not None:
+        stats.update(relaxations=relaxations, queue_ops=queue_ops)
+    return dist, prev
+
+
+def bellman_ford(g, start, stats=None):
+    """
+    每轮把所有边同时松弛一次（NumPy），没有点被更新时提前结束
+
+    relaxations 记为各轮距离变小的点数之和；没有队列，queue_ops 为 0
+    """
+    if isinstance(g, ChainGraph):
+        g = g.to_csr()
+    n = g.n
+    src = np.repeat(np.arange(n), np.diff(g.indptr))
+    dst = g.indices
+    w = g.weights.astype(np.float64)
+    dist = np.full(n, np.inf)
+    dist[start] = 0
+    prev = np.full(n, -1, dtype=np.int64)
+    relaxations = 0
+    for _ in range(n):
+        cand = dist[src] + w
+        new = dist.copy()
+        np.minimum.at(new, dst, cand)
+        changed = np.flatnonzero(new < dist)
+        if len(changed) == 0:
+            break
+        # 前驱取达到新距离的第一条边
+        hit = np.flatnonzero(cand == new[dst])
+        hit = hit[new[dst[hit]] < dist[dst[hit]]]
+        owner, first = np.unique(dst[hit], return_index=True)
+        prev[owner] = src[hit[first]]
+        relaxations += len(changed)
+        dist = new
+    else:
+        raise ValueError('图中存在从起点可达的负圈')
+    if stats is not None:
+        stats.update(relaxations=relaxations, queue_ops=0)
+    return dist.tolist(), prev.tolist()
+
+
+def zero_one_bfs(g, start, stats=None):
+    """边权必须都是 0 或 1，否则抛出 ValueError"""
+    if isinstance(g, ChainGraph):
+        g = g.to_csr()
+    if not np.isin(g.weights, (0, 1)).all():
+        raise ValueError('0-1 BFS 要求边权只能是 0 或 1')
+    indptr, indices, weights = g.indptr.tolist(), g.indices.tolist(), g.weights.tolist()
+    n = g.n
+    dist = [INF] * n
+    prev = [-1] * n
+    done = [False] * n
+    dist[start] = 0
+    q = deque([start])
+    relaxations, queue_ops = 0, 1
+    while q:
+        u = q.popleft()
+        queue_ops += 1
+        # 队列中的距离单调不减，同一个点第一次出队时距离已经确定
+        if done[u]:
+            continue
+        done[u] = True
+        du = dist[u]
+        a, b = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[a:b], weights[a:b]):
+            if du + w < dist[v]:
+                dist[v] = du + w
+                prev[v] = u
+                relaxations += 1
+                queue_ops += 1
+                if w == 0:
+                    q.appendleft(v)
+                else:
+                    q.append(v)
+    if stats is not None:
+        stats.update(relaxations=relaxations, queue_ops=queue_ops)
+    return dist, prev
@@ -1,32 +1,130 @@
+from array import array
+from collections import deque
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib import rcParams
 
+from chain_graph import ChainGraph
+
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'Microsoft YaHei']
 rcParams['axes.unicode_minus'] = False
 rcParams['font.size'] = 20  # 全局字号
 
+POP, EDGE, PUSH = 0, 1, 2  # 事件类型
+
+class TopoTrace:
+    """
+    拓扑排序的事件记录，每个事件 O(1)：
+    (POP, u) 出队 u；(EDGE, v) 删去刚出队的点指向 v 的边；(PUSH, v) v 入度变为 0 入队。
+    事件存在两个 array 里，百万点的图也能开着记录排序
+    """
+    def __init__(self):
+        self.kinds = array('b')
+        self.args = array('i')
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def replay(self, n, in_deg):
+        """
+        按事件重放，依次产生 (topo, in_deg, removed_edges, queue) 快照：每个点出队后一帧，最后再一帧。
+        in_deg 为初始入度；快照是复制出来的，只在画动画的小图上用
+        """
+        in_deg = list(in_deg)
+        topo, removed_edges = [], set()
+        queue = deque(i for i in range(n) if in_deg[i] == 0)
+        cur = -1
+        for kind, x in zip(self.kinds, self.args):
+            if kind == POP:
+                cur = queue.popleft()
+                topo.append(cur)
+                yield topo[:], in_deg[:], removed_edges.copy(), list(queue)
+            elif kind == EDGE:
+                removed_edges.add((cur, x))
+                in_deg[x] -= 1
+            else:
+                queue.append(x)
+        yield topo[:], in_deg[:], removed_edges.copy(), list(queue)
+
+def topo_sort(n, edges, trace=None):
+    """
+    Kahn 拓扑排序，O(n + m)
+
+    参数:
+    edges: 形状为 (m, 2) 的边数组、[(u, v), ...] 或有向的 ChainGraph，同一起点的边按给出（加边）的顺序处理
+    trace: 可选的 TopoTrace
+
+    返回:
+    (order, cycle)：order 为排好的点；图中有环时 order 不含环上及其下游的点，
+    cycle 为其中一个环 [v0, v1, ..., vk]（vk -> v0 也是边），无环时为 None
+    """
+    if isinstance(edges, ChainGraph):
+        e = edges.edge_array()
+        edges = np.column_stack((e['u'], e['v']))
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    src, dst = edges[:, 0], edges[:, 1]
+    in_deg = np.bincount(dst, minlength=n)
+    order_idx = np.argsort(src, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    indptr, indices = indptr.tolist(), dst[order_idx].tolist()
+    deg = in_deg.tolist()
+    # order 本身兼作队列：head 之前是已出队的点
+    order = [i for i in range(n) if deg[i] == 0]
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        if trace is not None:
+            trace.kinds.append(POP)
+            trace.args.append(u)
+        for i in range(indptr[u], indptr[u + 1]):
+            v = indices[i]
+            deg[v] -= 1
+            if trace is not None:
+                trace.kinds.append(EDGE)
+                trace.args.append(v)
+            if deg[v] == 0:
+                order.append(v)
+                if trace is not None:
+                    trace.kinds.append(PUSH)
+                    trace.args.append(v)
+    if len(order) == n:
+        return order, None
+    return order, _find_cycle(n, src, dst, order)
+
+def _find_cycle(n, src, dst, order):
+    """剩下的点入度都大于 0，沿剩余点之间的边反向走，必然走进一个环"""
+    left = np.ones(n, dtype=bool)
+    left[order] = False
+    mask = left[src] & left[dst]
+    pred = np.full(n, -1, dtype=np.int64)
+    pred[dst[mask]] = src[mask]
+    pred = pred.tolist()
+    seen = {}
+    v = int(np.flatnonzero(left)[0])
+    while v not in seen:
+        seen[v] = len(seen)
+        v = pred[v]
+    cycle = [v]
+    u = pred[v]
+    while u != v:
+        cycle.append(u)
+        u = pred[u]
+    return cycle[::-1]
+
 def kahn_topo_sort(adj, n):
+    """邻接表接口：返回 (每一步的状态, 拓扑序)，供 create_animation 使用"""
+    edges = [(u, v) for u in range(n) for v in adj[u]]
     in_deg = [0] * n
-    for u in range(n):
-        for v in adj[u]:
-            in_deg[v] += 1
-    queue = [i for i in range(n) if in_deg[i] == 0]
-    topo = []
-    steps = []  # 记录每一步的状态
-    removed_edges = set()
-    while queue:
-        cur = queue.pop(0)
-        topo.append(cur)
-        steps.append((topo[:], in_deg[:], removed_edges.copy(), queue[:]))
-        for v in adj[cur]:
-            removed_edges.add((cur, v))
-            in_deg[v] -= 1
-            if in_deg[v] == 0:
-                queue.append(v)
-    steps.append((topo[:], in_deg[:], removed_edges.copy(), queue[:]))
+    for _, v in edges:
+        in_deg[v] += 1
+    trace = TopoTrace()
+    topo, _ = topo_sort(n, edges, trace)
+    steps = list(trace.replay(n, in_deg))  # 记录每一步的状态
     return steps, topo
 
 def create_animation():
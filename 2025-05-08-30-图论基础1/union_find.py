@@ -0,0 +1,94 @@
+"""
+并查集（按大小合并 + 非递归路径减半）
+
+parent、size 存在 array('i') 里，百万个点只占几 MB；find 不递归，链再长也不会超出递归深度。
+find_many / union_many 一次处理一批点或边：find_many 用 NumPy 在整批点上同时做路径减半，
+union_many 按给定顺序逐条合并（结果与依次调用 union 相同，Kruskal 依赖这个顺序）。
+"""
+from array import array
+
+import numpy as np
+
+
+class UnionFind:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n  # 连通块个数
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            # 路径减半：x 直接指向祖父，再跳到祖父
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """合并 x、y 所在集合，原本就在同一集合时返回 False"""
+        fx, fy = self.find(x), self.find(y)
+        if fx == fy:
+            return False
+        size = self.size
+        if size[fx] > size[fy]:
+            fx, fy = fy, fx
+        self.parent[fx] = fy
+        size[fy] += size[fx]
+        self.count -= 1
+        return True
+
+    def connected(self, x, y):
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x):
+        """x 所在集合的大小"""
+        return self.size[self.find(x)]
+
+    def find_many(self, xs):
+        """一批点的根，返回 NumPy 数组"""
+        parent = np.frombuffer(self.parent, dtype=np.intc)  # 与 self.parent 共用内存
+        r = np.array(xs, dtype=np.intc)
+        idx = np.arange(len(r))  # 还没走到根的那些位置
+        while len(idx):
+            cur = r[idx]
+            pr = parent[cur]
+            keep = pr != cur
+            idx, cur, pr = idx[keep], cur[keep], pr[keep]
+            # 整批一起做一次路径减半
+            gp = parent[pr]
+            parent[cur] = gp
+            r[idx] = gp
+        return r
+
+    def union_many(self, us, vs):
+        """
+        按顺序合并 (us[i], vs[i])
+
+        返回:
+        布尔数组，第 i 个为 True 表示这条边合并了两个不同的集合
+        """
+        parent, size = self.parent, self.size
+        merged = np.zeros(len(us), dtype=bool)
+        count = self.count
+        for i, (x, y) in enumerate(zip(np.asarray(us).tolist(), np.asarray(vs).tolist())):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] > size[y]:
+                x, y = y, x
+            parent[x] = y
+            size[y] += size[x]
+            count -= 1
+            merged[i] = True
+        self.count = count
+        return merged
+
+    def component_sizes(self):
+        """每个连通块的大小（NumPy 数组，顺序按根的编号）"""
+        roots = self.find_many(np.arange(len(self.parent)))
+        return np.bincount(roots)[np.unique(roots)]
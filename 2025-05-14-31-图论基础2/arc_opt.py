@@ -1,8 +1,11 @@
+import sys
+
 import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib import rcParams
-import copy
+
+from residual_graph import ResidualGraph, bfs_level, blocking_flow
 
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = [
@@ -13,184 +16,208 @@ rcParams['font.sans-serif'] = [
 rcParams['axes.unicode_minus'] = False
 rcParams['font.size'] = 20
 
-# 1. 构建网络
-G = nx.DiGraph()
-
-# 添加节点
-# 前驱节点（来自不同方向）
-prev_nodes = [
-    'prev1', 'prev2', 'prev3', 'prev4',  # 左侧
-    'prev5', 'prev6', 'prev7', 'prev8',  # 左上
-    'prev9', 'prev10', 'prev11', 'prev12'  # 左下
-]
-for node in prev_nodes:
-    G.add_node(node)
-
-# 中心节点
-G.add_node('s')
-
-# 后继节点
-for node in ['a', 'b', 'c', 'd']:
-    G.add_node(node)
-
-# 终点节点
-for i in range(1, 5):
-    G.add_node(f'next{i}')
-
-# 添加边
-# 前驱节点到s的边
-for node in prev_nodes:
-    G.add_edge(node, 's', capacity=0)
-
-# s到后继节点的边
-G.add_edge('s', 'a', capacity=5)
-G.add_edge('s', 'b', capacity=3)
-G.add_edge('s', 'c', capacity=4)
-G.add_edge('s', 'd', capacity=2)
-
-# 后继节点到终点的边
-for i, node in enumerate(['a', 'b', 'c', 'd'], 1):
-    G.add_edge(node, f'next{i}', capacity=0)
-
-# 2. 设置节点位置
-pos = {
-    # 前驱节点（左侧）
-    'prev1': (-1, 1.5), 'prev2': (-1, 0.5), 'prev3': (-1, -0.5), 'prev4': (-1, -1.5),
-    # 前驱节点（左上）
-    'prev5': (-1.5, 2), 'prev6': (-1.5, 1), 'prev7': (-1.5, 0), 'prev8': (-1.5, -1),
-    # 前驱节点（左下）
-    'prev9': (-1.5, -2), 'prev10': (-1.5, -1.5), 'prev11': (-1.5, -0.5), 'prev12': (-1.5, 0.5),
-    # 中心节点
-    's': (0, 0),
-    # 后继节点（中间）
-    'a': (1, 1.5), 'b': (1, 0.5), 'c': (1, -0.5), 'd': (1, -1.5),
-    # 终点节点（右侧）
-    'next1': (2, 1.5), 'next2': (2, 0.5), 'next3': (2, -0.5), 'next4': (2, -1.5)
-}
-
-# 3. 创建图形
-fig, ax = plt.subplots(figsize=(12, 8))
-fig.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
-
-# 4. 动画步骤收集
-steps = []  # (flow, work, current_edge, mode, info)
-
-# 5. 模拟DFS过程
-flow = {('s', 'a'): 0, ('s', 'b'): 0, ('s', 'c'): 0, ('s', 'd'): 0}
-work = {'s': 0}  # 初始化为第一条边
-current_edge = None
-
-# 第一次DFS
-steps.append((copy.deepcopy(flow), dict(work), None, 'start', '开始DFS，work指向第一条边'))
-# 尝试s->a
-current_edge = ('s', 'a')
-steps.append((copy.deepcopy(flow), dict(work), current_edge, 'try', '尝试边 s->a'))
-# 尝试s->b
-work['s'] = 1  # 移动到下一条边
-current_edge = ('s', 'b')
-steps.append((copy.deepcopy(flow), dict(work), current_edge, 'try', '尝试边 s->b'))
-# s->b已满
-flow[('s', 'b')] = G['s']['b']['capacity']
-steps.append((copy.deepcopy(flow), dict(work), current_edge, 'full', '边 s->b 已满，work移动到下一条边'))
-
-# 第二次DFS（从work=2开始）
-work['s'] = 2  # 移动到下一条边
-# 添加回溯动画帧
-steps.append((copy.deepcopy(flow), dict(work), ('prev1', 's'), 'backtrack', '回溯后，再次DFS到s'))
-steps.append((copy.deepcopy(flow), dict(work), None, 'restart', '重新开始DFS，work指向第三条边'))
-# 尝试s->c
-current_edge = ('s', 'c')
-steps.append((copy.deepcopy(flow), dict(work), current_edge, 'try', '尝试边 s->c'))
-# 尝试s->d
-work['s'] = 3  # 移动到下一条边
-current_edge = ('s', 'd')
-steps.append((copy.deepcopy(flow), dict(work), current_edge, 'try', '尝试边 s->d'))
-
-# 6. 动画帧重复策略
-STEP_REPEAT = 2
-display_steps = []
-for s in steps:
-    display_steps.extend([s]*STEP_REPEAT)
-
-def update(step):
-    ax.clear()
-    flow, work, current_edge, mode, info = display_steps[step]
-    
-    # 7. 绘制图形
-    # 7.1 绘制节点
-    # 前驱节点（灰色）
-    nx.draw_networkx_nodes(G, pos, nodelist=prev_nodes,
-                          node_color='lightgray', node_size=600, ax=ax)
-    # 中心节点（白色）
-    nx.draw_networkx_nodes(G, pos, nodelist=['s'],
-                          node_color='whitesmoke', node_size=1000, ax=ax)
-    # 后继节点（白色）
-    nx.draw_networkx_nodes(G, pos, nodelist=['a', 'b', 'c', 'd'],
-                          node_color='whitesmoke', node_size=1000, ax=ax)
-    # 终点节点（灰色）
-    nx.draw_networkx_nodes(G, pos, nodelist=[f'next{i}' for i in range(1, 5)],
-                          node_color='lightgray', node_size=600, ax=ax)
-    
-    # 7.2 绘制节点标签
-    # 前驱和终点节点标签
-    nx.draw_networkx_labels(G, pos,
-                           labels={node: '...' for node in prev_nodes} |
-                                 {f'next{i}': '...' for i in range(1, 5)},
-                           font_size=16, ax=ax)
-    # 主要节点标签
-    nx.draw_networkx_labels(G, pos,
-                           labels={'s': 's', 'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'},
-                           font_size=26, ax=ax)
-    
-    # 7.3 绘制边
-    # 前驱节点到s的边
-    nx.draw_networkx_edges(G, pos,
-                          edgelist=[(node, 's') for node in prev_nodes],
-                          edge_color='lightgray', width=1, arrowsize=15, ax=ax)
-    # s到后继节点的边
-    nx.draw_networkx_edges(G, pos,
-                          edgelist=[('s', node) for node in ['a', 'b', 'c', 'd']],
-                          edge_color='lightgray', width=1, arrowsize=20, ax=ax)
-    # 后继节点到终点的边
-    nx.draw_networkx_edges(G, pos,
-                          edgelist=[(node, f'next{i}') for i, node in enumerate(['a', 'b', 'c', 'd'], 1)],
-                          edge_color='lightgray', width=1, arrowsize=15, ax=ax)
-    
-    # 7.4 显示work值
-    ax.text(pos['s'][0], pos['s'][1]-0.3, f'work={work["s"]}', color='blue', fontsize=20, ha='center', va='top',
-           bbox=dict(facecolor='white', alpha=0.8, edgecolor='blue', boxstyle='round,pad=0.2'))
-    
-    # 7.5 显示边的流量
-    labels = {}
-    for u, v in G.edges:
-        if u == 's' and v in ['a', 'b', 'c', 'd']:
-            f = flow[(u, v)]
-            labels[(u, v)] = f"{f}/{G[u][v]['capacity']}"
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, ax=ax, font_size=16)
-    
-    # 7.6 高亮当前边
-    if current_edge:
-        nx.draw_networkx_edges(G, pos, edgelist=[current_edge], edge_color='r', width=3, ax=ax, arrowsize=20)
-    
-    # 7.7 显示提示信息
-    if mode == 'full':
-        ax.text(0.5, 0.5, '该边已满，下次DFS从work+1开始', transform=ax.transAxes, ha='center', va='center', fontsize=24,
-                bbox=dict(facecolor='white', alpha=0.9, edgecolor='red', boxstyle='round,pad=0.3'), color='red', zorder=10)
-    elif mode == 'restart':
-        ax.text(0.5, 0.5, '重新开始DFS，从work=2开始', transform=ax.transAxes, ha='center', va='center', fontsize=24,
-                bbox=dict(facecolor='white', alpha=0.9, edgecolor='blue', boxstyle='round,pad=0.3'), color='blue', zorder=10)
-    elif mode == 'backtrack':
-        ax.text(0.5, 0.5, '从其他节点回溯到s', transform=ax.transAxes, ha='center', va='center', fontsize=24,
-                bbox=dict(facecolor='white', alpha=0.9, edgecolor='green', boxstyle='round,pad=0.3'), color='green', zorder=10)
-    
-    # 7.8 右下角提示
-    ax.text(0.98, 0.9, info, transform=ax.transAxes, ha='right', va='top', fontsize=18,
-            bbox=dict(facecolor='white', alpha=0.8, edgecolor='gray'))
-    ax.axis('off')
-
-ani = animation.FuncAnimation(fig, update, frames=len(display_steps), interval=800, repeat_delay=2000)
-
-# 保存为GIF
-ani.save('arc_opt.gif', writer='pillow')
-
-print("动画已保存为 arc_opt.gif")
+# >> 网络参数：s 有 FAN_IN 个前驱、FAN_OUT 条出边，超级源点 S 经前驱多次 DFS 到达 s
+FAN_IN = 4
+IN_CAP = 2                # S->前驱、前驱->s 的容量
+OUT_CAPS = [2, 2, 2, 2]   # s->a、s->b ... 的容量，个数即 FAN_OUT
+FAN_OUT_SIZES = [4, 8, 16, 32, 64, 128]  # 扫描次数随扇出增长的对比规模
+
+
+def build_network(fan_in, in_cap, out_caps):
+    """S -> p1..pk -> s -> a,b,... -> n1.. -> T 的网络，返回 (G, 前驱列表, 后继列表, 终点列表)"""
+    # 扇出不超过 18 时用 a、b、c...（到 r 为止，避开 s），否则用 c1、c2...
+    k = len(out_caps)
+    succ = [chr(ord('a') + j) for j in range(k)] if k <= 18 else [f'c{j + 1}' for j in range(k)]
+    prev = [f'p{i + 1}' for i in range(fan_in)]
+    nexts = [f'n{j + 1}' for j in range(len(out_caps))]
+    G = nx.DiGraph()
+    for p in prev:
+        G.add_edge('S', p, capacity=in_cap)
+        G.add_edge(p, 's', capacity=in_cap)
+    for x, nxt_node, c in zip(succ, nexts, out_caps):
+        G.add_edge('s', x, capacity=c)
+        G.add_edge(x, nxt_node, capacity=c)
+        G.add_edge(nxt_node, 'T', capacity=c)
+    return G, prev, succ, nexts
+
+
+def traced_dinic(g, s, t, current_arc, on_event=None):
+    """分层 + 统计扫描边数的 blocking_flow，返回 (最大流, 每个点的扫描边数)"""
+    scans = [0] * g.n
+    max_flow = 0
+    while True:
+        level, _ = bfs_level(g, s)
+        if level[t] < 0:
+            break
+        max_flow += blocking_flow(g, s, t, level, g.head[:], scans=scans, on_event=on_event, current_arc=current_arc)
+    return max_flow, scans
+
+
+def fan_out_benchmark(sizes):
+    """扇出为 k（前驱也为 k，每次到达 s 恰好推满一条出边）时，两种写法在 s 上的扫描边数"""
+    rows = []
+    for k in sizes:
+        G, _, _, _ = build_network(k, IN_CAP, [IN_CAP] * k)
+        row = [k]
+        for current_arc in (True, False):
+            g, nodes, index, _ = ResidualGraph.from_networkx(G)
+            flow, scans = traced_dinic(g, index['S'], index['T'], current_arc)
+            row += [scans[index['s']], sum(scans)]
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    G, prev_nodes, succ_nodes, next_nodes = build_network(FAN_IN, IN_CAP, OUT_CAPS)
+    g, nodes, index, edge_id = ResidualGraph.from_networkx(G)
+    s = index['s']
+    s_arcs = []  # s 的边表顺序，work 即当前弧在其中的下标
+    e = g.head[s]
+    while e != -1:
+        s_arcs.append(e)
+        e = g.nxt[e]
+
+    def work_of(it):
+        return s_arcs.index(it[s]) if it[s] != -1 else len(s_arcs)
+
+    def arc_name(e):
+        return nodes[g.to[e ^ 1]], nodes[g.to[e]]
+
+    # 1. 用当前弧跑一遍真实的 Dinic，记录 s 上发生的每个事件
+    steps = []  # (flow, work, current_edge, mode, info, scans)
+    scans_live = [0] * g.n
+    arrivals = [0]
+
+    def snapshot_flow():
+        return {(u, v): g.cap[edge_id[(u, v)] ^ 1] for u, v in G.out_edges('s')}
+
+    def on_event(kind, u, e, it):
+        if u != s:
+            return
+        if kind == 'arrive':
+            arrivals[0] += 1
+            steps.append((snapshot_flow(), work_of(it), arc_name(e), 'arrive',
+                          f'第{arrivals[0]}次DFS到达s（经{arc_name(e)[0]}），从work={work_of(it)}开始', scans_live[:]))
+        elif kind == 'scan':
+            v = nodes[g.to[e]]
+            if g.cap[e] > 0 and level_now[g.to[e]] == level_now[s] + 1:
+                steps.append((snapshot_flow(), work_of(it), arc_name(e), 'try', f'尝试边 s->{v}，可以前进', scans_live[:]))
+            else:
+                reason = '已满' if g.cap[e] == 0 else '不在下一层'
+                steps.append((snapshot_flow(), work_of(it), arc_name(e), 'full',
+                              f'边 {arc_name(e)[0]}->{v} {reason}，work移动到下一条边', scans_live[:]))
+        elif kind == 'push':
+            steps.append((snapshot_flow(), work_of(it), arc_name(e), 'push', f'沿 s->{nodes[g.to[e]]} 推流', scans_live[:]))
+        elif kind == 'dead':
+            steps.append((snapshot_flow(), work_of(it), None, 'dead', 's 的出边都走不通，退回', scans_live[:]))
+
+    level_now = [0] * g.n
+    max_flow = 0
+    while True:
+        level, _ = bfs_level(g, index['S'])
+        level_now[:] = level
+        if level_now[index['T']] < 0:
+            break
+        max_flow += blocking_flow(g, index['S'], index['T'], level_now, g.head[:], scans=scans_live, on_event=on_event)
+
+    # 2. 同一网络不用当前弧再跑一遍，作为对比
+    g2, _, index2, _ = ResidualGraph.from_networkx(G)
+    flow2, scans_plain = traced_dinic(g2, index2['S'], index2['T'], current_arc=False)
+    assert flow2 == max_flow
+    chart_nodes = ['S'] + prev_nodes + ['s'] + succ_nodes
+
+    # 3. 节点位置：S | 前驱 | s | 后继 | 终点 | T
+    def column(names, x):
+        k = len(names)
+        return {u: (x, (k - 1) / 2 - i) for i, u in enumerate(names)}
+
+    pos = {'S': (-2.5, 0), 's': (0, 0), 'T': (3, 0)}
+    pos |= column(prev_nodes, -1.2) | column(succ_nodes, 1) | column(next_nodes, 2)
+
+    # 4. 创建图形：左边为网络动画，右边为每个点的扫描边数
+    fig, (ax, ax_bar) = plt.subplots(1, 2, figsize=(20, 8), gridspec_kw={'width_ratios': [3, 2]})
+    fig.subplots_adjust(left=0.03, right=0.97, top=0.9, bottom=0.12, wspace=0.15)
+
+    # 5. 动画帧重复策略
+    STEP_REPEAT = 2
+    FINAL_REPEAT = 6
+    display_steps = []
+    for st in steps:
+        display_steps.extend([st] * STEP_REPEAT)
+    display_steps.extend([steps[-1][:3] + ('final', f'最大流 {max_flow}，s 共扫描 {scans_live[s]} 条边',
+                                           scans_live[:])] * FINAL_REPEAT)
+
+    def update(step):
+        ax.clear()
+        ax_bar.clear()
+        flow, work, current_edge, mode, info, scans = display_steps[step]
+
+        # 6. 绘制图形
+        gray_nodes = prev_nodes + next_nodes
+        nx.draw_networkx_nodes(G, pos, nodelist=gray_nodes, node_color='lightgray', node_size=600, ax=ax)
+        nx.draw_networkx_nodes(G, pos, nodelist=['S', 's', 'T'] + succ_nodes,
+                               node_color='whitesmoke', node_size=1000, ax=ax)
+        nx.draw_networkx_labels(G, pos, labels={u: u for u in gray_nodes}, font_size=14, ax=ax)
+        nx.draw_networkx_labels(G, pos, labels={u: u for u in ['S', 's', 'T'] + succ_nodes}, font_size=26, ax=ax)
+        nx.draw_networkx_edges(G, pos, edge_color='lightgray', width=1, arrowsize=15, ax=ax)
+
+        # 6.1 显示work值
+        ax.text(pos['s'][0], pos['s'][1] - 0.3, f'work={work}', color='blue', fontsize=20, ha='center', va='top',
+                bbox=dict(facecolor='white', alpha=0.8, edgecolor='blue', boxstyle='round,pad=0.2'))
+
+        # 6.2 显示 s 出边的流量
+        labels = {(u, v): f"{flow[(u, v)]}/{G[u][v]['capacity']}" for u, v in flow}
+        nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, ax=ax, font_size=16)
+
+        # 6.3 高亮当前边
+        if current_edge and mode != 'final':
+            color = {'arrive': 'g', 'push': 'g', 'full': 'gray'}.get(mode, 'r')
+            nx.draw_networkx_edges(G, pos, edgelist=[current_edge], edge_color=color, width=3, ax=ax, arrowsize=20)
+
+        # 6.4 显示提示信息
+        if mode == 'full':
+            ax.text(0.5, 0.92, '该边走不通，work+1，以后到达s不再扫描它', transform=ax.transAxes, ha='center', va='center',
+                    fontsize=20, bbox=dict(facecolor='white', alpha=0.9, edgecolor='red', boxstyle='round,pad=0.3'),
+                    color='red', zorder=10)
+        elif mode == 'arrive':
+            ax.text(0.5, 0.92, f'再次DFS到s，从work={work}开始', transform=ax.transAxes, ha='center', va='center',
+                    fontsize=20, bbox=dict(facecolor='white', alpha=0.9, edgecolor='green', boxstyle='round,pad=0.3'),
+                    color='green', zorder=10)
+        ax.text(0.98, 0.02, info, transform=ax.transAxes, ha='right', va='bottom', fontsize=18,
+                bbox=dict(facecolor='white', alpha=0.8, edgecolor='gray'))
+        ax.axis('off')
+
+        # 7. 扫描边数：当前弧为动画进行到此的累计值，无当前弧为整次运行的总数
+        xs = range(len(chart_nodes))
+        ax_bar.bar([x - 0.2 for x in xs], [scans[index[u]] for u in chart_nodes], width=0.4,
+                   color='steelblue', label='当前弧')
+        ax_bar.bar([x + 0.2 for x in xs], [scans_plain[index2[u]] for u in chart_nodes], width=0.4,
+                   color='salmon', label='无当前弧（总计）')
+        ax_bar.set_xticks(list(xs))
+        ax_bar.set_xticklabels(chart_nodes, fontsize=14)
+        ax_bar.set_ylim(0, max(scans_plain) + 1)
+        ax_bar.set_title(f"扫描边数  s: {scans[s]} / {scans_plain[index2['s']]}", fontsize=18)
+        ax_bar.legend(fontsize=14)
+
+    ani = animation.FuncAnimation(fig, update, frames=len(display_steps), interval=800, repeat_delay=2000)
+
+    # 保存为GIF
+    ani.save('arc_opt.gif', writer='pillow')
+    print("动画已保存为 arc_opt.gif")
+
+    # 8. 扇出增大时两种写法在 s 上的扫描边数
+    sizes = [int(x) for x in sys.argv[1:]] or FAN_OUT_SIZES
+    rows = fan_out_benchmark(sizes)
+    print(f"{'扇出':>6} {'s扫描(当前弧)':>14} {'s扫描(无)':>10} {'总扫描(当前弧)':>14} {'总扫描(无)':>10}")
+    for k, s_arc, total_arc, s_plain, total_plain in rows:
+        print(f"{k:>6} {s_arc:>14} {s_plain:>10} {total_arc:>14} {total_plain:>10}")
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(sizes, [r[1] for r in rows], 'o-', color='steelblue', label='当前弧')
+    ax.plot(sizes, [r[3] for r in rows], 'o-', color='salmon', label='无当前弧')
+    ax.set_xscale('log', base=2)
+    ax.set_yscale('log')
+    ax.set_xlabel('s 的扇出')
+    ax.set_ylabel('s 扫描的边数')
+    ax.legend()
+    fig.savefig('arc_opt_scans.svg', format='svg', bbox_inches='tight')
+    print("扫描次数对比已保存为 arc_opt_scans.svg")
@@ -0,0 +1,60 @@
+"""
+数组版 Edmonds-Karp 与 networkx.maximum_flow 的对比
+
+同一张随机网络分别交给 residual_graph.edmonds_karp 和 networkx（默认 preflow_push 及 edmonds_karp），
+核对最大流相等并输出用时。用法：python bench_ek.py [最大边数]
+"""
+import random
+import sys
+import time
+
+import networkx as nx
+from networkx.algorithms.flow import edmonds_karp as nx_edmonds_karp
+
+from residual_graph import ResidualGraph, edmonds_karp
+
+
+def random_network(n, m, max_cap=100, seed=0):
+    """n 个点、m 条边的随机有向网络，源点 0，汇点 n-1"""
+    rng = random.Random(seed)
+    edges = {}
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and v != 0 and u != n - 1:
+            edges[(u, v)] = rng.randint(1, max_cap)
+    G = nx.DiGraph()
+    G.add_nodes_from(range(n))
+    G.add_weighted_edges_from(((u, v, c) for (u, v), c in edges.items()), weight='capacity')
+    return G
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(max_edges=100000):
+    sizes = [m for m in (1000, 10000, 100000, 1000000) if m <= max_edges]
+    print(f"{'边数':>8} {'点数':>7} {'最大流':>8} {'数组EK':>9} {'含建图':>9} {'nx默认':>9} {'nx EK':>9}")
+    for m in sizes:
+        n = max(m // 10, 10)
+        G = random_network(n, m)
+        edge_list = list(G.edges(data='capacity'))
+
+        def build():
+            g = ResidualGraph(n)
+            for u, v, c in edge_list:
+                g.add_edge(u, v, c)
+            return g
+
+        g, t_build = timed(build)
+        value, t_ek = timed(edmonds_karp, g, 0, n - 1)
+        nx_value, t_nx = timed(nx.maximum_flow_value, G, 0, n - 1)
+        nx_ek_value, t_nx_ek = timed(nx.maximum_flow_value, G, 0, n - 1, flow_func=nx_edmonds_karp)
+        assert value == nx_value == nx_ek_value, (value, nx_value, nx_ek_value)
+        print(f"{m:>8} {n:>7} {value:>8} {t_ek:>8.3f}s {t_ek + t_build:>8.3f}s {t_nx:>8.3f}s {t_nx_ek:>8.3f}s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,69 @@
+"""
+Hopcroft-Karp 与通用最大流求二分图匹配的对比
+
+随机生成"学生选导师"二分图（每个学生随机申请若干导师），分别用：
+hopcroft_karp、residual_graph.dinic（在 s->学生->导师->t 的单位容量网络上）、networkx.maximum_flow，
+核对匹配数相等并输出用时和加速比。用法：python bench_matching.py [最大学生数]
+"""
+import random
+import sys
+import time
+
+import networkx as nx
+
+from hopcroft_karp import build_adjacency, hopcroft_karp
+from residual_graph import ResidualGraph, dinic
+
+
+def random_bipartite(n_students, n_teachers, choices=5, seed=0):
+    rng = random.Random(seed)
+    edges = set()
+    for u in range(n_students):
+        for v in rng.sample(range(n_teachers), min(choices, n_teachers)):
+            edges.add((u, v))
+    return sorted(edges)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def matching_by_dinic(n_students, n_teachers, edges):
+    # 与 bigraph_flow.py 的 G_flow 相同的建图：s=0，学生 1..n，导师 n+1..n+m，t 最后
+    s, t = 0, n_students + n_teachers + 1
+    g = ResidualGraph(t + 1)
+    for u in range(n_students):
+        g.add_edge(s, 1 + u, 1)
+    for u, v in edges:
+        g.add_edge(1 + u, 1 + n_students + v, 1)
+    for v in range(n_teachers):
+        g.add_edge(1 + n_students + v, t, 1)
+    return dinic(g, s, t)
+
+
+def matching_by_networkx(n_students, n_teachers, edges):
+    G = nx.DiGraph()
+    G.add_edges_from((('s', ('S', u)) for u in range(n_students)), capacity=1)
+    G.add_edges_from(((('S', u), ('T', v)) for u, v in edges), capacity=1)
+    G.add_edges_from(((('T', v), 't') for v in range(n_teachers)), capacity=1)
+    return nx.maximum_flow_value(G, 's', 't')
+
+
+def run(max_students=30000):
+    sizes = [n for n in (1000, 3000, 10000, 30000, 100000) if n <= max_students]
+    print(f"{'学生数':>7} {'边数':>7} {'匹配数':>7} {'HK':>8} {'Dinic':>8} {'nx流':>8} {'HK/Dinic':>9} {'HK/nx':>7}")
+    for n in sizes:
+        edges = random_bipartite(n, n)
+        ptr, adj = build_adjacency(n, edges)
+        (size, _, _), t_hk = timed(hopcroft_karp, n, n, ptr, adj)
+        size_dinic, t_dinic = timed(matching_by_dinic, n, n, edges)
+        size_nx, t_nx = timed(matching_by_networkx, n, n, edges)
+        assert size == size_dinic == size_nx, (size, size_dinic, size_nx)
+        print(f"{n:>7} {len(edges):>7} {size:>7} {t_hk:>7.3f}s {t_dinic:>7.3f}s {t_nx:>7.3f}s "
+              f"{t_dinic / t_hk:>8.1f}x {t_nx / t_hk:>6.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 30000)
@@ -0,0 +1,146 @@
+"""
+三种最大流算法在不同形状网络上的对比
+
+在分层网络、网格网络和随机网络上，规模逐步增大，分别运行
+residual_graph.edmonds_karp、residual_graph.dinic 和 push_relabel.push_relabel，
+核对最大流相等，输出用时、操作次数（EK/Dinic 为增广路条数，HLPP 为推流次数）和峰值内存（tracemalloc，含建图）。
+峰值内存单独再跑一遍测量，不影响计时。某个算法在一类网络上用时超过 budget 秒后，
+这类网络更大的规模就跳过它（EK 在分层、网格网络上增长很快），全都跳过时整行记为 -。用法：python bench_maxflow.py [最大边数] [budget]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from bench_ek import random_network
+from push_relabel import push_relabel
+from residual_graph import ResidualGraph, edmonds_karp, dinic
+
+
+def layered_network(layers, width, degree=3, max_cap=100, seed=0):
+    """源点 -> layers 层、每层 width 个点 -> 汇点，相邻两层间每个点随机连 degree 条边"""
+    rng = random.Random(seed)
+    n = layers * width + 2
+    s, t = 0, n - 1
+    edges = [(s, 1 + i, rng.randint(1, max_cap)) for i in range(width)]
+    for k in range(layers - 1):
+        base = 1 + k * width
+        for i in range(width):
+            for j in rng.sample(range(width), min(degree, width)):
+                edges.append((base + i, base + width + j, rng.randint(1, max_cap)))
+    base = 1 + (layers - 1) * width
+    edges += [(base + i, t, rng.randint(1, max_cap)) for i in range(width)]
+    return n, edges
+
+
+def grid_network(rows, cols, max_cap=100, seed=0):
+    """rows x cols 网格，相邻格子双向连边；源点连最左一列，最右一列连汇点"""
+    rng = random.Random(seed)
+    n = rows * cols + 2
+    s, t = 0, n - 1
+    edges = []
+    for r in range(rows):
+        for c in range(cols):
+            u = 1 + r * cols + c
+            if c + 1 < cols:
+                edges.append((u, u + 1, rng.randint(1, max_cap)))
+                edges.append((u + 1, u, rng.randint(1, max_cap)))
+            if r + 1 < rows:
+                edges.append((u, u + cols, rng.randint(1, max_cap)))
+                edges.append((u + cols, u, rng.randint(1, max_cap)))
+        edges.append((s, 1 + r * cols, max_cap))
+        edges.append((1 + r * cols + cols - 1, t, max_cap))
+    return n, edges
+
+
+def random_edges(m, seed=0):
+    """bench_ek.random_network 的边表形式，点数为 m / 10"""
+    n = max(m // 10, 10)
+    G = random_network(n, m, seed=seed)
+    return n, list(G.edges(data='capacity'))
+
+
+def build(n, edges):
+    g = ResidualGraph(n)
+    for u, v, c in edges:
+        g.add_edge(u, v, c)
+    return g
+
+
+def solve_ek(n, edges):
+    g = build(n, edges)
+    paths = [0]
+
+    def on_path(path, pushed):
+        paths[0] += 1
+
+    return edmonds_karp(g, 0, n - 1, on_path), paths[0]
+
+
+def solve_dinic(n, edges):
+    g = build(n, edges)
+    paths = [0]
+
+    def on_path(path, pushed):
+        paths[0] += 1
+
+    return dinic(g, 0, n - 1, on_path=on_path), paths[0]
+
+
+def solve_push_relabel(n, edges):
+    g = build(n, edges)
+    stats = {}
+    return push_relabel(g, 0, n - 1, stats), stats['pushes']
+
+
+SOLVERS = [('EK', solve_ek), ('Dinic', solve_dinic), ('HLPP', solve_push_relabel)]
+
+
+def measure(solver, n, edges):
+    """返回 (最大流, 操作次数, 用时秒数, 峰值内存 MB)"""
+    start = time.perf_counter()
+    value, ops = solver(n, edges)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    solver(n, edges)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return value, ops, elapsed, peak / 2 ** 20
+
+
+def workloads(max_edges):
+    for m in (1000, 10000, 100000, 1000000):
+        if m > max_edges:
+            break
+        width = max(int((m / 3) ** 0.5), 2)
+        yield '分层', layered_network(max(m // (3 * width), 2), width)
+        side = max(int((m / 4) ** 0.5), 2)
+        yield '网格', grid_network(side, side)
+        yield '随机', random_edges(m)
+
+
+def run(max_edges=100000, budget=1.0):
+    header = f"{'网络':<4} {'点数':>7} {'边数':>8} {'最大流':>8}"
+    for name, _ in SOLVERS:
+        header += f" | {name + '用时':>10} {'次数':>8} {'内存':>8}"
+    print(header)
+    too_slow = set()
+    for kind, (n, edges) in workloads(max_edges):
+        line = ''
+        values = []
+        for name, solver in SOLVERS:
+            if (kind, name) in too_slow:
+                line += f" | {'-':>10} {'-':>8} {'-':>8}"
+                continue
+            value, ops, elapsed, peak = measure(solver, n, edges)
+            values.append(value)
+            line += f" | {elapsed:>9.3f}s {ops:>8} {peak:>6.1f}MB"
+            if elapsed > budget:
+                too_slow.add((kind, name))
+        assert len(set(values)) <= 1, (kind, n, values)
+        print(f"{kind:<4} {n:>7} {len(edges):>8} {values[0] if values else '-':>8}" + line)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 1.0)
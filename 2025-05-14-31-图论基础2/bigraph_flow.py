@@ -2,7 +2,7 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib import rcParams
-import copy
+from hopcroft_karp import max_matching
 
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = [
@@ -140,4 +140,40 @@ ani = animation.FuncAnimation(fig, update, frames=len(display_steps), interval=1
 # 11. 保存为GIF
 ani.save('bigraph_flow.gif', writer='pillow')
 
-print("动画已保存为 bigraph_flow.gif")
\ No newline at end of file
+print("动画已保存为 bigraph_flow.gif")
+
+# 12. 用Hopcroft-Karp在同一张二分图上求最大匹配，画出每条增广交错路径（"二分图-交错路径"风格）
+# 从一个非最大的初始匹配出发，才能看到长度大于1的交错路径
+init_matching = {'S2': 'T2', 'S3': 'T1', 'S4': 'T4'}
+aug_paths = []
+matching = max_matching(students, teachers, edges, aug_paths.append, init_matching)
+
+def draw_matching_state(ax, matched, path, title):
+    # 绿色实线为匹配边，其他边非匹配（灰色）；增广交错路径上的非匹配边画红色虚线
+    nx.draw_networkx_nodes(G, flow_pos, nodelist=students, node_color='lightblue', node_size=1000, ax=ax)
+    nx.draw_networkx_nodes(G, flow_pos, nodelist=teachers, node_color='lightgreen', node_size=1000, ax=ax)
+    nx.draw_networkx_labels(G, {k: flow_pos[k] for k in students + teachers}, font_size=20, ax=ax)
+    matched_edges = [(u, v) for u, v in matched.items()]
+    path_edges = [(path[i], path[i+1]) for i in range(len(path) - 1)]
+    others = [(u, v) for u, v in edges if (u, v) not in matched_edges]
+    nx.draw_networkx_edges(G, flow_pos, edgelist=others, edge_color='lightgray', width=2, ax=ax)
+    nx.draw_networkx_edges(G, flow_pos, edgelist=matched_edges, edge_color='green', width=4, ax=ax)
+    free_on_path = [(u, v) for u, v in path_edges if matched.get(u) != v and matched.get(v) != u]
+    nx.draw_networkx_edges(G, flow_pos, edgelist=free_on_path, edge_color='red', width=4, style='dashed', ax=ax)
+    ax.set_title(title, fontsize=20)
+    ax.set_xlim(-0.5, 2.5)
+    ax.set_ylim(-0.5, 3.5)
+    ax.axis('off')
+
+fig2, axes = plt.subplots(1, len(aug_paths) + 1, figsize=(6 * (len(aug_paths) + 1), 6))
+axes = list(axes) if len(aug_paths) else [axes]
+matched = dict(init_matching)
+for k, path in enumerate(aug_paths):
+    draw_matching_state(axes[k], matched, path, f'交错路径: {"-".join(path)}')
+    # 沿路径"异或"：(path[0], path[1]), (path[2], path[3]), ... 成为新的匹配边
+    for i in range(0, len(path), 2):
+        matched[path[i]] = path[i+1]
+draw_matching_state(axes[-1], matching, [], f'最大匹配数: {len(matching)}')
+fig2.savefig('bigraph_alternating.svg', format='svg', bbox_inches='tight')
+
+print(f"最大匹配: {matching}，交错路径图已保存为 bigraph_alternating.svg")
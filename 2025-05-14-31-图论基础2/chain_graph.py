@@ -0,0 +1,103 @@
+"""
+链式前向星存图（对应博客 2021-03-31-chain-graph-template 里的 C++ 模板）
+
+每条边成对存放：第 e 条边的反向边是 e ^ 1，偶数编号是加边时给出的方向。
+head[u] 是 u 的第一条出边，nxt[e] 是同起点的下一条边，to[e] 是终点，cap[e] 是剩余容量，weight[e] 是边权（费用）。
+- 有向图（默认）：反向边容量为 0、边权为 -w，即网络流里的残量边；遍历有向图时只看偶数编号的边
+- 无向图：反向边与正向边容量、边权相同
+五个数组都是 Python list：在 CPython 里按下标读写 list 比 array('i') / numpy 标量更快。
+网络流直接在这几个数组上跑。这里只保留网络流用到的部分，转成 CSR 的 to_csr() / edge_array() 见图论基础1 的 chain_graph.py。
+"""
+
+
+class ChainGraph:
+    def __init__(self, n, undirected=False):
+        self.n = n
+        self.undirected = undirected
+        self.head = [-1] * n
+        self.nxt = []
+        self.to = []
+        self.cap = []
+        self.weight = []
+
+    def add_edge(self, u, v, c=0, w=0):
+        """加一条 u->v 容量 c、边权 w 的边及其反向边，O(1)，返回正向边编号"""
+        e = len(self.to)
+        self.to.append(v)
+        self.cap.append(c)
+        self.weight.append(w)
+        self.nxt.append(self.head[u])
+        self.head[u] = e
+        self.to.append(u)
+        if self.undirected:
+            self.cap.append(c)
+            self.weight.append(w)
+        else:
+            self.cap.append(0)
+            self.weight.append(-w)
+        self.nxt.append(self.head[v])
+        self.head[v] = e + 1
+        return e
+
+    @property
+    def m(self):
+        """加过的边数（不含反向边）"""
+        return len(self.to) // 2
+
+    def edge_flow(self, e):
+        """有向图中正向边 e 上当前的流量（即反向边的剩余容量）"""
+        return self.cap[e ^ 1]
+
+    def endpoints(self, e):
+        """边 e 的 (起点, 终点)"""
+        return self.to[e ^ 1], self.to[e]
+
+    def arcs(self, u):
+        """依次产生 u 的出边编号（有向图里包括反向边）"""
+        e = self.head[u]
+        while e != -1:
+            yield e
+            e = self.nxt[e]
+
+    @classmethod
+    def from_networkx(cls, G, capacity='capacity', weight='weight'):
+        """
+        由 networkx 图构造，G 为 nx.Graph 时得到无向图；缺少的容量、边权属性按 0 处理
+
+        返回:
+        (g, nodes, index, edge_id)：nodes[i] 是编号 i 的原节点名，index 是其逆映射，
+        edge_id[(u, v)] 是原图边 (u, v) 对应的正向边编号
+        """
+        nodes = list(G.nodes)
+        index = {u: i for i, u in enumerate(nodes)}
+        g = cls(len(nodes), undirected=not G.is_directed())
+        edge_id = {}
+        for u, v, data in G.edges(data=True):
+            edge_id[(u, v)] = g.add_edge(index[u], index[v], data.get(capacity, 0), data.get(weight, 0))
+        if G.is_directed():
+            # 头插法会把每个点的边表倒过来，这里按 G.successors 再 G.predecessors 的顺序重新串起来，
+            # 这样搜索顺序和直接遍历 networkx 图时一致，动画里的增广路也就和原来一样
+            for u in nodes:
+                arcs = [edge_id[(u, v)] for v in G.successors(u)] + [edge_id[(v, u)] ^ 1 for v in G.predecessors(u)]
+                g.head[index[u]] = arcs[0] if arcs else -1
+                for a, b in zip(arcs, arcs[1:] + [-1]):
+                    g.nxt[a] = b
+        return g, nodes, index, edge_id
+
+    def to_networkx(self, nodes=None):
+        """
+        转回 networkx 图，边属性为 capacity（原容量）、weight，有向图另带 flow
+        nodes 为可选的节点名列表，默认用编号
+        """
+        import networkx as nx
+        name = nodes if nodes is not None else range(self.n)
+        G = nx.Graph() if self.undirected else nx.DiGraph()
+        G.add_nodes_from(name[i] for i in range(self.n))
+        to, cap, weight = self.to, self.cap, self.weight
+        for e in range(0, len(to), 2):
+            u, v = name[to[e ^ 1]], name[to[e]]
+            if self.undirected:
+                G.add_edge(u, v, capacity=cap[e], weight=weight[e])
+            else:
+                G.add_edge(u, v, capacity=cap[e] + cap[e ^ 1], weight=weight[e], flow=cap[e ^ 1])
+        return G
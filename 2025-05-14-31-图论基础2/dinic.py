@@ -8,8 +8,8 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib import rcParams
-import copy
-from collections import deque, defaultdict
+from step_log import StepLog
+from residual_graph import ResidualGraph, dinic, min_cut
 
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = [
@@ -44,95 +44,70 @@ pos = {
 fig, ax = plt.subplots(figsize=(10, 5))
 fig.subplots_adjust(left=0, right=0.98, top=0.98, bottom=0.08)
 
-# 动画步骤收集
-steps = []  # (flow, 层次, 当前BFS层, 当前增广路径, 当前推流, 当前最大流, 步骤类型, 其它说明, 分层图边集, 残量反向边集)
+# 动画步骤收集：流量只记增量，其它画面信息按步存入 log.meta
+log = StepLog()
 
-# Dinic主流程
-flow = defaultdict(lambda: defaultdict(int))
+# Dinic主流程：在数组版残量网络上跑非递归的当前弧 Dinic，通过回调记录动画帧
+g, nodes, index, edge_id = ResidualGraph.from_networkx(G)
 max_flow = 0
-step_id = 0
-while True:
+phase = {}  # 当前分层图的信息，推流回调画帧时使用
+
+def arc_name(e):
+    return nodes[g.to[e ^ 1]], nodes[g.to[e]]
+
+def layered_arcs(level_arr, parity, max_level):
+    # 分层图中仍有剩余容量的弧：parity=0 为原图边，parity=1 为反向边
+    to, cap = g.to, g.cap
+    arcs = set()
+    for e in range(parity, len(to), 2):
+        lu, lv = level_arr[to[e ^ 1]], level_arr[to[e]]
+        if cap[e] > 0 and 0 <= lu and lv == lu + 1 and lv <= max_level:
+            arcs.add(arc_name(e))
+    return arcs
+
+def on_level(level_arr, pre):
     # 2. 分层BFS动画
-    level = { 's': 0 }
-    q = deque(['s'])
-    bfs_layers = [['s']]
-    bfs_edges = []
-    visited = set(['s'])
-    while q:
-        cur_layer = []
-        for _ in range(len(q)):
-            u = q.popleft()
-            for v in G.successors(u):
-                if v not in visited and G[u][v]['capacity'] - flow[u][v] > 0:
-                    level[v] = level[u] + 1
-                    q.append(v)
-                    cur_layer.append(v)
-                    bfs_edges.append((u, v))
-                    visited.add(v)
-        if cur_layer:
-            bfs_layers.append(cur_layer)
+    level = {nodes[i]: l for i, l in enumerate(level_arr) if l >= 0}
+    bfs_edges = [arc_name(pre[v]) for v in range(g.n) if pre[v] != -1]
     # 记录分层BFS每一层动画帧
-    for i, layer_nodes in enumerate(bfs_layers):
+    for i in range(max(level.values()) + 1):
         # 只高亮到当前层的节点和边
-        highlight_nodes = set()
-        highlight_edges = set()
-        for j in range(i+1):
-            highlight_nodes.update(bfs_layers[j])
-        for u, v in bfs_edges:
-            if u in highlight_nodes and v in highlight_nodes and level[v] == level[u] + 1:
-                highlight_edges.add((u, v))
+        highlight_edges = {(u, v) for u, v in bfs_edges if level[v] <= i}
         # 残量反向边（可用）
-        reverse_edges = set()
-        for u in highlight_nodes:
-            for v in G.predecessors(u):
-                if v in highlight_nodes and flow[u][v] > 0:
-                    reverse_edges.add((u, v))
-        steps.append((copy.deepcopy(flow), dict(level), i, [], 0, max_flow, 'bfs_layer', f'分层BFS第{i}层', highlight_edges, reverse_edges))
-    if 't' not in level:
-        break
+        reverse_edges = layered_arcs(level_arr, 1, i)
+        log.commit(level=level, bfs_layer=i, aug_path=[], pushed=0, cur_flow=max_flow, mode='bfs_layer',
+                   info=f'分层BFS第{i}层', layer_edges=highlight_edges, reverse_edges=reverse_edges)
     # 3. 只保留分层图，推流动画
-    # 构建分层图
-    layer_edges = set()
-    for u, v in G.edges:
-        if u in level and v in level and level[v] == level[u] + 1 and G[u][v]['capacity'] - flow[u][v] > 0:
-            layer_edges.add((u, v))
-    # 残量反向边
-    reverse_edges = set()
-    for u, v in G.edges:
-        if v in level and u in level and level[u] == level[v] + 1 and flow[v][u] > 0:
-            reverse_edges.add((v, u))
-    # 多次DFS增广
-    def dfs(u, up, path, used_edges):
-        if u == 't':
-            return up, path
-        for v in G.successors(u):
-            if (u, v) in layer_edges and (u, v) not in used_edges and G[u][v]['capacity'] - flow[u][v] > 0:
-                pushed, ppath = dfs(v, min(up, G[u][v]['capacity'] - flow[u][v]), path + [(u, v)], used_edges)
-                if pushed > 0:
-                    return pushed, ppath
-        return 0, []
-    used_edges = set()
-    while True:
-        pushed, aug_path = dfs('s', float('inf'), [], used_edges)
-        if pushed == 0:
-            break
-        # 增广路径动画（红色逐步点亮）
-        for i in range(len(aug_path)):
-            sub_path = aug_path[:i+1]
-            steps.append((copy.deepcopy(flow), dict(level), None, list(sub_path), min(G[u][v]['capacity'] - flow[u][v] for u, v in sub_path), max_flow, 'augmenting', f'分层图内增广', layer_edges, reverse_edges))
-        # 推流动画（整条路径变绿，推流）
-        min_push = min(G[u][v]['capacity'] - flow[u][v] for u, v in aug_path)
-        for u, v in aug_path:
-            flow[u][v] += min_push
-        max_flow += min_push
-        steps.append((copy.deepcopy(flow), dict(level), None, list(aug_path), min_push, max_flow, 'flow_update', f'推流', layer_edges, reverse_edges))
-        # 推满的边加入used_edges
-        for u, v in aug_path:
-            if flow[u][v] == G[u][v]['capacity']:
-                used_edges.add((u, v))
-    step_id += 1
+    phase['level'] = level
+    phase['layer_edges'] = layered_arcs(level_arr, 0, g.n)
+    phase['reverse_edges'] = layered_arcs(level_arr, 1, g.n)
+
+def on_path(path, pushed):
+    global max_flow
+    level, layer_edges, reverse_edges = phase['level'], phase['layer_edges'], phase['reverse_edges']
+    aug_path = [arc_name(e) for e in path]
+    # 增广路径动画（红色逐步点亮），同一条路径的各帧共享 aug_path，只记录点亮的长度
+    cur_pushed = float('inf')
+    for i, e in enumerate(path):
+        cur_pushed = min(cur_pushed, g.cap[e] + pushed)  # 推流前的剩余容量
+        log.commit(level=level, bfs_layer=None, aug_path=aug_path, path_len=i+1, pushed=cur_pushed, cur_flow=max_flow,
+                   mode='augmenting', info='分层图内增广', layer_edges=layer_edges, reverse_edges=reverse_edges)
+    # 推流动画（整条路径变绿，推流）；流量按原图边记录，走反向边相当于退回对应正向边的流量
+    for e in path:
+        if e & 1:
+            log.set(arc_name(e ^ 1), g.cap[e])
+        else:
+            log.set(arc_name(e), g.cap[e ^ 1])
+    max_flow += pushed
+    log.commit(level=level, bfs_layer=None, aug_path=aug_path, pushed=pushed, cur_flow=max_flow,
+               mode='flow_update', info='推流', layer_edges=layer_edges, reverse_edges=reverse_edges)
+
+dinic(g, index['s'], index['t'], on_level, on_path)
+# 最终的残量网络直接给出最小割，并核对割的容量等于最大流
+side, cut_arcs, cut_capacity = min_cut(g, index['s'], max_flow)
 # 终止帧
-steps.append((copy.deepcopy(flow), {}, None, [], 0, max_flow, 'final', '已达到最大流！', set(), set()))
+log.commit(level={}, bfs_layer=None, aug_path=[], pushed=0, cur_flow=max_flow, mode='final',
+           info='已达到最大流！', layer_edges=set(), reverse_edges=set())
 
 # 动画帧重复策略
 STEP_REPEAT_BFS = 2
@@ -141,27 +116,39 @@ STEP_REPEAT_UPDATE = 2
 STEP_REPEAT_FINAL = 8
 STEP_REPEAT_LAYER_END = 4 
 
+# display_steps 只保存 (步号, 显示模式)，画面内容在 update 中从 log 重建
 display_steps = []
-for idx, s in enumerate(steps):
-    if s[6] == 'bfs_layer':
-        display_steps.extend([s]*STEP_REPEAT_BFS)
-    elif s[6] == 'augmenting':
-        display_steps.extend([s]*STEP_REPEAT_AUG)
-    elif s[6] == 'flow_update':
-        display_steps.extend([s]*STEP_REPEAT_UPDATE)
+for idx in range(len(log)):
+    mode = log.meta[idx]['mode']
+    if mode == 'bfs_layer':
+        display_steps.extend([(idx, mode)]*STEP_REPEAT_BFS)
+    elif mode == 'augmenting':
+        display_steps.extend([(idx, mode)]*STEP_REPEAT_AUG)
+    elif mode == 'flow_update':
+        display_steps.extend([(idx, mode)]*STEP_REPEAT_UPDATE)
         # 检查下一个step是否不是augmenting/flow_update，且不是final，说明本分层图已无增广路
-        if idx+1 < len(steps) and steps[idx+1][6] not in ['augmenting', 'flow_update']:
+        if idx+1 < len(log) and log.meta[idx+1]['mode'] not in ['augmenting', 'flow_update']:
             # 插入特殊帧
-            layer_end_step = list(s)
-            layer_end_step[6] = 'layer_end'  # 特殊标记
-            display_steps.extend([tuple(layer_end_step)]*STEP_REPEAT_LAYER_END)
-    elif s[6] == 'final':
-        display_steps.extend([s]*STEP_REPEAT_FINAL)
+            display_steps.extend([(idx, 'layer_end')]*STEP_REPEAT_LAYER_END)
+    elif mode == 'final':
+        display_steps.extend([(idx, mode)]*STEP_REPEAT_FINAL)
+
+# 每一帧之前出现过的 flow_update 帧数（原来在 update 里每帧从头数一遍）
+flow_updates_before = []
+count = 0
+for idx, mode in display_steps:
+    flow_updates_before.append(count)
+    if mode == 'flow_update':
+        count += 1
 
 def update(step):
     ax.clear()
-    flow, level, bfs_layer, aug_path, pushed, cur_flow, mode, info, layer_edges, reverse_edges = display_steps[step]
-    step_num = sum(1 for i in range(step) if display_steps[i][6] == 'flow_update')
+    idx, mode = display_steps[step]
+    flow, meta = log.frame(idx)
+    level, bfs_layer = meta['level'], meta['bfs_layer']
+    aug_path = meta['aug_path'][:meta.get('path_len', len(meta['aug_path']))]
+    pushed, cur_flow, layer_edges, reverse_edges = meta['pushed'], meta['cur_flow'], meta['layer_edges'], meta['reverse_edges']
+    step_num = flow_updates_before[step]
     if mode == 'flow_update':
         step_num += 1
     # 画原图淡化
@@ -175,7 +162,7 @@ def update(step):
         # 显示分层边
         for u, v in G.edges:
             if u in level and v in level and level[v] == level[u] + 1:
-                if flow[u][v] == G[u][v]['capacity']:
+                if flow.get((u, v), 0) == G[u][v]['capacity']:
                     # 流满的边显示为灰色实线
                     nx.draw_networkx_edges(G, pos, edgelist=[(u, v)], edge_color='gray', width=2, ax=ax, arrowsize=20)
                 elif (u, v) in layer_edges:
@@ -185,14 +172,14 @@ def update(step):
         labels = {}
         for u, v in G.edges:
             if u in level and v in level and level[v] == level[u] + 1:
-                f = flow[u][v] if v in flow[u] else 0
+                f = flow.get((u, v), 0)
                 labels[(u, v)] = f"{f}/{G[u][v]['capacity']}"
         nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, ax=ax, font_size=18)
     else:
         nx.draw_networkx_nodes(G, pos, ax=ax, node_color='whitesmoke', node_size=800)
         nx.draw_networkx_labels(G, pos, ax=ax, font_size=26)
-        full_edges = [(u, v) for (u, v) in layer_edges if flow[u][v] == G[u][v]['capacity']]
-        remain_edges = [(u, v) for (u, v) in layer_edges if flow[u][v] < G[u][v]['capacity']]
+        full_edges = [(u, v) for (u, v) in layer_edges if flow.get((u, v), 0) == G[u][v]['capacity']]
+        remain_edges = [(u, v) for (u, v) in layer_edges if flow.get((u, v), 0) < G[u][v]['capacity']]
         if full_edges:
             nx.draw_networkx_edges(G, pos, edgelist=full_edges, edge_color='gray', width=3, ax=ax, arrowsize=20, style='dashed')
         if remain_edges:
@@ -215,7 +202,7 @@ def update(step):
         # 增广推流阶段的标签
         drawn = set()
         for u, v in layer_edges:
-            f = flow[u][v] if v in flow[u] else 0
+            f = flow.get((u, v), 0)
             label = f"{f}/{G[u][v]['capacity']}"
             x = (pos[u][0] + pos[v][0]) / 2
             y = (pos[u][1] + pos[v][1]) / 2
@@ -255,3 +242,4 @@ ani = animation.FuncAnimation(fig, update, frames=len(display_steps), interval=5
 ani.save('dinic.gif', writer='pillow')
 
 print("动画已保存为 dinic.gif")
+print(f"最大流 = 最小割容量 = {cut_capacity}，割边: {[arc_name(e) for e in cut_arcs]}")
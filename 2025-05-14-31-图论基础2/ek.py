@@ -10,7 +10,6 @@ import matplotlib.animation as animation
 import numpy as np
 from matplotlib import rcParams
 import matplotlib.font_manager as fm
-import copy
 
 # 设置matplotlib支持中文和大字号
 rcParams['font.sans-serif'] = [
@@ -41,72 +40,39 @@ G.add_edge('4', '3', capacity=2)
 G.add_edge('3', 't', capacity=8)
 G.add_edge('4', 't', capacity=10)
 
-# Edmonds-Karp算法实现，记录每一步
-from collections import deque, defaultdict
-
-steps = []  # 每一步的流量和路径
-
-# 初始化流量为0
-def edmonds_karp(G, source, sink):
-    flow = defaultdict(lambda: defaultdict(int))
-    max_flow = 0
-    while True:
-        # BFS找增广路
-        parent = {source: None}
-        q = deque([source])
-        while q:
-            u = q.popleft()
-            for v in G.successors(u):
-                cap = G[u][v]['capacity'] - flow[u][v]
-                if cap > 0 and v not in parent:
-                    parent[v] = u
-                    q.append(v)
-            for v in G.predecessors(u):
-                if flow[v][u] > 0 and v not in parent:
-                    parent[v] = u
-                    q.append(v)
-        if sink not in parent:
-            break
-        # 反向推路径
-        path = []
-        v = sink
-        bottleneck = float('inf')
-        while v != source:
-            u = parent[v]
-            if G.has_edge(u, v):
-                cap = G[u][v]['capacity'] - flow[u][v]
-                bottleneck = min(bottleneck, cap)
-            else:
-                bottleneck = min(bottleneck, flow[v][u])
-            path.append((u, v))
-            v = u
-        path = path[::-1]
-        # 拆分为多帧：每一帧高亮从源点到当前节点的子路径，并实时显示瓶颈流量
+# Edmonds-Karp算法实现：在数组版残量网络上运行，传入 log 时记录每一步
+from residual_graph import ResidualGraph, edmonds_karp as ek_on_residual, min_cut
+from step_log import StepLog
+
+def edmonds_karp(G, source, sink, log=None):
+    """返回 (最大流, 最小割)，最小割为 (S 侧节点集合, 割边列表, 割容量)，由最终的残量网络直接得到"""
+    g, nodes, index, edge_id = ResidualGraph.from_networkx(G)
+    total = 0
+
+    def on_path(path, bottleneck):
+        nonlocal total
+        named = [(nodes[g.to[e ^ 1]], nodes[g.to[e]]) for e in path]
+        # 拆分为多帧：每一帧高亮从源点到当前节点的子路径，并实时显示瓶颈流量（推流前的剩余容量）
         cur_bottleneck = float('inf')
-        for i in range(len(path)):
-            sub_path = path[:i+1]
-            cur_bottleneck = float('inf')
-            for u, v in sub_path:
-                if G.has_edge(u, v):
-                    cap = G[u][v]['capacity'] - flow[u][v]
-                    cur_bottleneck = min(cur_bottleneck, cap)
-                else:
-                    cur_bottleneck = min(cur_bottleneck, flow[v][u])
-            steps.append((copy.deepcopy(flow), list(sub_path), cur_bottleneck, max_flow, 'augment_path_step'))
-        # 最后一帧：整条路径高亮，执行流量更新
-        v = sink
-        while v != source:
-            u = parent[v]
-            if G.has_edge(u, v):
-                flow[u][v] += bottleneck
+        for i, e in enumerate(path):
+            cur_bottleneck = min(cur_bottleneck, g.cap[e] + bottleneck)
+            log.commit(path=named, path_len=i+1, bottleneck=cur_bottleneck, cur_flow=total, mode='augment_path_step')
+        # 最后一帧：整条路径高亮，执行流量更新（流量按原图边记录，反向边的推流记在对应的正向边上）
+        for e, (u, v) in zip(path, named):
+            if e & 1:
+                log.set((v, u), g.cap[e])
             else:
-                flow[v][u] -= bottleneck
-            v = u
-        max_flow += bottleneck
-        steps.append((copy.deepcopy(flow), list(path), bottleneck, max_flow, 'flow_update'))
-    return max_flow
+                log.set((u, v), g.cap[e ^ 1])
+        total += bottleneck
+        log.commit(path=named, bottleneck=bottleneck, cur_flow=total, mode='flow_update')
 
-max_flow = edmonds_karp(G, 's', 't')
+    max_flow = ek_on_residual(g, index[source], index[sink], on_path if log is not None else None)
+    side, cut_edges, capacity = min_cut(g, index[source], max_flow)
+    s_side = {nodes[i] for i, x in enumerate(side) if x}
+    return max_flow, (s_side, [(nodes[g.to[e ^ 1]], nodes[g.to[e]]) for e in cut_edges], capacity)
+
+log = StepLog()  # 每一步的流量和路径
+max_flow, (s_side, cut_edges, cut_capacity) = edmonds_karp(G, 's', 't', log)
 
 # 动画绘制
 pos = {
@@ -129,33 +95,42 @@ STEP_REPEAT_UPDATE = 2
 STEP_REPEAT_SEARCH = 1
 FINAL_REPEAT = 8  # 700ms*8约等于5.6秒
 
-display_steps = []
+display_steps = []  # (步号, 显示模式)
 last_flow_update_idx = -1
-for idx, s in enumerate(steps):
-    if s[4] == 'flow_update':
-        display_steps.extend([s]*STEP_REPEAT_UPDATE)
-        last_flow_update_idx = len(display_steps) - STEP_REPEAT_UPDATE  # 记录最后一次flow_update在display_steps中的起始索引
+for idx in range(len(log)):
+    mode = log.meta[idx]['mode']
+    if mode == 'flow_update':
+        display_steps.extend([(idx, mode)]*STEP_REPEAT_UPDATE)
+        last_flow_update_idx = idx  # 记录最后一次flow_update的步号
     else:
-        display_steps.extend([s]*STEP_REPEAT_SEARCH)
+        display_steps.extend([(idx, mode)]*STEP_REPEAT_SEARCH)
 # 追加"已达到最大流"帧
 if last_flow_update_idx != -1:
-    final_step = list(display_steps[last_flow_update_idx])
-    final_step[4] = 'final_maxflow'  # 标记为最大流帧
-    display_steps.extend([tuple(final_step)]*FINAL_REPEAT)
+    display_steps.extend([(last_flow_update_idx, 'final_maxflow')]*FINAL_REPEAT)
+
+# 每一帧之前出现过的 flow_update 帧数
+flow_updates_before = []
+count = 0
+for idx, mode in display_steps:
+    flow_updates_before.append(count)
+    if mode == 'flow_update':
+        count += 1
 
 # 动画帧绘制函数
 def update(step):
     ax.clear()
-    flow, path, bottleneck, cur_flow, mode = display_steps[step]
+    idx, mode = display_steps[step]
+    flow, meta = log.frame(idx)
+    path = meta['path'][:meta.get('path_len', len(meta['path']))]
+    bottleneck, cur_flow = meta['bottleneck'], meta['cur_flow']
     # step编号只在flow_update帧递增，其它帧step显示为即将推流的step编号
-    step_num = sum(1 for i in range(step) if display_steps[i][4] == 'flow_update')
-    step_num //= STEP_REPEAT_UPDATE
+    step_num = flow_updates_before[step] // STEP_REPEAT_UPDATE
     if mode == 'flow_update':
         step_num += 1
     nx.draw(G, pos, ax=ax, with_labels=True, node_color='lightblue', node_size=800, arrowsize=20, font_size=26)
     labels = {}
     for u, v in G.edges:
-        f = flow[u][v] if v in flow[u] else 0
+        f = flow.get((u, v), 0)
         labels[(u, v)] = f"{f}/{G[u][v]['capacity']}"
     nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, ax=ax, font_size=26)
     edgelist = [(u, v) for u, v in path if G.has_edge(u, v)]
@@ -203,6 +178,23 @@ ani.save('ek.gif', writer='pillow')
 
 print(f"最大流: {max_flow}, 动画已保存为 ek.gif")
 
+# 最小割：S 侧与 T 侧节点分色，割边加粗标红，边标签为"容量,流量"（同 最小割.svg）
+fig, ax = plt.subplots(figsize=(10, 5))
+fig.subplots_adjust(left=0, right=0.98, top=0.98, bottom=0.08)
+final_flow = log.state(len(log) - 1) if len(log) else {}
+node_colors = ['lightblue' if u in s_side else 'lightgreen' for u in G.nodes]
+nx.draw(G, pos, ax=ax, with_labels=True, node_color=node_colors, node_size=800, arrowsize=20, font_size=26)
+labels = {(u, v): f"{G[u][v]['capacity']},{final_flow.get((u, v), 0)}" for u, v in G.edges}
+nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, ax=ax, font_size=26)
+nx.draw_networkx_edges(G, pos, edgelist=cut_edges, edge_color='r', width=4, ax=ax, arrowsize=20)
+s_names = '{' + ', '.join(u for u in G.nodes if u in s_side) + '}'
+ax.text(0.95, 0.02, f"S = {s_names}\n割边: {', '.join(f'{u}->{v}' for u, v in cut_edges)}\n"
+        f"割的容量 = {cut_capacity} = 最大流", transform=ax.transAxes, ha='right', va='bottom', fontsize=18,
+        bbox=dict(facecolor='white', alpha=0.8, edgecolor='gray'))
+ax.axis('off')
+fig.savefig('ek_min_cut.svg', format='svg')
+print(f"最小割容量: {cut_capacity}, 割边: {cut_edges}, 已保存为 ek_min_cut.svg")
+
 # # 检查matplotlib能否识别字体
 # for font in fm.findSystemFonts(fontpaths=None, fontext='ttf'):
 #     if 'NotoSansCJK' in font or 'Noto Sans' in font:
@@ -0,0 +1,155 @@
+"""
+Hopcroft-Karp 二分图最大匹配
+
+左部点 0..n_left-1，右部点 0..n_right-1，邻接用压缩数组（CSR）存：
+左部点 u 的邻居是 adj[ptr[u]:ptr[u+1]]。每一阶段先从所有未匹配的左部点 BFS 分层，
+再沿分层图用当前弧非递归 DFS 找一组点不相交的最短增广交错路径，总复杂度 O(E√V)。
+匹配数组沿用课件里的命名：xM[u] 是左部点 u 的匹配对象，yM[v] 是右部点 v 的匹配对象，-1 表示未匹配。
+"""
+from collections import deque
+
+INF = float('inf')
+
+
+def build_adjacency(n_left, edges):
+    """
+    由 (u, v) 边列表构造 CSR 邻接
+
+    返回:
+    (ptr, adj)
+    """
+    deg = [0] * (n_left + 1)
+    for u, _ in edges:
+        deg[u + 1] += 1
+    for u in range(n_left):
+        deg[u + 1] += deg[u]
+    ptr = deg[:]
+    adj = [0] * len(edges)
+    fill = deg[:-1]
+    for u, v in edges:
+        adj[fill[u]] = v
+        fill[u] += 1
+    return ptr, adj
+
+
+def _bfs(n_left, ptr, adj, xM, yM, dist):
+    """从所有未匹配的左部点分层，返回能到达未匹配右部点的最短层数（到不了为 INF）"""
+    q = deque()
+    for u in range(n_left):
+        if xM[u] == -1:
+            dist[u] = 0
+            q.append(u)
+        else:
+            dist[u] = INF
+    limit = INF
+    while q:
+        u = q.popleft()
+        if dist[u] >= limit:
+            continue
+        for i in range(ptr[u], ptr[u + 1]):
+            w = yM[adj[i]]
+            if w == -1:
+                if limit == INF:
+                    limit = dist[u]
+            elif dist[w] == INF:
+                dist[w] = dist[u] + 1
+                q.append(w)
+    return limit
+
+
+def hopcroft_karp(n_left, n_right, ptr, adj, on_path=None, xM=None, yM=None):
+    """
+    参数:
+    n_left, n_right: 左右两部点数
+    ptr, adj: CSR 邻接（见 build_adjacency）
+    xM, yM: 可选的初始匹配（会被原地修改），不传则从空匹配开始
+    on_path: 可选回调 on_path(path)，每找到一条增广交错路径、完成"异或"之后调用，
+             path 为 [u0, v0, u1, v1, ..., uk, vk]，其中 (ui, vi) 是新的匹配边，(vi, u(i+1)) 是原来的匹配边
+
+    返回:
+    (匹配数, xM, yM)
+    """
+    if xM is None:
+        xM = [-1] * n_left
+        yM = [-1] * n_right
+    dist = [INF] * n_left
+    matching = sum(1 for v in xM if v != -1)
+    while True:
+        limit = _bfs(n_left, ptr, adj, xM, yM, dist)
+        if limit == INF:
+            break
+        it = ptr[:-1]  # 当前弧
+        for root in range(n_left):
+            if xM[root] != -1:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                end = ptr[u + 1]
+                i = it[u]
+                advanced = False
+                while i < end:
+                    v = adj[i]
+                    w = yM[v]
+                    if w == -1:
+                        if dist[u] == limit:
+                            break
+                    elif dist[w] == dist[u] + 1:
+                        advanced = True
+                        break
+                    i += 1
+                it[u] = i
+                if i == end:
+                    # u 走不通，本阶段不再经过它
+                    dist[u] = INF
+                    stack.pop()
+                    if stack:
+                        it[stack[-1]] += 1
+                elif advanced:
+                    stack.append(w)
+                else:
+                    # 找到增广交错路径：沿栈"异或"，每个左部点改配它当前弧指向的右部点
+                    path = [] if on_path is not None else None
+                    for u in stack:
+                        v = adj[it[u]]
+                        xM[u] = v
+                        yM[v] = u
+                        if path is not None:
+                            path.append(u)
+                            path.append(v)
+                        # 路径上的点本阶段不再使用，保证各条路径点不相交
+                        dist[u] = INF
+                    matching += 1
+                    if on_path is not None:
+                        on_path(path)
+                    break
+    return matching, xM, yM
+
+
+def max_matching(left, right, edges, on_path=None, init=None):
+    """
+    对命名节点的二分图求最大匹配
+
+    参数:
+    left, right: 左右两部的节点名列表
+    edges: [(左部点名, 右部点名), ...]
+    on_path: 可选回调，参数为用节点名表示的增广交错路径
+    init: 可选的初始匹配 {左部点名: 右部点名}
+
+    返回:
+    {左部点名: 右部点名} 的匹配字典
+    """
+    li = {u: i for i, u in enumerate(left)}
+    ri = {v: i for i, v in enumerate(right)}
+    ptr, adj = build_adjacency(len(left), [(li[u], ri[v]) for u, v in edges])
+    xM = [-1] * len(left)
+    yM = [-1] * len(right)
+    for u, v in (init or {}).items():
+        xM[li[u]] = ri[v]
+        yM[ri[v]] = li[u]
+    callback = None
+    if on_path is not None:
+        def callback(path):
+            on_path([left[x] if k % 2 == 0 else right[x] for k, x in enumerate(path)])
+    hopcroft_karp(len(left), len(right), ptr, adj, callback, xM, yM)
+    return {left[u]: right[v] for u, v in enumerate(xM) if v != -1}
@@ -0,0 +1,254 @@
+"""
+最小费用流
+
+在 residual_graph.ResidualGraph 上用边权数组当费用：正向边费用 w，反向边费用 -w。
+主算法是最短路径算法（successive shortest path）：用 Johnson 势能把边权变成非负后跑二叉堆 Dijkstra，
+再像 DinicMCMF 一样在"最短路图"（约化费用为 0 的边）上用当前弧多次推流。
+有负费用边时先用 SPFA 求初始势能；method='spfa' 则每一轮都用 SPFA，对应课件里的 DiSPFA 写法。
+另有 cycle_canceling 实现负回路算法，用于演示和核对结果。费用按整数处理。
+"""
+import heapq
+from collections import deque
+
+from residual_graph import ResidualGraph, edmonds_karp
+
+INF = float('inf')
+
+
+class CostResidualGraph(ResidualGraph):
+    """边权数组 weight 就是费用数组：add_edge(u, v, c, w) 的反向边费用为 -w"""
+
+    @property
+    def cost(self):
+        return self.weight
+
+    @classmethod
+    def from_networkx(cls, G, capacity='capacity', cost='cost'):
+        """同 ResidualGraph.from_networkx，费用从边的 cost 属性读取（缺省为 0）"""
+        return super().from_networkx(G, capacity, weight=cost)
+
+    def total_cost(self):
+        """当前流的总费用"""
+        return sum(self.cap[e ^ 1] * self.cost[e] for e in range(0, len(self.to), 2))
+
+
+def spfa(g, s):
+    """
+    带负权的单源最短路（Bellman-Ford 的队列优化版），只走有剩余容量的边
+
+    返回:
+    dist 列表，不可达为 INF；存在从 s 可达的负圈时抛出 ValueError
+    """
+    head, nxt, to, cap, cost = g.head, g.nxt, g.to, g.cap, g.cost
+    dist = [INF] * g.n
+    inq = [False] * g.n
+    cnt = [0] * g.n
+    dist[s] = 0
+    q = deque([s])
+    inq[s] = True
+    while q:
+        u = q.popleft()
+        inq[u] = False
+        du = dist[u]
+        e = head[u]
+        while e != -1:
+            if cap[e] > 0:
+                v = to[e]
+                nd = du + cost[e]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    if not inq[v]:
+                        cnt[v] += 1
+                        if cnt[v] > g.n:
+                            raise ValueError('残量网络中存在负费用圈')
+                        inq[v] = True
+                        q.append(v)
+            e = nxt[e]
+    return dist
+
+
+def dijkstra(g, s, t, h):
+    """
+    以势能 h 约化费用（cost[e] + h[u] - h[v] >= 0）后的二叉堆 Dijkstra，t 出堆即停
+
+    返回:
+    约化后的距离列表，未确定的点保持当时的临时值或 INF
+    """
+    head, nxt, to, cap, cost = g.head, g.nxt, g.to, g.cap, g.cost
+    dist = [INF] * g.n
+    done = [False] * g.n
+    dist[s] = 0
+    pq = [(0, s)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if done[u]:
+            continue
+        done[u] = True
+        if u == t:
+            break
+        hu = h[u]
+        e = head[u]
+        while e != -1:
+            if cap[e] > 0:
+                v = to[e]
+                nd = d + cost[e] + hu - h[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+            e = nxt[e]
+    return dist
+
+
+def _augment(g, s, t, h, limit, on_path):
+    """在约化费用为 0 的边构成的最短路图上用当前弧推流，返回推送的流量"""
+    nxt, to, cap, cost = g.nxt, g.to, g.cap, g.cost
+    it = g.head[:]
+    on_stack = [False] * g.n
+    on_stack[s] = True
+    stack = []
+    total = 0
+    u = s
+    while total < limit:
+        if u == t:
+            pushed = min(limit - total, min(cap[e] for e in stack))
+            for e in stack:
+                cap[e] -= pushed
+                cap[e ^ 1] += pushed
+            total += pushed
+            if on_path is not None:
+                on_path(stack[:], pushed)
+            for i, e in enumerate(stack):
+                if cap[e] == 0:
+                    break
+            for e in stack[i:]:
+                on_stack[to[e]] = False
+            del stack[i:]
+            u = to[stack[-1]] if stack else s
+            continue
+        e = it[u]
+        hu = h[u]
+        # 费用为 0 的圈会让最短路图有环，已在栈上的点不再进入
+        while e != -1 and (cap[e] == 0 or on_stack[to[e]] or h[to[e]] != hu + cost[e]):
+            e = nxt[e]
+        it[u] = e
+        if e != -1:
+            stack.append(e)
+            u = to[e]
+            on_stack[u] = True
+        elif u == s:
+            break
+        else:
+            on_stack[u] = False
+            e = stack.pop()
+            u = to[e ^ 1]
+            it[u] = nxt[e]
+    return total
+
+
+def min_cost_flow(g, s, t, max_flow=INF, method='dijkstra', on_round=None, on_path=None):
+    """
+    最短路径算法求最小费用（最大）流，直接在 g 上修改剩余容量
+
+    前提是初始残量网络中没有负费用圈：最短路径算法每轮沿最短路推流，只有从无负圈的状态出发，
+    推流后才仍然没有负圈、结果才是最小费用。有负费用边时先用 find_negative_cycle 检查，
+    发现负圈就抛出 ValueError（这种图先用 cycle_canceling 消圈，或把负圈上的边预先流满）。
+
+    参数:
+    g: CostResidualGraph
+    max_flow: 需要的流量上限，默认求最大流
+    method: 'dijkstra'（势能 + 二叉堆）或 'spfa'（每轮 SPFA）
+    on_round: 可选回调 on_round(h)，每轮求完最短路后调用，h[v] 为 s 到 v 的最短费用（超过 h[t] 的截为 h[t]）
+    on_path: 可选回调 on_path(path, pushed)，每次推流后调用
+
+    返回:
+    (流量, 费用)
+    """
+    if method not in ('dijkstra', 'spfa'):
+        raise ValueError(f'未知的 method: {method}')
+    if s == t:
+        return 0, 0
+    negative = any(g.cost[e] < 0 and g.cap[e] > 0 for e in range(len(g.to)))
+    if negative and find_negative_cycle(g) is not None:
+        raise ValueError('残量网络中存在负费用圈，最短路径算法不适用，请先用 cycle_canceling 消圈')
+    # 有负费用边时用 SPFA 求初始势能（s 不可达的点势能为 INF，它们之后也不会变得可达）
+    if method == 'dijkstra' and negative:
+        h = spfa(g, s)
+    else:
+        h = [0] * g.n
+    flow = 0
+    while flow < max_flow:
+        if method == 'spfa':
+            h = spfa(g, s)
+            if h[t] == INF:
+                break
+        else:
+            d = dijkstra(g, s, t, h)
+            dt = d[t]
+            if dt == INF:
+                break
+            # 截断到 d[t] 后约化费用仍非负，且允许 Dijkstra 在 t 出堆时提前结束
+            h = [hv + (dv if dv < dt else dt) for hv, dv in zip(h, d)]
+        if on_round is not None:
+            on_round(h)
+        flow += _augment(g, s, t, h, max_flow - flow, on_path)
+    return flow, g.total_cost()
+
+
+def find_negative_cycle(g):
+    """
+    在残量网络中找一个负费用圈（Bellman-Ford，所有点初始距离为 0 相当于加了超级源点）
+
+    返回:
+    圈上的边编号列表（按方向排列），没有则返回 None
+    """
+    to, cap, cost = g.to, g.cap, g.cost
+    dist = [0] * g.n
+    pre = [-1] * g.n
+    x = -1
+    for _ in range(g.n):
+        x = -1
+        for e in range(len(to)):
+            if cap[e] > 0:
+                u, v = to[e ^ 1], to[e]
+                if dist[u] + cost[e] < dist[v]:
+                    dist[v] = dist[u] + cost[e]
+                    pre[v] = e
+                    x = v
+        if x == -1:
+            return None
+    # 第 n 轮仍有松弛：沿 pre 回退 n 步一定落在圈上
+    for _ in range(g.n):
+        x = to[pre[x] ^ 1]
+    cycle = []
+    v = x
+    while True:
+        e = pre[v]
+        cycle.append(e)
+        v = to[e ^ 1]
+        if v == x:
+            break
+    return cycle[::-1]
+
+
+def cycle_canceling(g, s, t, on_cycle=None):
+    """
+    负回路算法：先求任意最大流，再不断沿负费用圈推流直到没有负圈
+
+    参数:
+    on_cycle: 可选回调 on_cycle(cycle, pushed, cycle_cost)，每次消圈后调用
+
+    返回:
+    (流量, 费用)
+    """
+    flow = edmonds_karp(g, s, t)
+    while True:
+        cycle = find_negative_cycle(g)
+        if cycle is None:
+            break
+        pushed = min(g.cap[e] for e in cycle)
+        for e in cycle:
+            g.cap[e] -= pushed
+            g.cap[e ^ 1] += pushed
+        if on_cycle is not None:
+            on_cycle(cycle, pushed, sum(g.cost[e] for e in cycle))
+    return flow, g.total_cost()
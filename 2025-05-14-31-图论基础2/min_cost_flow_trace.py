@@ -0,0 +1,109 @@
+import networkx as nx
+import matplotlib.pyplot as plt
+from matplotlib import rcParams
+
+from min_cost_flow import CostResidualGraph, min_cost_flow, cycle_canceling
+from residual_graph import edmonds_karp
+
+# 设置matplotlib支持中文和大字号
+rcParams['font.sans-serif'] = [
+    'SimHei', 'Arial Unicode MS', 'Microsoft YaHei',
+    'Noto Sans CJK SC', 'Noto Sans CJK SC Regular',
+    'Noto Sans CJK JP', 'Noto Sans CJK KR', 'Noto Sans CJK TC', 'Noto Sans CJK HK', 'WenQuanYi Micro Hei',
+]
+rcParams['axes.unicode_minus'] = False
+rcParams['font.size'] = 20
+
+# 与"最小费用流-负回路算法"示意图相同的网络：(起点, 终点, 容量, 费用)
+edges = [
+    ('s', '1', 5, 3), ('s', '2', 5, 3),
+    ('1', '2', 3, 1),
+    ('1', 't', 6, 3), ('2', 't', 6, 1),
+]
+G = nx.DiGraph()
+for u, v, c, w in edges:
+    G.add_edge(u, v, capacity=c, cost=w)
+
+pos = {'s': (0, 1), '1': (1, 2), '2': (1, 0), 't': (2, 1)}
+
+
+def snapshot(g, edge_id):
+    # 原图每条边当前的流量
+    return {uv: g.cap[e ^ 1] for uv, e in edge_id.items()}
+
+
+def draw_state(ax, flow, highlight, color, title, h=None):
+    # 边标签为"容量:费用, 流量"，highlight 中的边（可以是反向边）用 color 高亮
+    nx.draw_networkx_nodes(G, pos, ax=ax, node_color='whitesmoke', edgecolors='black', node_size=900)
+    nx.draw_networkx_labels(G, pos, ax=ax, font_size=22)
+    nx.draw_networkx_edges(G, pos, ax=ax, edge_color='gray', width=2, arrowsize=20)
+    labels = {(u, v): f"{G[u][v]['capacity']}:{G[u][v]['cost']}, {flow[(u, v)]}" for u, v in G.edges}
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, ax=ax, font_size=14)
+    forward = [(u, v) for u, v in highlight if G.has_edge(u, v)]
+    backward = [(u, v) for u, v in highlight if not G.has_edge(u, v)]
+    if forward:
+        nx.draw_networkx_edges(G, pos, edgelist=forward, ax=ax, edge_color=color, width=4, arrowsize=24)
+    if backward:
+        nx.draw_networkx_edges(G, pos, edgelist=backward, ax=ax, edge_color=color, width=4, arrowsize=24,
+                               style='dashed', connectionstyle='arc3,rad=0.25')
+    if h is not None:
+        for node, (x, y) in pos.items():
+            ax.text(x, y + 0.28, f'h={h[node]}', color='blue', fontsize=14, ha='center')
+    ax.set_title(title, fontsize=16)
+    ax.set_xlim(-0.4, 2.4)
+    ax.set_ylim(-0.5, 2.6)
+    ax.axis('off')
+
+
+def trace_shortest_path():
+    """最短路径算法：每次推流记录一帧（本轮最短路势能 h、推流路径、推流后的流量）"""
+    g, nodes, index, edge_id = CostResidualGraph.from_networkx(G)
+    frames = []
+    cur = {}
+
+    def on_round(h):
+        cur['h'] = {nodes[i]: x for i, x in enumerate(h)}
+
+    def on_path(path, pushed):
+        names = [(nodes[g.to[e ^ 1]], nodes[g.to[e]]) for e in path]
+        cost = sum(g.cost[e] for e in path)
+        frames.append((snapshot(g, edge_id), names, cur['h'], f'推流 {pushed}，路径费用 {cost}'))
+
+    flow, cost = min_cost_flow(g, index['s'], index['t'], on_round=on_round, on_path=on_path)
+    return frames, flow, cost
+
+
+def trace_cycle_canceling():
+    """负回路算法：先记录任意最大流，再每消去一个负圈记录一帧"""
+    g, nodes, index, edge_id = CostResidualGraph.from_networkx(G)
+    frames = []
+
+    def on_cycle(cycle, pushed, cycle_cost):
+        names = [(nodes[g.to[e ^ 1]], nodes[g.to[e]]) for e in cycle]
+        frames.append((snapshot(g, edge_id), names, None, f'负圈费用 {cycle_cost}，推流 {pushed}'))
+
+    # 先单独跑一遍最大流作为初始帧（cycle_canceling 内部用同样的 EK，流量相同）
+    g0, _, index0, edge_id0 = CostResidualGraph.from_networkx(G)
+    edmonds_karp(g0, index0['s'], index0['t'])
+    frames.append((snapshot(g0, edge_id0), [], None, f'初始最大流，费用 {g0.total_cost()}'))
+    flow, cost = cycle_canceling(g, index['s'], index['t'], on_cycle)
+    return frames, flow, cost
+
+
+def save_frames(frames, color, title, filename):
+    fig, axes = plt.subplots(1, len(frames), figsize=(6 * len(frames), 5))
+    if len(frames) == 1:
+        axes = [axes]
+    for ax, (flow, highlight, h, info) in zip(axes, frames):
+        draw_state(ax, flow, highlight, color, info, h)
+    fig.suptitle(title, fontsize=22)
+    fig.savefig(filename, format='svg', bbox_inches='tight')
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    frames, flow, cost = trace_shortest_path()
+    save_frames(frames, 'red', f'最小费用流-最短路径算法（最大流 {flow}，最小费用 {cost}）', 'min_cost_flow_ssp.svg')
+    frames, flow, cost = trace_cycle_canceling()
+    save_frames(frames, 'purple', f'最小费用流-负回路算法（最大流 {flow}，最小费用 {cost}）', 'min_cost_flow_cycle.svg')
+    print("已保存 min_cost_flow_ssp.svg 与 min_cost_flow_cycle.svg")
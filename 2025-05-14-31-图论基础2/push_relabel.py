@@ -0,0 +1,237 @@
+"""
+最高标号预流推进（HLPP）最大流
+
+在 residual_graph.ResidualGraph 上运行。每次从高度最高的活跃点（有盈余的点）出发，
+沿 height[u] == height[v] + 1 的边推流，推不动就重贴标签，配合两个常用优化：
+- gap：某个高度 h 上一个点都没有了，高于 h 的点都到不了汇点，直接把它们的高度抬到 n；
+  高度小于 n 的点按高度串成双向链表，gap 时只访问高于 h 的点，不必扫描全部 n 个点；
+- global relabel：一开始以及每做 n 次重贴标签后，从汇点反向 BFS 重新算出准确的高度。
+第一阶段结束时汇点的盈余就是最大流；第二阶段把剩下的盈余推回源点，使 g 上是一个合法的流。
+"""
+from collections import deque
+
+
+def _global_relabel(g, t, height, n):
+    """从汇点沿反向残量边 BFS，height[v] 设为 v 到 t 的距离，到不了的点设为 n"""
+    head, nxt, to, cap = g.head, g.nxt, g.to, g.cap
+    for v in range(g.n):
+        height[v] = n
+    height[t] = 0
+    q = deque([t])
+    while q:
+        v = q.popleft()
+        hv = height[v] + 1
+        e = head[v]
+        while e != -1:
+            u = to[e]
+            # u -> v 的剩余容量存在边 e ^ 1 上
+            if height[u] == n and cap[e ^ 1] > 0:
+                height[u] = hv
+                q.append(u)
+            e = nxt[e]
+
+
+def _return_excess(g, s, t, height, excess, stats):
+    """第二阶段：把到不了汇点的点上剩余的盈余推回源点（FIFO 推进，不用 gap）"""
+    head, nxt, to, cap = g.head, g.nxt, g.to, g.cap
+    n = g.n
+    # 高度设为 n + 到源点的距离，保证推流只朝源点方向走
+    for v in range(n):
+        height[v] = 2 * n
+    height[s] = n
+    height[t] = 2 * n
+    q = deque([s])
+    while q:
+        v = q.popleft()
+        hv = height[v] + 1
+        e = head[v]
+        while e != -1:
+            u = to[e]
+            if height[u] == 2 * n and u != t and cap[e ^ 1] > 0:
+                height[u] = hv
+                q.append(u)
+            e = nxt[e]
+    active = deque(v for v in range(n) if excess[v] > 0 and v != s and v != t)
+    it = head[:]
+    while active:
+        u = active.popleft()
+        hu = height[u]
+        e = it[u]
+        while excess[u] > 0:
+            if e == -1:
+                # 重贴标签
+                lowest = 4 * n
+                a = head[u]
+                while a != -1:
+                    if cap[a] > 0 and height[to[a]] < lowest:
+                        lowest = height[to[a]]
+                    a = nxt[a]
+                hu = height[u] = lowest + 1
+                e = head[u]
+                stats['relabels'] += 1
+                continue
+            v = to[e]
+            if cap[e] > 0 and hu == height[v] + 1:
+                d = excess[u] if excess[u] < cap[e] else cap[e]
+                cap[e] -= d
+                cap[e ^ 1] += d
+                excess[u] -= d
+                if excess[v] == 0 and v != s and v != t:
+                    active.append(v)
+                excess[v] += d
+                stats['pushes'] += 1
+                if cap[e] == 0:
+                    e = nxt[e]
+            else:
+                e = nxt[e]
+        it[u] = e
+
+
+def push_relabel(g, s, t, stats=None):
+    """
+    HLPP 最大流，直接在 g 上修改剩余容量
+
+    参数:
+    g: ResidualGraph
+    s, t: 源点、汇点编号
+    stats: 可选的 dict，结束后写入 pushes / relabels / global_relabels / gaps 计数
+
+    返回:
+    最大流的值
+    """
+    if stats is None:
+        stats = {}
+    stats.update(pushes=0, relabels=0, global_relabels=0, gaps=0)
+    if s == t:
+        return 0
+    head, nxt, to, cap = g.head, g.nxt, g.to, g.cap
+    n = g.n
+    height = [0] * n
+    excess = [0] * n
+    # level[h] 是高度为 h 的第一个点，同一高度的点用 lnext / lprev 串成双向链表（只含高度 < n 的点）
+    level = [-1] * n
+    lnext = [-1] * n
+    lprev = [-1] * n
+    hmax = -1  # 链表中最高的高度（可能偏大）
+    buckets = [[] for _ in range(n)]  # buckets[h]：高度为 h 的活跃点
+    it = head[:]  # 当前弧
+
+    # 源点的出边全部推满
+    e = head[s]
+    while e != -1:
+        if cap[e] > 0:
+            excess[to[e]] += cap[e]
+            excess[s] -= cap[e]
+            cap[e ^ 1] += cap[e]
+            cap[e] = 0
+            stats['pushes'] += 1
+        e = nxt[e]
+
+    def link(v, h):
+        first = level[h]
+        lnext[v], lprev[v] = first, -1
+        if first != -1:
+            lprev[first] = v
+        level[h] = v
+
+    def unlink(v, h):
+        a, b = lprev[v], lnext[v]
+        if a == -1:
+            level[h] = b
+        else:
+            lnext[a] = b
+        if b != -1:
+            lprev[b] = a
+
+    def rebuild():
+        # 全局重贴标签后重建高度链表、活跃点桶和当前弧，返回最高的活跃高度
+        nonlocal hmax
+        _global_relabel(g, t, height, n)
+        height[s] = n
+        stats['global_relabels'] += 1
+        for h in range(n):
+            level[h] = -1
+        for b in buckets:
+            b.clear()
+        top = hmax = -1
+        for v in range(n):
+            h = height[v]
+            if h < n:
+                link(v, h)
+                if h > hmax:
+                    hmax = h
+                if excess[v] > 0 and v != t:
+                    buckets[h].append(v)
+                    if h > top:
+                        top = h
+        it[:] = head
+        return top
+
+    top = rebuild()
+    work = 0
+    while top >= 0:
+        if not buckets[top]:
+            top -= 1
+            continue
+        u = buckets[top].pop()
+        if height[u] != top or excess[u] == 0:
+            continue
+        hu = top
+        e = it[u]
+        while excess[u] > 0:
+            if e == -1:
+                # 重贴标签：高度改为可达邻居的最小高度 + 1
+                lowest = n
+                a = head[u]
+                while a != -1:
+                    if cap[a] > 0 and height[to[a]] < lowest:
+                        lowest = height[to[a]]
+                    a = nxt[a]
+                stats['relabels'] += 1
+                work += 1
+                unlink(u, hu)
+                if level[hu] == -1:
+                    # gap：高于 hu 的点（此时都不活跃）已到不了汇点，逐层取下链表
+                    stats['gaps'] += 1
+                    for h in range(hu + 1, hmax + 1):
+                        v = level[h]
+                        while v != -1:
+                            height[v] = n
+                            v = lnext[v]
+                        level[h] = -1
+                    hmax = hu - 1
+                    lowest = n
+                hu = lowest + 1 if lowest < n else n
+                height[u] = hu
+                if hu < n:
+                    link(u, hu)
+                    if hu > hmax:
+                        hmax = hu
+                e = head[u]
+                if hu >= n:
+                    break
+                continue
+            v = to[e]
+            if cap[e] > 0 and hu == height[v] + 1:
+                d = excess[u] if excess[u] < cap[e] else cap[e]
+                cap[e] -= d
+                cap[e ^ 1] += d
+                excess[u] -= d
+                if excess[v] == 0 and v != t:
+                    # u 可能已被重贴到比 top 更高，v 的高度也就可能超过 top
+                    buckets[hu - 1].append(v)
+                    if hu - 1 > top:
+                        top = hu - 1
+                excess[v] += d
+                stats['pushes'] += 1
+                if cap[e] == 0:
+                    e = nxt[e]
+            else:
+                e = nxt[e]
+        it[u] = e
+        if work >= n:
+            work = 0
+            top = rebuild()
+
+    _return_excess(g, s, t, height, excess, stats)
+    return excess[t]
@@ -0,0 +1,240 @@
+"""
+数组版残量网络（链式前向星）上的最大流
+
+残量网络就是 chain_graph.py（图论基础1 中同名模块去掉 CSR 转换后的版本）里的有向 ChainGraph：正向边和反向边成对存放，第 e 条边的反向边是 e ^ 1，
+head[u] 是 u 的第一条出边，nxt[e] 是同起点的下一条边，to[e] 是终点，cap[e] 是剩余容量。
+"""
+from collections import deque
+
+from chain_graph import ChainGraph
+
+# add_edge(u, v, c) 加一条容量为 c 的边及其容量为 0 的反向边
+ResidualGraph = ChainGraph
+
+
+def bfs_augmenting_path(g, s, t):
+    """
+    在残量网络上 BFS 找一条 s->t 的最短增广路
+
+    返回:
+    pre: pre[v] 是到达 v 的边编号（s 和未到达的点为 -1）；找不到时返回 None
+    """
+    head, nxt, to, cap = g.head, g.nxt, g.to, g.cap
+    pre = [-1] * g.n
+    seen = [False] * g.n
+    seen[s] = True
+    q = deque([s])
+    while q:
+        u = q.popleft()
+        e = head[u]
+        while e != -1:
+            v = to[e]
+            if cap[e] > 0 and not seen[v]:
+                seen[v] = True
+                pre[v] = e
+                if v == t:
+                    return pre
+                q.append(v)
+            e = nxt[e]
+    return None
+
+
+def edmonds_karp(g, s, t, on_path=None):
+    """
+    Edmonds-Karp 最大流，直接在 g 上修改剩余容量
+
+    参数:
+    g: ResidualGraph
+    s, t: 源点、汇点编号
+    on_path: 可选回调 on_path(path, bottleneck)，在每次推流后调用，path 为按 s->t 顺序的边编号列表，
+             推流前边 e 的剩余容量是 g.cap[e] + bottleneck；不传时不构造路径列表，适合大图
+
+    返回:
+    最大流的值
+    """
+    to, cap = g.to, g.cap
+    max_flow = 0
+    while True:
+        pre = bfs_augmenting_path(g, s, t)
+        if pre is None:
+            break
+        # 反向沿 pre 找瓶颈
+        bottleneck = float('inf')
+        v = t
+        while v != s:
+            e = pre[v]
+            if cap[e] < bottleneck:
+                bottleneck = cap[e]
+            v = to[e ^ 1]
+        path = [] if on_path is not None else None
+        v = t
+        while v != s:
+            e = pre[v]
+            cap[e] -= bottleneck
+            cap[e ^ 1] += bottleneck
+            if path is not None:
+                path.append(e)
+            v = to[e ^ 1]
+        max_flow += bottleneck
+        if on_path is not None:
+            on_path(path[::-1], bottleneck)
+    return max_flow
+
+
+def bfs_level(g, s):
+    """
+    从 s 出发对残量网络分层
+
+    返回:
+    (level, pre)：level[v] 为层号（不可达为 -1），pre[v] 为 BFS 树中到达 v 的边编号
+    """
+    head, nxt, to, cap = g.head, g.nxt, g.to, g.cap
+    level = [-1] * g.n
+    pre = [-1] * g.n
+    level[s] = 0
+    q = deque([s])
+    while q:
+        u = q.popleft()
+        e = head[u]
+        while e != -1:
+            v = to[e]
+            if cap[e] > 0 and level[v] < 0:
+                level[v] = level[u] + 1
+                pre[v] = e
+                q.append(v)
+            e = nxt[e]
+    return level, pre
+
+
+def blocking_flow(g, s, t, level, it, on_path=None, scans=None, on_event=None, current_arc=True):
+    """
+    在分层图上用当前弧 it 求阻塞流，非递归
+
+    参数:
+    level: bfs_level 得到的层号
+    it: 每个点的当前弧，一般传 g.head[:]；已确认走不通的弧不会再被扫描
+    on_path: 可选回调 on_path(path, pushed)，每次推流后调用
+    scans: 可选的 list，scans[u] 累加点 u 扫描过的边数
+    on_event: 可选回调 on_event(kind, u, e, it)，kind 为 'arrive' / 'scan' / 'push' / 'dead'，
+              it 为事件发生时的当前弧数组
+    current_arc: False 时每次 DFS 进入一个点都从它的第一条边重新扫描（不用当前弧优化，用于对比）
+
+    返回:
+    本阶段推送的总流量
+    """
+    head, nxt, to, cap = g.head, g.nxt, g.to, g.cap
+    traced = scans is not None or on_event is not None
+    total = 0
+    stack = []  # 当前路径上的边
+    u = s
+    while True:
+        if u == t:
+            pushed = min(cap[e] for e in stack)
+            for e in stack:
+                cap[e] -= pushed
+                cap[e ^ 1] += pushed
+            total += pushed
+            if on_path is not None:
+                on_path(stack[:], pushed)
+            if on_event is not None:
+                for e in stack:
+                    on_event('push', to[e ^ 1], e, it)
+            # 退回到第一条推满的边的起点，继续从那里找下一条路
+            for i, e in enumerate(stack):
+                if cap[e] == 0:
+                    break
+            del stack[i:]
+            u = to[stack[-1]] if stack else s
+            continue
+        # 从当前弧开始找一条可走的边
+        e = it[u]
+        lv = level[u] + 1
+        if not traced:
+            while e != -1 and (cap[e] == 0 or level[to[e]] != lv):
+                e = nxt[e]
+        else:
+            while e != -1:
+                if scans is not None:
+                    scans[u] += 1
+                if on_event is not None:
+                    on_event('scan', u, e, it)
+                if cap[e] > 0 and level[to[e]] == lv:
+                    break
+                e = nxt[e]
+        it[u] = e
+        if e != -1:
+            stack.append(e)
+            u = to[e]
+            if not current_arc:
+                it[u] = head[u]
+            if on_event is not None:
+                on_event('arrive', u, e, it)
+        elif u == s:
+            break
+        else:
+            if on_event is not None:
+                on_event('dead', u, -1, it)
+            # u 走不通：退回上一个点，并让它的当前弧跳过指向 u 的边
+            e = stack.pop()
+            u = to[e ^ 1]
+            it[u] = nxt[e]
+    return total
+
+
+def dinic(g, s, t, on_level=None, on_path=None):
+    """
+    Dinic 最大流：分层 + 当前弧阻塞流，直接在 g 上修改剩余容量
+
+    参数:
+    on_level: 可选回调 on_level(level, pre)，每次分层后调用（包括最后一次到不了 t 的分层）
+    on_path: 可选回调 on_path(path, pushed)，每次推流后调用
+
+    返回:
+    最大流的值
+    """
+    if s == t:
+        return 0
+    max_flow = 0
+    while True:
+        level, pre = bfs_level(g, s)
+        if on_level is not None:
+            on_level(level, pre)
+        if level[t] < 0:
+            break
+        max_flow += blocking_flow(g, s, t, level, g.head[:], on_path)
+    return max_flow
+
+
+def min_cut(g, s, max_flow=None):
+    """
+    求完最大流后，从 s 出发在残量网络上 BFS 得到最小割，O(V + E)
+
+    参数:
+    max_flow: 可选，传入时核对割的容量等于最大流（最大流最小割定理），不相等抛出 ValueError
+
+    返回:
+    (side, cut_edges, capacity)：side[v] 表示 v 在源点一侧（S 集合），
+    cut_edges 为从 S 指向 T 的边编号（都已流满；有向图都是正向边，无向图取指向 T 的那个方向），
+    capacity 为这些边的容量之和
+    """
+    level, _ = bfs_level(g, s)
+    side = [lv >= 0 for lv in level]
+    to, cap = g.to, g.cap
+    cut_edges = []
+    capacity = 0
+    for e in range(0, len(to), 2):
+        if side[to[e ^ 1]] and not side[to[e]]:
+            arc = e
+        elif g.undirected and side[to[e]] and not side[to[e ^ 1]]:
+            arc = e ^ 1
+        else:
+            continue
+        cut_edges.append(arc)
+        # 有向图反向边的初始容量为 0，两者之和就是原容量；无向图两个方向初始容量相同，和是原容量的两倍
+        total = cap[e] + cap[e ^ 1]
+        if g.undirected:
+            total = total / 2 if isinstance(total, float) else total // 2
+        capacity += total
+    if max_flow is not None and capacity != max_flow:
+        raise ValueError(f'割的容量 {capacity} 与最大流 {max_flow} 不相等，残量网络中的流不是最大流')
+    return side, cut_edges, capacity
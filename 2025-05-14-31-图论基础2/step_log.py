@@ -0,0 +1,79 @@
+"""
+增量式动画步骤记录
+
+动画脚本原来每一帧都 copy.deepcopy(flow)，帧数 × 边数的内存全部花在重复的流量快照上。
+这里只保存一份初始状态，每一步只记录发生变化的 (edge, old, new)，
+并每隔 checkpoint_every 步存一份完整快照，需要某一帧的状态时从最近的快照向后重放。
+"""
+
+
+class StepLog:
+    def __init__(self, base=None, checkpoint_every=64):
+        """
+        参数:
+        base: 初始状态，形如 {(u, v): value}，缺省的键视为 0
+        checkpoint_every: 每隔多少步保存一次完整快照
+        """
+        self.base = dict(base or {})
+        self.checkpoint_every = checkpoint_every
+        self.deltas = []      # deltas[i]: 第 i 步的增量列表 [(edge, old, new), ...]
+        self.meta = []        # meta[i]: 第 i 步画面需要的其它信息（dict）
+        self.checkpoints = {}  # 步号 -> 该步完成后的完整状态
+        self._live = dict(self.base)  # 算法运行中的当前状态
+        self._pending = []
+        # 最近一次重建的状态，顺序播放动画时直接向后增量重放
+        self._cache_step = -1
+        self._cache_state = dict(self.base)
+
+    def __len__(self):
+        return len(self.deltas)
+
+    def get(self, edge):
+        return self._live.get(edge, 0)
+
+    def set(self, edge, value):
+        old = self._live.get(edge, 0)
+        if old != value:
+            self._pending.append((edge, old, value))
+            self._live[edge] = value
+
+    def add(self, edge, amount):
+        self.set(edge, self._live.get(edge, 0) + amount)
+
+    def commit(self, **meta):
+        """结束当前一步：把累积的增量和画面信息记为一帧，返回步号"""
+        self.deltas.append(self._pending)
+        self.meta.append(meta)
+        self._pending = []
+        step = len(self.deltas) - 1
+        if (step + 1) % self.checkpoint_every == 0:
+            self.checkpoints[step] = dict(self._live)
+        return step
+
+    def state(self, step):
+        """
+        重建第 step 步完成后的状态
+
+        返回的是新的 dict，调用方可以保存或修改；内部缓存另留一份，顺序播放时仍只需向后增量重放
+        """
+        if step < 0:
+            return dict(self.base)
+        if self._cache_step <= step:
+            start, cur = self._cache_step, self._cache_state
+        else:
+            start, cur = -1, self.base
+        # 从 step 往前找最近的快照，比缓存更近就从快照开始
+        k = (step + 1) // self.checkpoint_every * self.checkpoint_every - 1
+        if k > start and k in self.checkpoints:
+            start, cur = k, self.checkpoints[k]
+        if cur is self.base or cur is self.checkpoints.get(start):
+            cur = dict(cur)
+        for i in range(start + 1, step + 1):
+            for edge, _, new in self.deltas[i]:
+                cur[edge] = new
+        self._cache_step, self._cache_state = step, cur
+        return dict(cur)
+
+    def frame(self, step):
+        """返回 (第 step 步的状态, 第 step 步的画面信息)"""
+        return self.state(step), self.meta[step]
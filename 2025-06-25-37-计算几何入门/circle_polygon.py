@@ -0,0 +1,88 @@
+"""
+一批圆与一个多边形：边到圆心的距离、圆与多边形相交部分的面积
+
+面积按三角剖分计算：以圆心 O 为公共顶点，多边形每条边 AB 与 O 组成有向三角形 OAB，
+多边形与圆的交 = 各有向三角形与圆的交之和（逆时针为正），取绝对值即可，凹多边形同样适用。
+三角形 OAB 与圆的交：求线段 AB 与圆的交点参数 t1 <= t2，截到 [0, 1] 后得到 P1、P2，
+面积 = 扇形 (A, P1) + 三角形 (O, P1, P2) + 扇形 (P2, B)；线段不进圆时 P1 = P2，退化为扇形 (A, B)，
+两端都在圆内时 P1 = A、P2 = B，退化为三角形 OAB。所有 (圆, 边) 组合同时计算。
+"""
+import numpy as np
+
+from geometry import cross, dot, point_segment_distance, polygon_area
+
+PAIR_CHUNK = 1 << 21  # 每批最多计算的 (圆, 边) 组合数
+
+
+def edge_distances(centers, polygon):
+    """
+    每个圆心到多边形每条边（线段）的距离
+
+    参数:
+    centers: (M, 2)
+    polygon: (N, 2) 顶点数组，第 i 条边为 V[i] -> V[(i+1) % N]
+
+    返回:
+    (M, N) 数组
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 1, 2)
+    poly = np.asarray(polygon, dtype=np.float64)
+    return point_segment_distance(centers, poly, np.roll(poly, -1, axis=0))
+
+
+def edges_hit(centers, radii, polygon):
+    """(M, N) 布尔数组：第 j 条边与第 i 个圆（含圆内部）是否有公共点"""
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(np.reshape(centers, (-1, 2))),))
+    return edge_distances(centers, polygon) <= radii[:, None]
+
+
+def _sector(u, v, r):
+    """圆心角从 u 转到 v 的有向扇形面积"""
+    return r * r / 2 * np.arctan2(cross(u, v), dot(u, v))
+
+
+def _triangle_circle_area(a, b, r):
+    """以圆心为原点，有向三角形 (O, a, b) 与半径 r 的圆的交的面积，a、b 形如 (..., 2)，r 可广播"""
+    d = b - a
+    qa = dot(d, d)
+    qb = dot(a, d)  # 方程 |a + t d|² = r² 即 qa t² + 2 qb t + qc = 0
+    qc = dot(a, a) - r * r
+    disc = qb * qb - qa * qc
+    ok = (disc > 0) & (qa > 0)
+    root = np.sqrt(np.where(ok, disc, 0))
+    qa_safe = np.where(ok, qa, 1)
+    t1 = np.where(ok, np.clip((-qb - root) / qa_safe, 0, 1), 0)
+    t2 = np.where(ok, np.clip((-qb + root) / qa_safe, 0, 1), 0)
+    p1 = a + t1[..., None] * d
+    p2 = a + t2[..., None] * d
+    return _sector(a, p1, r) + cross(p1, p2) / 2 + _sector(p2, b, r)
+
+
+def circle_polygon_area(centers, radii, polygon):
+    """
+    每个圆与多边形相交部分的面积（精确值，不做采样）
+
+    参数:
+    centers: (M, 2) 圆心
+    radii: 半径，标量或 (M,)
+    polygon: (N, 2) 简单多边形的顶点，顺时针、逆时针均可
+
+    返回:
+    (M,) 数组
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(centers),))
+    poly = np.asarray(polygon, dtype=np.float64)
+    nxt = np.roll(poly, -1, axis=0)
+    area = np.empty(len(centers))
+    step = max(PAIR_CHUNK // len(poly), 1)
+    for s in range(0, len(centers), step):
+        c = centers[s:s + step, None, :]
+        r = radii[s:s + step, None]
+        area[s:s + step] = np.abs(_triangle_circle_area(poly - c, nxt - c, r).sum(axis=1))
+    return area
+
+
+def coverage(centers, radii, polygon):
+    """每个圆覆盖多边形面积的比例"""
+    return circle_polygon_area(centers, radii, polygon) / abs(polygon_area(polygon))
@@ -0,0 +1,98 @@
+"""
+最近点对（分治），O(n log n)
+
+只在开始时用 NumPy 按 x、按 y 各排一次序，递归时：
+- 子问题是按 x 排序后的一段位置 [lo, hi)，不复制点
+- 子问题内按 y 排好的点下标，由上一层按"位置 < mid"整批筛出，筛选不改变顺序，所以不必重新排序
+- 中线两侧距离都小于当前最优 d 的点组成窄带，带内按 y 排序后每个点只需与后面 7 个点比较，
+  这 7 轮比较每轮都是整条窄带一起算
+规模不超过 leaf 的子问题直接两两计算。
+"""
+import math
+
+import numpy as np
+
+LEAF = 128  # 子问题不超过这么多点时直接两两计算（太小时递归调用的开销反而更大）
+
+# trace 中每一步的种类
+SPLIT, BASE, MERGE = 0, 1, 2
+
+
+def x_order(points):
+    """按 (x, y) 排序的点下标，trace 里的位置 lo、mid、hi 都是指这个顺序"""
+    pts = np.asarray(points, dtype=np.float64)
+    return np.lexsort((pts[:, 1], pts[:, 0]))
+
+
+def closest_pair(points, leaf=LEAF, trace=None):
+    """
+    参数:
+    points: (n, 2) 坐标数组，n >= 2
+    leaf: 直接两两计算的子问题规模，至少为 2；画动画时可以设小一些，让递归更深
+    trace: 可选的 list，传入时按递归顺序追加 (kind, lo, hi, mid, i, j, dist)：
+           (SPLIT, lo, hi, mid, -1, -1, x)：[lo, hi) 在位置 mid 处分成两半，分界线为竖线 x
+           (BASE, lo, hi, -1, i, j, dist)：[lo, hi) 两两计算得到的最近点对（只有一个点时 i = j = -1、dist = inf）
+           (MERGE, lo, hi, mid, i, j, dist)：合并两半并检查窄带之后 [lo, hi) 的最近点对，
+           窄带的半宽就是两半结果中较小的 dist
+
+    返回:
+    (i, j, dist)：i、j 为点的下标
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    n = len(pts)
+    if n < 2:
+        raise ValueError('至少需要两个点')
+    leaf = max(leaf, 2)
+    x, y = np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1])
+    order = np.lexsort((y, x))
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+    lower = {}  # 各规模的下三角（含对角线）掩码，两两计算时去掉重复的点对
+
+    def solve(lo, hi, ys):
+        """ys 为 [lo, hi) 中的点下标，按 y 排序；返回 (i, j, 距离的平方)"""
+        if hi - lo <= leaf:
+            idx = order[lo:hi]
+            best = (-1, -1, math.inf)
+            if len(idx) > 1:
+                d2 = (x[idx, None] - x[idx]) ** 2 + (y[idx, None] - y[idx]) ** 2
+                if len(idx) not in lower:
+                    lower[len(idx)] = np.tri(len(idx), dtype=bool)
+                d2[lower[len(idx)]] = np.inf
+                a, b = divmod(int(np.argmin(d2)), len(idx))
+                best = (int(idx[a]), int(idx[b]), float(d2[a, b]))
+            if trace is not None:
+                trace.append((BASE, lo, hi, -1, best[0], best[1], math.sqrt(best[2])))
+            return best
+        mid = (lo + hi) // 2
+        xm = float(x[order[mid]])
+        if trace is not None:
+            trace.append((SPLIT, lo, hi, mid, -1, -1, xm))
+        left = rank[ys] < mid
+        best = min(solve(lo, mid, ys[left]), solve(mid, hi, ys[~left]), key=lambda r: r[2])
+        strip = ys[np.abs(x[ys] - xm) < math.sqrt(best[2])]
+        for s in range(1, min(8, len(strip))):
+            p, q = strip[:-s], strip[s:]
+            d2 = (x[p] - x[q]) ** 2 + (y[p] - y[q]) ** 2
+            k = int(np.argmin(d2))
+            if d2[k] < best[2]:
+                best = (int(p[k]), int(q[k]), float(d2[k]))
+        if trace is not None:
+            trace.append((MERGE, lo, hi, mid, best[0], best[1], math.sqrt(best[2])))
+        return best
+
+    i, j, d2 = solve(0, n, np.lexsort((x, y)))
+    return i, j, math.sqrt(d2)
+
+
+def closest_pair_brute(points):
+    """两两计算，O(n²)，用于核对"""
+    pts = np.asarray(points, dtype=np.float64)
+    n = len(pts)
+    best = (-1, -1, math.inf)
+    for a in range(n - 1):
+        d2 = ((pts[a + 1:] - pts[a]) ** 2).sum(axis=1)
+        k = int(np.argmin(d2))
+        if d2[k] < best[2]:
+            best = (a, a + 1 + k, float(d2[k]))
+    return best[0], best[1], math.sqrt(best[2])
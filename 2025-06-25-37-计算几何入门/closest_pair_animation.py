@@ -0,0 +1,157 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.patches import Rectangle
+
+from closest_pair import closest_pair, x_order, SPLIT, BASE
+
+# 设置中文字体
+plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
+plt.rcParams['axes.unicode_minus'] = False
+
+# 定义点集（与凸包动画相同）
+points = np.array([
+    [1, 1],   # 点1
+    [2, 3],   # 点2
+    [3, 2],   # 点3
+    [4, 4],   # 点4
+    [5, 1],   # 点5
+    [6, 3],   # 点6
+    [7, 2],   # 点7
+    [4, 5],   # 点8
+    [2, 5],   # 点9
+    [1, 4],   # 点10
+    [3, 6],   # 点11
+    [6, 5],   # 点12
+])
+
+# 分治求最近点对，子问题不超过 3 个点时直接两两计算，记录每一步
+trace = []
+best_i, best_j, best_dist = closest_pair(points, leaf=3, trace=trace)
+order = x_order(points)
+
+# 把 trace 整理成每一帧要画的内容
+frames = []
+results = {}  # (lo, hi) -> 该子问题的 (i, j, dist)
+for kind, lo, hi, mid, i, j, dist in trace:
+    members = order[lo:hi]
+    frame = {'members': members, 'split': None, 'strip': None, 'pair': None}
+    if kind == SPLIT:
+        frame['split'] = dist
+        frame['info'] = f"拆分：{hi - lo} 个点从 x = {dist:g} 处分成左右两半"
+    else:
+        results[(lo, hi)] = (i, j, dist)
+        if i >= 0:
+            frame['pair'] = (i, j)
+        if kind == BASE:
+            if i >= 0:
+                frame['info'] = f"直接计算 {hi - lo} 个点：最近为 P{i+1}-P{j+1}，距离 {dist:.2f}"
+            else:
+                frame['info'] = "只有 1 个点，没有点对"
+        else:
+            xm = points[order[mid], 0]
+            delta = min(results[(lo, mid)][2], results[(mid, hi)][2])
+            frame['split'] = xm
+            frame['strip'] = (xm - delta, xm + delta)
+            frame['info'] = (f"合并：两半中较小的距离 d = {delta:.2f}\n"
+                             f"检查 |x - {xm:g}| < d 的窄带\n结果 P{i+1}-P{j+1}，距离 {dist:.2f}")
+    frames.append(frame)
+
+# 创建图形
+fig, ax = plt.subplots(figsize=(12, 10))
+ax.set_xlim(0, 8)
+ax.set_ylim(0, 7)
+ax.set_aspect('equal')
+ax.grid(True, alpha=0.3)
+ax.set_title('分治法求最近点对', fontsize=18, fontweight='bold')
+
+# 绘制所有点
+ax.scatter(points[:, 0], points[:, 1], c='blue', s=150, zorder=5, alpha=0.6)
+
+# 为每个点添加标签
+for i, point in enumerate(points):
+    ax.annotate(f'P{i+1}', (point[0], point[1]), xytext=(8, 8),
+                textcoords='offset points', fontsize=14, fontweight='bold')
+
+# 初始化动画元素
+region = ax.add_patch(Rectangle((0, 0), 0, 7, facecolor='lightgreen', alpha=0.3, zorder=1))
+strip = ax.add_patch(Rectangle((0, 0), 0, 7, facecolor='orange', alpha=0.3, zorder=1))
+member_scatter = ax.scatter([], [], c='green', s=200, zorder=6)
+split_line, = ax.plot([], [], 'r--', linewidth=2, zorder=3)
+pair_line, = ax.plot([], [], 'm-', linewidth=4, zorder=4)
+pair_scatter = ax.scatter([], [], c='yellow', s=300, zorder=7, alpha=0.8, edgecolors='orange', linewidth=3)
+
+# 添加文本显示当前步骤
+step_text = ax.text(0.02, 0.98, '', transform=ax.transAxes, fontsize=14,
+                    verticalalignment='top', bbox=dict(boxstyle="round,pad=0.5", facecolor="yellow", alpha=0.8))
+
+
+def init():
+    region.set_width(0)
+    strip.set_width(0)
+    member_scatter.set_offsets(np.empty((0, 2)))
+    split_line.set_data([], [])
+    pair_line.set_data([], [])
+    pair_scatter.set_offsets(np.empty((0, 2)))
+    step_text.set_text('')
+    return region, strip, member_scatter, split_line, pair_line, pair_scatter, step_text
+
+
+def animate(frame):
+    current = frames[frame]
+    members = points[current['members']]
+
+    # 当前子问题的范围
+    left, right = members[:, 0].min() - 0.2, members[:, 0].max() + 0.2
+    region.set_x(left)
+    region.set_width(right - left)
+    member_scatter.set_offsets(members)
+
+    # 分界线与窄带
+    if current['split'] is not None:
+        split_line.set_data([current['split'], current['split']], [0, 7])
+    else:
+        split_line.set_data([], [])
+    if current['strip'] is not None:
+        lo, hi = current['strip']
+        strip.set_x(max(lo, left))
+        strip.set_width(max(min(hi, right) - max(lo, left), 0))
+    else:
+        strip.set_width(0)
+
+    # 当前找到的最近点对
+    if current['pair'] is not None:
+        pair = points[list(current['pair'])]
+        pair_line.set_data(pair[:, 0], pair[:, 1])
+        pair_scatter.set_offsets(pair)
+    else:
+        pair_line.set_data([], [])
+        pair_scatter.set_offsets(np.empty((0, 2)))
+
+    step_text.set_text(f"步骤 {frame + 1}/{len(frames)}\n{current['info']}")
+    return region, strip, member_scatter, split_line, pair_line, pair_scatter, step_text
+
+
+# 创建动画
+anim = FuncAnimation(fig, animate, init_func=init, frames=len(frames),
+                     interval=1000, blit=True, repeat=True)
+
+plt.tight_layout()
+
+# 保存为GIF
+print(f"最近点对：P{best_i+1}-P{best_j+1}，距离 {best_dist:.2f}")
+print("正在生成GIF动画...")
+try:
+    anim.save('closest_pair_animation.gif', writer='pillow', fps=1, dpi=150)
+    print("GIF动画已保存为 closest_pair_animation.gif")
+except Exception as e:
+    print(f"保存GIF时出错: {e}")
+    print("尝试保存为MP4格式...")
+    try:
+        anim.save('closest_pair_animation.mp4', writer='ffmpeg', fps=1)
+        print("MP4动画已保存为 closest_pair_animation.mp4")
+    except Exception as e2:
+        print(f"保存MP4时也出错: {e2}")
+
+# # 显示动画
+# plt.show()
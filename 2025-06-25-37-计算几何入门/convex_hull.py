@@ -0,0 +1,173 @@
+"""
+凸包
+
+全程只用点的下标：输入是 (n, 2) 的坐标数组，输出是凸包顶点在其中的下标，
+动画需要的每一步也记成下标元组，不必再按坐标反查点的编号。
+- graham_scan：极角排序 + 栈，可记录每一步，供动画使用
+- monotone_chain：Andrew 单调链，配合 akl_toussaint 预筛整批处理，用于百万、千万级的点集
+两者返回的顶点顺序相同，可以互相替换。
+"""
+import numpy as np
+
+# trace 中每一步的种类
+INIT, POP, PUSH = 0, 1, 2
+
+
+def polar_order(points):
+    """Graham 扫描的顺序：最下（同高取最左）的点在前，其余点按相对它的极角、再按距离排序"""
+    pts = np.asarray(points, dtype=np.float64)
+    x, y = pts[:, 0], pts[:, 1]
+    start = int(np.lexsort((x, y))[0])
+    others = np.delete(np.arange(len(pts)), start)
+    dx, dy = x[others] - x[start], y[others] - y[start]
+    # 极角相同时近的在前，否则最后一条射线上远处的顶点会被近处的点弹掉
+    return [start] + others[np.lexsort((dx * dx + dy * dy, np.arctan2(dy, dx)))].tolist()
+
+
+def graham_scan(points, trace=None):
+    """
+    Graham 扫描，O(n log n)
+
+    参数:
+    points: (n, 2) 坐标数组
+    trace: 可选的 list，传入时依次追加
+           (INIT, a, b, -1, 0)：初始栈为 [a, b]
+           (POP, a, b, c, cross)：栈顶两点 a、b 与当前点 c 的叉积 cross <= 0，弹出 b
+           (PUSH, a, b, c, cross)：叉积 > 0（栈中只有一个点时 a = b = -1、cross = 0），压入 c
+
+    返回:
+    凸包顶点下标列表，从最下（同高取最左）的点开始逆时针排列；共线的点不算顶点
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    n = len(pts)
+    if n < 3:
+        return np.lexsort((pts[:, 0], pts[:, 1])).tolist() if n else []
+    order = polar_order(pts)
+    xs, ys = pts[:, 0].tolist(), pts[:, 1].tolist()
+    hull = order[:2]
+    if trace is not None:
+        trace.append((INIT, hull[0], hull[1], -1, 0))
+    for c in order[2:]:
+        cx, cy = xs[c], ys[c]
+        while len(hull) > 1:
+            a, b = hull[-2], hull[-1]
+            cross = (xs[b] - xs[a]) * (cy - ys[a]) - (ys[b] - ys[a]) * (cx - xs[a])
+            if cross > 0:
+                if trace is not None:
+                    trace.append((PUSH, a, b, c, cross))
+                break
+            if trace is not None:
+                trace.append((POP, a, b, c, cross))
+            hull.pop()
+        else:
+            if trace is not None:
+                trace.append((PUSH, -1, -1, c, 0))
+        hull.append(c)
+    return hull
+
+
+def replay(trace):
+    """按 trace 依次产生每一步之后的栈（下标列表的副本）"""
+    stack = []
+    for kind, a, b, c, _ in trace:
+        if kind == INIT:
+            stack = [a, b]
+        elif kind == POP:
+            stack.pop()
+        else:
+            stack.append(c)
+        yield stack[:]
+
+
+def akl_toussaint(points, directions=8):
+    """
+    Akl–Toussaint 预筛：在若干方向上取最远的点围成凸多边形，严格在它内部的点不可能在凸包上
+
+    参数:
+    directions: 4 时是原始的四边形（x、y 最小最大的四个点）；默认 8，再加上 x+y、x-y 两个方向，
+                能多筛掉四边形的四个角附近的点
+
+    返回:
+    其余点的下标（NumPy 数组，递增）
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    x, y = np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1])
+    # 方向角从 π（最左）开始逐个增加，各方向上最远的点依次就是逆时针的顶点
+    poly = []
+    for t in np.pi + np.arange(directions) * (2 * np.pi / directions):
+        k = int(np.argmax(np.round(np.cos(t), 12) * x + np.round(np.sin(t), 12) * y))
+        if not poly or (k != poly[-1] and k != poly[0]):
+            poly.append(k)
+    inside = np.ones(len(pts), dtype=bool)
+    for a, b in zip(poly, poly[1:] + poly[:1]):
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        # 叉积 (b - a) × (p - a) > 0 即 p 在边 a->b 左侧
+        inside &= dx * y - dy * x > dx * y[a] - dy * x[a]
+    return np.flatnonzero(~inside)
+
+
+def _half_hull(x, y, order):
+    """
+    按 order 的顺序求一侧的凸包链（Andrew 算法中的下链；传入逆序即上链）
+
+    只有首尾连线右侧（含线上）的点可能在这条链上；先整批删去与前后两点不构成左转的点
+    （这样的点一定不是凸包顶点），删得不多时再用栈扫描收尾
+    """
+    a, b = order[0], order[-1]
+    side = (x[b] - x[a]) * (y[order] - y[a]) - (y[b] - y[a]) * (x[order] - x[a])
+    keep = side <= 0
+    keep[0] = keep[-1] = True
+    order = order[keep]
+    while len(order) > 2:
+        a, b, c = order[:-2], order[1:-1], order[2:]
+        cross = (x[b] - x[a]) * (y[c] - y[a]) - (y[b] - y[a]) * (x[c] - x[a])
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:-1] = cross > 0
+        removed = len(order) - int(keep.sum())
+        order = order[keep]
+        if removed * 8 < len(order):
+            break
+    xs, ys = x[order].tolist(), y[order].tolist()
+    chain = []  # 栈中存的是 order 里的位置
+    for k in range(len(xs)):
+        while len(chain) > 1:
+            i, j = chain[-2], chain[-1]
+            if (xs[j] - xs[i]) * (ys[k] - ys[i]) - (ys[j] - ys[i]) * (xs[k] - xs[i]) > 0:
+                break
+            chain.pop()
+        chain.append(k)
+    return order[chain]
+
+
+def monotone_chain(points, prefilter=True):
+    """
+    Andrew 单调链凸包，排序用 NumPy，叉积判断在连续数组上整批进行，千万个点只需几秒
+
+    参数:
+    prefilter: 是否先用 akl_toussaint 去掉大部分内部点
+
+    返回:
+    与 graham_scan 相同：凸包顶点下标列表，从最下（同高取最左）的点开始逆时针排列，共线的点不算顶点；
+    重合的点只保留下标最小的一个
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(pts) == 0:
+        return []
+    x, y = np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1])
+    idx = akl_toussaint(pts) if prefilter and len(pts) > 8 else np.arange(len(pts))
+    xi, yi = x[idx], y[idx]
+    # 按 (x, y) 字典序排序；x 没有相同值时只按 x 排，比 lexsort 快得多
+    o = np.argsort(xi, kind='stable')
+    if (xi[o[1:]] == xi[o[:-1]]).any():
+        o = np.lexsort((yi, xi))
+    order = idx[o]
+    # 重合的点排在一起，只留第一个（排序稳定，即下标最小的）
+    dup = (x[order[1:]] == x[order[:-1]]) & (y[order[1:]] == y[order[:-1]])
+    order = order[np.concatenate(([True], ~dup))]
+    if len(order) < 3:
+        return order[np.lexsort((x[order], y[order]))].tolist()
+    lower = _half_hull(x, y, order)
+    upper = _half_hull(x, y, order[::-1])
+    hull = np.concatenate((lower[:-1], upper[:-1]))
+    start = int(np.lexsort((x[hull], y[hull]))[0])
+    return np.roll(hull, -start).tolist()
@@ -5,6 +5,8 @@ import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
 import matplotlib.patches as mpatches
 
+from convex_hull import graham_scan, replay, INIT, POP
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -25,69 +27,31 @@ points = np.array([
     [6, 5],   # 点12
 ])
 
-# 计算凸包（Graham扫描法）
-def cross_product(o, a, b):
-    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
-
+# 计算凸包（Graham扫描法），每一步的栈都是点的下标列表
 def graham_scan_with_steps(points):
     if len(points) < 3:
-        return [points], [points], [], []
-    
-    # 找到最左下角的点
-    start = min(points, key=lambda p: (p[1], p[0]))
-    
-    # 按极角排序其他点
-    def polar_angle(p):
-        return np.arctan2(p[1] - start[1], p[0] - start[0])
-    
-    sorted_points = sorted([p for p in points if not np.array_equal(p, start)], key=polar_angle)
-    sorted_points.insert(0, start)
+        return [list(range(len(points)))], [list(range(len(points)))], [''], [[]]
     
-    # Graham扫描，记录每一步的栈状态和检查信息
-    hull_states = []
-    stack_states = []
+    trace = []
+    graham_scan(points, trace)
+    hull_states = list(replay(trace))
+    stack_states = [state.copy() for state in hull_states]
     check_info = []
-    check_points = []  # 记录每次检查的三个点
+    check_points = []  # 记录每次检查的三个点的下标
     
-    hull = [sorted_points[0], sorted_points[1]]
-    hull_states.append(hull.copy())
-    stack_states.append(hull.copy())
-    check_info.append("初始栈：[P1, P2]")
-    check_points.append([])  # 初始状态没有检查点
-    
-    for i in range(2, len(sorted_points)):
-        current_point = sorted_points[i]
-        
-        # 弹出破坏凸性的点
-        while len(hull) > 1 and cross_product(hull[-2], hull[-1], current_point) <= 0:
-            # 记录检查信息
-            p1_idx = next(idx for idx, p in enumerate(points) if np.array_equal(p, hull[-2]))
-            p2_idx = next(idx for idx, p in enumerate(points) if np.array_equal(p, hull[-1]))
-            current_idx = next(idx for idx, p in enumerate(points) if np.array_equal(p, current_point))
-            cross_val = cross_product(hull[-2], hull[-1], current_point)
-            
+    for kind, p1_idx, p2_idx, current_idx, cross_val in trace:
+        if kind == INIT:
+            check_info.append(f"初始栈：[P{p1_idx+1}, P{p2_idx+1}]")
+            check_points.append([])  # 初始状态没有检查点
+        elif kind == POP:
             check_info.append(f"检查：P{p1_idx+1}→P{p2_idx+1}→P{current_idx+1}\n叉积={cross_val:.1f}≤0，弹出P{p2_idx+1}")
-            check_points.append([hull[-2], hull[-1], current_point])  # 记录检查的三个点
-            
-            hull.pop()
-            hull_states.append(hull.copy())
-            stack_states.append(hull.copy())
-        
-        # 加入新点
-        current_idx = next(idx for idx, p in enumerate(points) if np.array_equal(p, current_point))
-        if len(hull) > 1:
-            p1_idx = next(idx for idx, p in enumerate(points) if np.array_equal(p, hull[-2]))
-            p2_idx = next(idx for idx, p in enumerate(points) if np.array_equal(p, hull[-1]))
-            cross_val = cross_product(hull[-2], hull[-1], current_point)
+            check_points.append([p1_idx, p2_idx, current_idx])
+        elif p1_idx >= 0:
             check_info.append(f"检查：P{p1_idx+1}→P{p2_idx+1}→P{current_idx+1}\n叉积={cross_val:.1f}>0，加入P{current_idx+1}")
-            check_points.append([hull[-2], hull[-1], current_point])  # 记录检查的三个点
+            check_points.append([p1_idx, p2_idx, current_idx])
         else:
             check_info.append(f"加入P{current_idx+1}")
             check_points.append([])  # 没有检查点
-        
-        hull.append(current_point)
-        hull_states.append(hull.copy())
-        stack_states.append(hull.copy())
     
     return hull_states, stack_states, check_info, check_points
 
@@ -160,8 +124,8 @@ def init():
 
 def animate(frame):
     if frame < len(hull_states):
-        current_hull = np.array(hull_states[frame])
-        current_stack = np.array(stack_states[frame])
+        current_hull = points[hull_states[frame]]
+        current_stack = points[stack_states[frame]]
         current_info = check_info[frame] if frame < len(check_info) else ""
         current_check_points = check_points[frame] if frame < len(check_points) else []
         
@@ -189,7 +153,7 @@ def animate(frame):
         
         # 更新检查点特效
         if len(current_check_points) == 3:
-            check_points_array = np.array(current_check_points)
+            check_points_array = points[current_check_points]
             check_scatter.set_offsets(check_points_array)
             check_line.set_data(check_points_array[:, 0], check_points_array[:, 1])
         else:
@@ -200,12 +164,7 @@ def animate(frame):
         step_text.set_text(f'步骤 {frame + 1}/{len(hull_states)}\n凸包顶点数: {len(current_hull)}')
         
         # 获取栈中点的标签
-        stack_labels = []
-        for sp in current_stack:
-            for i, p in enumerate(points):
-                if np.array_equal(p, sp):
-                    stack_labels.append(f"P{i+1}")
-                    break
+        stack_labels = [f"P{i+1}" for i in stack_states[frame]]
         
         # 显示栈状态
         stack_text.set_text(f'栈大小: {len(current_stack)}\n栈内容: {stack_labels}')
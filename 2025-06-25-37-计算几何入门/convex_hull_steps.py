@@ -3,6 +3,9 @@ import numpy as np
 from matplotlib.patches import Polygon
 import matplotlib.patches as patches
 
+from convex_hull import graham_scan, polar_order, replay
+from rotating_calipers import diameter, min_area_rect
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -23,46 +26,15 @@ points = np.array([
     [6, 5],   # 点12
 ])
 
-# 计算凸包（Graham扫描法）
-def cross_product(o, a, b):
-    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
-
+# 计算凸包（Graham扫描法），每一步的栈都是点的下标列表
 def graham_scan_with_steps(points):
     if len(points) < 3:
-        return [points], [points]
-    
-    # 找到最左下角的点
-    start = min(points, key=lambda p: (p[1], p[0]))
-    
-    # 按极角排序其他点
-    def polar_angle(p):
-        return np.arctan2(p[1] - start[1], p[0] - start[0])
-    
-    sorted_points = sorted([p for p in points if not np.array_equal(p, start)], key=polar_angle)
-    sorted_points.insert(0, start)
-    
-    # Graham扫描，记录每一步的栈状态
-    hull_states = []
-    stack_states = []
-    
-    hull = [sorted_points[0], sorted_points[1]]
-    hull_states.append(hull.copy())
-    stack_states.append(hull.copy())
-    
-    for i in range(2, len(sorted_points)):
-        current_point = sorted_points[i]
-        
-        # 弹出破坏凸性的点
-        while len(hull) > 1 and cross_product(hull[-2], hull[-1], current_point) <= 0:
-            hull.pop()
-            hull_states.append(hull.copy())
-            stack_states.append(hull.copy())
-        
-        # 加入新点
-        hull.append(current_point)
-        hull_states.append(hull.copy())
-        stack_states.append(hull.copy())
+        return [list(range(len(points)))], [list(range(len(points)))]
     
+    trace = []
+    graham_scan(points, trace)
+    hull_states = list(replay(trace))
+    stack_states = [state.copy() for state in hull_states]
     return hull_states, stack_states
 
 # 计算所有步骤
@@ -81,8 +53,8 @@ for idx, step in enumerate(key_steps):
         break
         
     ax = axes[idx]
-    current_hull = np.array(hull_states[step])
-    current_stack = np.array(stack_states[step])
+    current_hull = points[hull_states[step]]
+    current_stack = points[stack_states[step]]
     
     # 绘制所有点
     ax.scatter(points[:, 0], points[:, 1], c='blue', s=80, zorder=5, alpha=0.6)
@@ -116,12 +88,7 @@ for idx, step in enumerate(key_steps):
     ax.grid(True, alpha=0.3)
     
     # 获取栈中点的标签
-    stack_labels = []
-    for sp in current_stack:
-        for i, p in enumerate(points):
-            if np.array_equal(p, sp):
-                stack_labels.append(f"P{i+1}")
-                break
+    stack_labels = [f"P{i+1}" for i in stack_states[step]]
     
     ax.set_title(f'步骤 {step + 1}\n栈: {stack_labels}\n凸包顶点: {len(current_hull)}', 
                 fontsize=10, fontweight='bold')
@@ -156,7 +123,7 @@ for i, point in enumerate(points):
 ax1.scatter(points[0, 0], points[0, 1], c='red', s=150, zorder=6, label='起始点')
 
 # 绘制最终凸包
-final_hull = np.array(hull_states[-1])
+final_hull = points[hull_states[-1]]
 if len(final_hull) >= 3:
     hull_polygon = Polygon(final_hull, facecolor='lightgreen', alpha=0.3, 
                           edgecolor='green', linewidth=3)
@@ -169,6 +136,15 @@ for i, point in enumerate(final_hull):
     ax1.annotate(f'H{i+1}', (point[0], point[1]), xytext=(5, 5), 
                 textcoords='offset points', fontsize=12, fontweight='bold', color='green')
 
+# 在最终凸包上旋转卡壳：直径与面积最小的外接矩形
+if len(final_hull) >= 3:
+    far_i, far_j, far_dist = diameter(points, hull_states[-1])
+    ax1.plot(points[[far_i, far_j], 0], points[[far_i, far_j], 1], 'm--', linewidth=2, zorder=3,
+             label=f'直径 P{far_i+1}-P{far_j+1} = {far_dist:.2f}')
+    rect_area, rect_corners = min_area_rect(points, hull_states[-1])
+    ax1.add_patch(Polygon(rect_corners, fill=False, edgecolor='orange', linewidth=2, linestyle='-.',
+                          label=f'最小外接矩形 面积 = {rect_area:.2f}'))
+
 ax1.legend()
 
 # 右图：栈的变化过程
@@ -190,10 +166,7 @@ for i, point in enumerate(points):
 ax2.scatter(points[0, 0], points[0, 1], c='red', s=150, zorder=6, label='起始点')
 
 # 绘制扫描顺序
-start = points[0]
-sorted_points = sorted([p for p in points if not np.array_equal(p, start)], 
-                      key=lambda p: np.arctan2(p[1] - start[1], p[0] - start[0]))
-sorted_points.insert(0, start)
+sorted_points = points[polar_order(points)]
 
 # 绘制扫描顺序
 for i in range(len(sorted_points) - 1):
@@ -0,0 +1,141 @@
+"""
+二维几何基本运算
+
+点和向量都是最后一维长度为 2 的 NumPy 数组，所有函数按 NumPy 规则广播：
+传单个点得到一个数，传 (N, 2) 得到 N 个结果，(M, 1, 2) 与 (N, 2) 则得到 M×N 的结果。
+"""
+from fractions import Fraction
+
+import numpy as np
+
+
+def _xy(p):
+    p = np.asarray(p)
+    return p[..., 0], p[..., 1]
+
+
+def cross(a, b):
+    """向量叉积 a × b（z 分量）"""
+    ax, ay = _xy(a)
+    bx, by = _xy(b)
+    return ax * by - ay * bx
+
+
+def cross_product(o, a, b):
+    """以 o 为起点的叉积 (a - o) × (b - o)：> 0 表示 o→a→b 逆时针（左转）"""
+    ox, oy = _xy(o)
+    ax, ay = _xy(a)
+    bx, by = _xy(b)
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def dot(a, b):
+    """向量点积"""
+    ax, ay = _xy(a)
+    bx, by = _xy(b)
+    return ax * bx + ay * by
+
+
+def orientation(o, a, b, eps=0):
+    """o→a→b 的转向：1 逆时针，-1 顺时针，0 共线（|叉积| <= eps）"""
+    c = cross_product(o, a, b)
+    return np.where(c > eps, 1, np.where(c < -eps, -1, 0)).astype(np.int8)
+
+
+def project(p, a, b):
+    """
+    点 p 在直线 ab 上的垂足
+
+    返回:
+    (h, t)：h 为垂足，t 为其参数（h = a + t (b - a)），0 <= t <= 1 时垂足落在线段上；a、b 重合时 t = 0
+    """
+    p, a, b = np.asarray(p, dtype=np.float64), np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    ab = b - a
+    len2 = dot(ab, ab)
+    num = dot(p - a, ab)
+    t = np.divide(num, len2, out=np.zeros(np.broadcast(num, len2).shape), where=len2 > 0)
+    return a + t[..., None] * ab, t
+
+
+def point_line_distance(p, a, b):
+    """点 p 到直线 ab 的距离"""
+    p = np.asarray(p, dtype=np.float64)
+    return np.hypot(*np.moveaxis(p - project(p, a, b)[0], -1, 0))
+
+
+def point_segment_distance(p, a, b):
+    """点 p 到线段 ab 的距离"""
+    p, a, b = np.asarray(p, dtype=np.float64), np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    _, t = project(p, a, b)
+    h = a + np.clip(t, 0, 1)[..., None] * (b - a)
+    return np.hypot(*np.moveaxis(p - h, -1, 0))
+
+
+def rotate(p, theta, center=(0, 0)):
+    """点 p 绕 center 逆时针旋转 theta（弧度）"""
+    p, center = np.asarray(p, dtype=np.float64), np.asarray(center, dtype=np.float64)
+    dx, dy = _xy(p - center)
+    c, s = np.cos(theta), np.sin(theta)
+    return center + np.stack((c * dx - s * dy, s * dx + c * dy), axis=-1)
+
+
+def triangle_area(a, b, c):
+    """三角形 abc 的有向面积，逆时针为正"""
+    return cross_product(a, b, c) / 2
+
+
+def polygon_area(poly):
+    """
+    鞋带公式求多边形的有向面积，逆时针为正
+
+    参数:
+    poly: (..., N, 2)，倒数第二维是顶点，可以一次传入多个顶点数相同的多边形
+    """
+    poly = np.asarray(poly)
+    return cross(poly, np.roll(poly, -1, axis=-2)).sum(axis=-1) / 2
+
+
+def polygon_areas(vertices, offsets, exact=False):
+    """
+    一批多边形的有向面积，逆时针为正
+
+    顶点按 CSR 方式拼接存放：第 i 个多边形是 vertices[offsets[i]:offsets[i+1]]，各多边形顶点数可以不同。
+    每个多边形先平移到以自己的第一个顶点为原点再用鞋带公式，坐标很大而多边形很小时也不会因相减而丢失精度；
+    各项叉积用 np.add.reduceat 按多边形分段求和，全部一次完成。
+
+    参数:
+    vertices: (V, 2) 所有多边形的顶点
+    offsets: (m + 1,) 递增，offsets[0] = 0、offsets[-1] = V；顶点数为 0 的多边形面积为 0
+    exact: True 时精确计算，返回 Fraction 组成的 object 数组。整数坐标的叉积不会超出 int64 时整批用整数计算，
+           否则（大整数、浮点、Fraction）转成 Python 的 int / Fraction 逐项计算，浮点数按其二进制值精确参与
+
+    返回:
+    (m,) 数组
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    pts = np.asarray(vertices)
+    starts, ends = offsets[:-1], offsets[1:]
+    counts = ends - starts
+    pts = pts[:offsets[-1]]
+    # 每个顶点的下一个顶点，多边形最后一个顶点回到第一个
+    nxt = np.arange(1, len(pts) + 1)
+    nonempty = counts > 0
+    nxt[ends[nonempty] - 1] = starts[nonempty]
+    first = np.repeat(starts[nonempty], counts[nonempty])
+    if not exact:
+        pts = pts.astype(np.float64)
+    elif pts.dtype.kind in 'iu':
+        # 叉积的上界按浮点估计，留出余量
+        as_float = pts.astype(np.float64)
+        span = np.abs(as_float - as_float[first]).max(initial=0)
+        pts = pts.astype(np.int64 if 2 * span * span * counts.max(initial=0) < 2.0 ** 62 else object)
+    else:
+        pts = np.frompyfunc(Fraction, 1, 1)(pts)
+    rel = pts - pts[first]
+    terms = cross(rel, rel[nxt])
+    doubled = np.zeros(len(counts), dtype=terms.dtype)
+    if len(terms):
+        doubled[nonempty] = np.add.reduceat(terms, starts[nonempty])
+    if not exact:
+        return doubled / 2
+    return np.array([Fraction(a, 2) for a in doubled.tolist()], dtype=object)
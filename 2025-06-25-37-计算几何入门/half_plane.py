@@ -0,0 +1,122 @@
+"""
+半平面交
+
+每个半平面用一条有向直线表示：点 p、方向 d，保留直线左侧（含线上），即 (d × (x - p)) >= 0。
+按方向的极角排序后用双端队列扫描（排序 O(n log n)，扫描 O(n)）：
+- 极角相同（平行同向）的只留最靠里的一条
+- 新直线加入前，先从队尾、再从队首弹出交点不在它左侧的直线
+- 最后用队首的直线检查队尾，再用队尾检查队首，剩下的相邻直线两两相交即得凸多边形
+另外加入一个边长 2 * box 的正方形的四条边，结果无界时会被它截住，从返回的边编号可以看出来。
+"""
+import numpy as np
+
+from point_in_polygon import PolygonIndex
+
+BOX = 1e6  # 包围框的半边长，输入坐标应远小于它
+EPS = 1e-9  # 方向已归一化，EPS 即距离的容差
+
+
+def half_plane_intersection(points, directions, box=BOX, eps=EPS):
+    """
+    求所有半平面的交
+
+    参数:
+    points: (n, 2) 每条直线上的一点
+    directions: (n, 2) 每条直线的方向，不必是单位向量
+    box: 包围框的半边长；包围框的四条边编号为 -1 到 -4
+    eps: 容差，点到直线的有向距离 <= eps 即视为不在直线左侧
+
+    返回:
+    (vertices, lines)：vertices 为 (k, 2) 凸多边形顶点，逆时针排列；
+    vertices[i] -> vertices[(i+1) % k] 这条边在第 lines[i] 个半平面的边界上。
+    lines 中有负数说明交集无界（被包围框截住）；交集为空或面积为 0 时 k = 0
+    """
+    p = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    d = np.asarray(directions, dtype=np.float64).reshape(-1, 2)
+    corner = np.array([[-box, -box], [box, -box], [box, box], [-box, box]])
+    p = np.concatenate((p, corner))
+    d = np.concatenate((d, np.roll(corner, -1, axis=0) - corner))
+    ids = np.concatenate((np.arange(len(p) - 4), -np.arange(1, 5)))
+    d = d / np.hypot(d[:, 0], d[:, 1])[:, None] + 0.0  # + 0.0 把 -0.0 变成 0.0，让 (-1, 0) 的极角总是 π
+    angle = np.arctan2(d[:, 1], d[:, 0])
+    offset = d[:, 0] * p[:, 1] - d[:, 1] * p[:, 0]  # 半平面即 d × x >= offset，越大越靠里
+    order = np.argsort(angle, kind='stable')
+    # 相邻极角之差不超过 eps 的归为一组（首尾在 ±π 处相接的也算一组），每组只留 offset 最大的
+    a = angle[order]
+    group = np.cumsum(np.concatenate(([False], np.diff(a) > eps)))
+    if group[-1] > 0 and a[0] + 2 * np.pi - a[-1] <= eps:
+        group[group == group[-1]] = 0
+    best = np.lexsort((-offset[order], group))
+    first = np.concatenate(([True], np.diff(group[best]) != 0))
+    order = order[np.sort(best[first])]
+
+    px, py = p[order, 0].tolist(), p[order, 1].tolist()
+    dx, dy = d[order, 0].tolist(), d[order, 1].tolist()
+
+    def out(j, x, y):
+        """点 (x, y) 不在第 j 条直线左侧"""
+        return dx[j] * (y - py[j]) - dy[j] * (x - px[j]) <= eps
+
+    def meet(i, j):
+        """第 i、j 条直线的交点"""
+        t = (dx[j] * (py[j] - py[i]) - dy[j] * (px[j] - px[i])) / (dx[j] * dy[i] - dy[j] * dx[i])
+        return px[i] + t * dx[i], py[i] + t * dy[i]
+
+    m = len(order)
+    q = [0] * m  # 队列中的直线
+    vx, vy = [0.0] * m, [0.0] * m  # vx[k], vy[k] 为 q[k] 与 q[k+1] 的交点
+    head = tail = 0
+    empty = np.empty((0, 2)), np.empty(0, dtype=np.int64)
+    for j in range(1, m):
+        ax, ay, bx, by = px[j], py[j], dx[j], dy[j]
+        while head < tail and bx * (vy[tail - 1] - ay) - by * (vx[tail - 1] - ax) <= eps:
+            tail -= 1
+        while head < tail and bx * (vy[head] - ay) - by * (vx[head] - ax) <= eps:
+            head += 1
+        i = q[tail]
+        den = bx * dy[i] - by * dx[i]
+        if abs(den) <= eps:
+            # 中间的直线都被弹出后剩下平行的两条：反向说明交集为空，同向留靠里的
+            if bx * dx[i] + by * dy[i] < 0:
+                return empty
+            if not out(j, px[i], py[i]):
+                continue
+            if head == tail:
+                q[tail] = j
+                continue
+            tail -= 1
+            i = q[tail]
+            den = bx * dy[i] - by * dx[i]
+        tail += 1
+        q[tail] = j
+        t = (bx * (ay - py[i]) - by * (ax - px[i])) / den
+        vx[tail - 1], vy[tail - 1] = px[i] + t * dx[i], py[i] + t * dy[i]
+    while tail - head > 1 and out(q[head], vx[tail - 1], vy[tail - 1]):
+        tail -= 1
+    while tail - head > 1 and out(q[tail], vx[head], vy[head]):
+        head += 1
+    if tail - head < 2:
+        return empty
+    vx[tail], vy[tail] = meet(q[tail], q[head])
+    vertices = np.column_stack((vx[head:tail + 1], vy[head:tail + 1]))
+    # 顶点 k 是 q[k] 与 q[k+1] 的交点，所以 k -> k+1 这条边在 q[k+1] 上
+    lines = ids[order[np.roll(q[head:tail + 1], -1)]]
+    return vertices, lines
+
+
+def polygon_half_planes(polygon):
+    """逆时针凸多边形的每条边作为一个半平面，返回 (points, directions)"""
+    poly = np.asarray(polygon, dtype=np.float64)
+    return poly, np.roll(poly, -1, axis=0) - poly
+
+
+def locate(points, vertices):
+    """
+    批量判断点与半平面交的位置关系
+
+    交集是凸多边形，直接用 PolygonIndex 查询，返回 OUTSIDE、INSIDE 或 BOUNDARY；
+    交集无界时以包围框为界，框外的点判为 OUTSIDE
+    """
+    if len(vertices) == 0:
+        return np.zeros(len(np.reshape(points, (-1, 2))), dtype=np.int8)
+    return PolygonIndex(vertices).locate(points)
@@ -2,14 +2,18 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Polygon, FancyArrowPatch
 import matplotlib.patches as patches
+import time
+
+from half_plane import half_plane_intersection, polygon_half_planes, locate
+from point_in_polygon import INSIDE, BOUNDARY
 
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
 
-# 创建图形，只保留主图
-fig = plt.figure(figsize=(8, 8))
-ax = fig.add_subplot(1, 1, 1)
+# 创建图形：左图为示意图，右图为大规模随机半平面的计算结果
+fig = plt.figure(figsize=(16, 8))
+ax = fig.add_subplot(1, 2, 1)
 ax.set_xlim(-2, 8)
 ax.set_ylim(-2, 8)
 ax.set_aspect('equal')
@@ -34,14 +38,19 @@ for i, point in enumerate(polygon_points):
     ax.plot(point[0], point[1], 'ko', markersize=6)
     ax.annotate(f'V{i+1}', (point[0], point[1]), xytext=(3, 3), textcoords='offset points', fontsize=10)
 
+# 多边形的每条边作为一个半平面（保留左侧），再加一条切掉 V4 附近的半平面 H7
+line_points, line_directions = polygon_half_planes(polygon_points)
+line_points = np.vstack((line_points, [5.5, 2.5]))
+line_directions = np.vstack((line_directions, [-2.5, 2.5]))
+
 # 定义半平面标记直线的颜色和样式
-line_colors = ['red', 'orange', 'green', 'purple', 'brown', 'pink']
-line_styles = ['-', '--', '-.', ':', '-', '--']
+line_colors = ['red', 'orange', 'green', 'purple', 'brown', 'pink', 'teal']
+line_styles = ['-', '--', '-.', ':', '-', '--', '-.']
 
-# 绘制每条边作为半平面标记直线
-for i in range(len(polygon_points)):
-    p1 = polygon_points[i]
-    p2 = polygon_points[(i + 1) % len(polygon_points)]
+# 绘制每个半平面的边界直线
+for i in range(len(line_points)):
+    p1 = line_points[i]
+    p2 = line_points[i] + line_directions[i]
     
     # 计算边的方向向量
     direction = p2 - p1
@@ -78,8 +87,8 @@ for i in range(len(polygon_points)):
                 bbox=dict(boxstyle="round,pad=0.2", facecolor="white", alpha=0.8))
 
 # 标记半平面交的结果区域
-# 半平面交的结果就是原始凸多边形
-result_polygon = Polygon(polygon_points, facecolor='yellow', alpha=0.4, 
+result_points, _ = half_plane_intersection(line_points, line_directions)
+result_polygon = Polygon(result_points, facecolor='yellow', alpha=0.4, 
                         edgecolor='black', linewidth=3, linestyle='-')
 ax.add_patch(result_polygon)
 
@@ -91,7 +100,9 @@ test_points = [
     [6, 1],    # 在某些半平面外
 ]
 
-point_colors = ['green', 'green', 'red', 'red']
+# 按计算结果着色：交集内绿色，边界上橙色，交集外红色
+point_state = locate(test_points, result_points)
+point_colors = np.where(point_state == INSIDE, 'green', np.where(point_state == BOUNDARY, 'orange', 'red'))
 
 for i, (point, color) in enumerate(zip(test_points, point_colors)):
     ax.plot(point[0], point[1], 'o', color=color, markersize=8)
@@ -103,6 +114,37 @@ ax.set_title('半平面交示意图', fontsize=16, weight='bold')
 ax.set_xlabel('X坐标', fontsize=12)
 ax.set_ylabel('Y坐标', fontsize=12)
 
+# 右图：随机生成的大量半平面，每个都与半径 1~2 的圆相切、包含原点
+n_planes = 100000
+rng = np.random.default_rng(0)
+theta = rng.random(n_planes) * 2 * np.pi
+radius = 1 + rng.random(n_planes)
+normals = np.column_stack((np.cos(theta), np.sin(theta)))
+start = time.perf_counter()
+big_points, big_lines = half_plane_intersection(normals * radius[:, None], normals @ [[0, 1], [-1, 0]])
+elapsed = time.perf_counter() - start
+
+ax2 = fig.add_subplot(1, 2, 2)
+ax2.set_xlim(-2.5, 2.5)
+ax2.set_ylim(-2.5, 2.5)
+ax2.set_aspect('equal')
+ax2.grid(True, alpha=0.3)
+# 只画其中一部分边界直线
+for k in rng.choice(n_planes, 200, replace=False):
+    foot = normals[k] * radius[k]
+    tangent = np.array([-normals[k, 1], normals[k, 0]]) * 4
+    ax2.plot([foot[0] - tangent[0], foot[0] + tangent[0]], [foot[1] - tangent[1], foot[1] + tangent[1]],
+             color='gray', linewidth=0.5, alpha=0.4)
+ax2.add_patch(Polygon(big_points, facecolor='yellow', alpha=0.4, edgecolor='black', linewidth=2))
+# 批量判断随机查询点
+queries = rng.random((3000, 2)) * 5 - 2.5
+inside = locate(queries, big_points) != 0
+ax2.plot(queries[inside, 0], queries[inside, 1], '.', color='green', markersize=3)
+ax2.plot(queries[~inside, 0], queries[~inside, 1], '.', color='red', markersize=3)
+ax2.set_title(f'{n_planes} 个随机半平面的交（{len(big_points)} 条边，用时 {elapsed:.2f} 秒）', fontsize=14)
+ax2.set_xlabel('X坐标', fontsize=12)
+ax2.set_ylabel('Y坐标', fontsize=12)
+
 plt.tight_layout()
 plt.savefig('half_plane_intersection.svg', format='svg', dpi=300, bbox_inches='tight')
 # plt.show()
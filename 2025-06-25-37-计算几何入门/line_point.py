@@ -4,6 +4,8 @@ from matplotlib import rcParams
 import matplotlib.patches as patches
 from matplotlib.patches import Polygon
 
+from geometry import project, rotate
+
 rcParams['font.sans-serif'] = [
     'SimHei', 'Arial Unicode MS', 'Microsoft YaHei',
     'Noto Sans CJK SC', 'Noto Sans CJK SC Regular',
@@ -39,10 +41,7 @@ ax.plot([A[0], B[0]], [A[1], B[1]], 'b-', label='直线AB')
 # 点P
 ax.plot(P[0], P[1], 'ro', label='点P')
 # 垂足
-AB = B - A
-AP = P - A
-proj_len = np.dot(AP, AB) / np.linalg.norm(AB)
-proj = A + proj_len * AB / np.linalg.norm(AB)
+proj, _ = project(P, A, B)
 ax.plot([P[0], proj[0]], [P[1], proj[1]], 'g--', label='距离')
 ax.plot(proj[0], proj[1], 'go', label='垂足')
 ax.text(A[0], A[1]-0.3, 'A', color='blue', fontsize=16, ha='center')
@@ -63,10 +62,7 @@ fig, ax = plt.subplots(figsize=(5, 5))
 O = np.array([3, 3])
 P = np.array([5, 3])
 theta = np.pi/3  # 60度
-Q = O + np.array([
-    np.cos(theta)*(P[0]-O[0]) - np.sin(theta)*(P[1]-O[1]),
-    np.sin(theta)*(P[0]-O[0]) + np.cos(theta)*(P[1]-O[1])
-])
+Q = rotate(P, theta, O)
 ax.plot([O[0], P[0]], [O[1], P[1]], 'b-', label='原始')
 ax.plot([O[0], Q[0]], [O[1], Q[1]], 'g-', label='旋转后')
 ax.plot(O[0], O[1], 'ko', label='中心O')
@@ -203,12 +199,9 @@ ax.plot([A[0], B[0]], [A[1], B[1]], 'b-', label='线段AB')
 # 点P
 ax.plot(P[0], P[1], 'ro', label='点P')
 # 垂足
-AB = B - A
-AP = P - A
-proj_len = np.dot(AP, AB) / np.linalg.norm(AB)
-proj = A + proj_len * AB / np.linalg.norm(AB)
+proj, t = project(P, A, B)
 # 判断投影是否在线段上
-on_seg = 0 <= proj_len <= np.linalg.norm(AB)
+on_seg = 0 <= t <= 1
 if on_seg:
     ax.plot([P[0], proj[0]], [P[1], proj[1]], 'g--', label='距离')
     ax.plot(proj[0], proj[1], 'go', label='垂足')
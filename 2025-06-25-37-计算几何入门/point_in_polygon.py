@@ -0,0 +1,147 @@
+"""
+批量判断点在多边形内外
+
+规则与 polygon_point.py 相同：从点向右作水平射线，边从下往上穿过射线且点在边左侧时 flag 加 1，
+从上往下穿过且点在边右侧时减 1，flag 不为 0 即在多边形内（非零环绕规则）。
+边的下端点算在射线上、上端点不算，射线恰好经过顶点时不会重复计数。
+点落在某条边上（叉积为 0 且在边的包围盒内）时一律判为 BOUNDARY，不看 flag。
+
+PolygonIndex 用所有顶点的 y 坐标把平面切成横条：横条内部没有顶点，简单多边形穿过它的边互不相交，
+可以按 x 从左到右排好。射线穿过的正是查询点右边的那些边，flag 就是它们方向（向上 +1、向下 -1）的后缀和，
+于是每个点只需在所在横条里二分找到自己的位置，与 O(log n) 条边做叉积；所有点的二分同时进行。
+点的 y 恰好等于某个顶点的 y 时，再和以这一高度为端点的边（含水平边）逐一检查是否在边上。
+"""
+import numpy as np
+
+OUTSIDE, INSIDE, BOUNDARY = 0, 1, 2
+
+PAIR_CHUNK = 1 << 22  # 逐对计算时每批最多的 (点, 边) 组合数
+
+
+def _edge_terms(px, py, x1, y1, x2, y2):
+    """逐对计算边对 flag 的贡献（+1、-1、0）以及点是否在边上"""
+    cross = (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+    d1, d2 = y1 - py, y2 - py
+    wind = ((cross > 0) & (d1 <= 0) & (d2 > 0)).astype(np.int8) - ((cross < 0) & (d2 <= 0) & (d1 > 0))
+    on = ((cross == 0) & (np.minimum(x1, x2) <= px) & (px <= np.maximum(x1, x2))
+          & (np.minimum(y1, y2) <= py) & (py <= np.maximum(y1, y2)))
+    return wind, on
+
+
+def _pairs(start, cnt):
+    """
+    每个点 i 要和 start[i] 开始的 cnt[i] 个位置逐一配对
+
+    返回:
+    (q, pos)：第 k 个组合属于第 q[k] 个点，对应位置 pos[k]
+    """
+    q = np.repeat(np.arange(len(cnt)), cnt)
+    pos = np.repeat(start - (np.cumsum(cnt) - cnt), cnt) + np.arange(len(q))
+    return q, pos
+
+
+class PolygonIndex:
+    def __init__(self, polygon):
+        """
+        参数:
+        polygon: (n, 2) 顶点数组，顺时针、逆时针均可；必须是简单多边形（边只在公共顶点处相交），
+                 自相交的多边形用 locate_points(..., simple=False)
+        """
+        poly = np.asarray(polygon, dtype=np.float64)
+        x1, y1 = poly[:, 0], poly[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.levels = np.unique(y1)
+        # 横条 k 是 [levels[k], levels[k+1])，非水平边跨过从 lo 到 hi - 1 的横条
+        slanted = np.flatnonzero(y1 != y2)
+        low = np.minimum(y1, y2)[slanted]
+        high = np.maximum(y1, y2)[slanted]
+        lo = np.searchsorted(self.levels, low)
+        span = np.searchsorted(self.levels, high) - lo
+        edge = np.repeat(slanted, span)
+        slab = np.repeat(lo, span) + np.arange(len(edge)) - np.repeat(np.cumsum(span) - span, span)
+        # 横条内按边在横条中线处的 x 排序
+        mid = (self.levels[slab] + self.levels[slab + 1]) / 2
+        xmid = x1[edge] + (mid - y1[edge]) * (x2[edge] - x1[edge]) / (y2[edge] - y1[edge])
+        order = np.lexsort((xmid, slab))
+        self.edges = edge[order]
+        # 统一成从下往上的方向：(ax, ay) 为下端点，(bx, by) 为上端点，up 为原方向（向上 +1，向下 -1）
+        e = self.edges
+        up = y2[e] > y1[e]
+        self.ax, self.ay = np.where(up, x1[e], x2[e]), np.where(up, y1[e], y2[e])
+        self.bx, self.by = np.where(up, x2[e], x1[e]), np.where(up, y2[e], y1[e])
+        self.cum = np.concatenate(([0], np.cumsum(np.where(up, 1, -1))))
+        self.indptr = np.zeros(len(self.levels), dtype=np.int64)
+        np.cumsum(np.bincount(slab, minlength=len(self.levels) - 1), out=self.indptr[1:])
+        # 每个高度上以它为端点的边（含水平边），用来检查恰好落在这一高度上的点
+        touch = np.concatenate((np.arange(len(poly)), np.arange(len(poly))))
+        touch_level = np.searchsorted(self.levels, np.concatenate((y1, y2)))
+        order = np.argsort(touch_level, kind='stable')
+        self.touch = touch[order]
+        self.touch_ptr = np.zeros(len(self.levels) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(touch_level, minlength=len(self.levels)), out=self.touch_ptr[1:])
+
+    def locate(self, points):
+        """
+        返回:
+        int8 数组，每个点为 OUTSIDE、INSIDE 或 BOUNDARY
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        px, py = pts[:, 0], pts[:, 1]
+        result = np.full(len(pts), OUTSIDE, dtype=np.int8)
+        k = np.searchsorted(self.levels, py, side='right') - 1  # 所在横条
+        idx = np.flatnonzero((k >= 0) & (k < len(self.levels) - 1))
+        qx, qy, kk = px[idx], py[idx], k[idx]
+        # 二分：lo 为第一条不在点左边的边（点在它左侧或线上）
+        lo, hi = self.indptr[kk], self.indptr[kk + 1]
+        end = hi.copy()
+        active = np.flatnonzero(lo < hi)
+        while len(active):
+            m = (lo[active] + hi[active]) // 2
+            a = active
+            cross = (self.bx[m] - self.ax[m]) * (qy[a] - self.ay[m]) - (self.by[m] - self.ay[m]) * (qx[a] - self.ax[m])
+            right = cross < 0
+            lo[a[right]] = m[right] + 1
+            hi[a[~right]] = m[~right]
+            active = a[lo[a] < hi[a]]
+        flag = self.cum[end] - self.cum[lo]
+        on = np.zeros(len(idx), dtype=bool)
+        hit = np.flatnonzero(lo < end)
+        m = lo[hit]
+        on[hit] = ((self.bx[m] - self.ax[m]) * (qy[hit] - self.ay[m])
+                   == (self.by[m] - self.ay[m]) * (qx[hit] - self.ax[m]))
+        result[idx] = np.where(on, BOUNDARY, np.where(flag != 0, INSIDE, OUTSIDE))
+        # y 恰好等于某个顶点高度的点：检查以该高度为端点的边
+        level = np.searchsorted(self.levels, py)
+        at = np.flatnonzero((level < len(self.levels)) & (self.levels[np.minimum(level, len(self.levels) - 1)] == py))
+        if len(at):
+            start = self.touch_ptr[level[at]]
+            q, pos = _pairs(start, self.touch_ptr[level[at] + 1] - start)
+            e = self.touch[pos]
+            _, on_edge = _edge_terms(px[at][q], py[at][q], self.x1[e], self.y1[e], self.x2[e], self.y2[e])
+            hit = at[np.unique(q[on_edge])]
+            result[hit] = BOUNDARY
+        return result
+
+
+def locate_points_brute(points, polygon):
+    """每个点与所有边逐对计算，O(mn)，也适用于自相交的多边形"""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    poly = np.asarray(polygon, dtype=np.float64)
+    x1, y1 = poly[:, 0], poly[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    result = np.empty(len(pts), dtype=np.int8)
+    step = max(PAIR_CHUNK // len(poly), 1)
+    for a in range(0, len(pts), step):
+        px, py = pts[a:a + step, 0:1], pts[a:a + step, 1:2]
+        wind, on = _edge_terms(px, py, x1, y1, x2, y2)
+        flag = wind.sum(axis=1)
+        result[a:a + step] = np.where(on.any(axis=1), BOUNDARY, np.where(flag != 0, INSIDE, OUTSIDE))
+    return result
+
+
+def locate_points(points, polygon, simple=True):
+    """一次性查询：简单多边形建 PolygonIndex 后查询，否则逐对计算"""
+    if simple:
+        return PolygonIndex(polygon).locate(points)
+    return locate_points_brute(points, polygon)
@@ -4,6 +4,8 @@ import numpy as np
 from matplotlib.animation import FuncAnimation
 import matplotlib.font_manager as fm
 
+from geometry import polygon_area, triangle_area
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -22,20 +24,6 @@ concave_points = np.array([
     [1, 1], [4, 1], [5, 3], [3, 4], [3.5, 1.5], [0, 2]
 ])
 
-def calculate_area(points):
-    """计算多边形面积"""
-    n = len(points)
-    area = 0
-    for i in range(n):
-        j = (i + 1) % n
-        area += points[i][0] * points[j][1]
-        area -= points[j][0] * points[i][1]
-    return abs(area) / 2
-
-def calculate_triangle_area(p1, p2, p3):
-    """计算三角形面积"""
-    return abs((p2[0] - p1[0]) * (p3[1] - p1[1]) - (p3[0] - p1[0]) * (p2[1] - p1[1])) / 2
-
 def update(frame):
     ax1.clear()
     ax2.clear()
@@ -107,7 +95,7 @@ def update(frame):
             # 从P0出发连接其他顶点形成三角形
             for i in range(1, current_vertices - 1):
                 triangle = [convex_points[0], convex_points[i], convex_points[i+1]]
-                triangle_area = calculate_triangle_area(triangle[0], triangle[1], triangle[2])
+                area = abs(triangle_area(*triangle))
                 
                 # 绘制三角形填充
                 triangle_patch = patches.Polygon(triangle, facecolor='lightblue', 
@@ -117,7 +105,7 @@ def update(frame):
                 # 显示三角形面积
                 center_x = (triangle[0][0] + triangle[1][0] + triangle[2][0]) / 3
                 center_y = (triangle[0][1] + triangle[1][1] + triangle[2][1]) / 3
-                ax1.text(center_x, center_y, f'{triangle_area:.1f}', 
+                ax1.text(center_x, center_y, f'{area:.1f}', 
                         fontsize=10, fontweight='bold', ha='center', va='center',
                         bbox=dict(boxstyle="round,pad=0.2", facecolor="white", alpha=0.8))
         
@@ -127,11 +115,10 @@ def update(frame):
             # 从P0出发连接其他顶点形成三角形
             for i in range(1, current_vertices2 - 1):
                 triangle = [concave_points[0], concave_points[i], concave_points[i+1]]
-                triangle_area = ((concave_points[i][0] - concave_points[0][0]) * (concave_points[i+1][1] - concave_points[0][1]) -
-                                 (concave_points[i+1][0] - concave_points[0][0]) * (concave_points[i][1] - concave_points[0][1])) / 2
-                abs_area = abs(triangle_area)
+                signed_area = triangle_area(*triangle)
+                abs_area = abs(signed_area)
                 # 判断正负面积
-                if triangle_area < 0:
+                if signed_area < 0:
                     # 负三角形用橙色
                     triangle_patch = patches.Polygon(triangle, facecolor='orange', 
                                                    alpha=0.5, edgecolor='red', linewidth=2)
@@ -153,13 +140,13 @@ def update(frame):
         # 计算当前进度下的面积
         current_convex = convex_points[:int(progress * n_convex) + 1]
         if len(current_convex) >= 3:
-            convex_area = calculate_area(current_convex)
+            convex_area = abs(polygon_area(current_convex))
         else:
             convex_area = 0
             
         current_concave = concave_points[:int(progress * n_concave) + 1]
         if len(current_concave) >= 3:
-            concave_area = calculate_area(current_concave)
+            concave_area = abs(polygon_area(current_concave))
         else:
             concave_area = 0
         
@@ -173,8 +160,8 @@ def update(frame):
     
     # 显示最终面积
     if progress >= 1:
-        final_convex_area = calculate_area(convex_points)
-        final_concave_area = calculate_area(concave_points)
+        final_convex_area = abs(polygon_area(convex_points))
+        final_concave_area = abs(polygon_area(concave_points))
         
         ax1.text(0.5, 5.5, f'最终面积: {final_convex_area:.2f}', 
                 fontsize=16, fontweight='bold', color='red',
@@ -221,7 +208,7 @@ anim.save('polygon_area_animation.gif', writer='pillow', fps=10, dpi=100)
 print("多边形面积计算动画已生成: polygon_area_animation.gif")
 
 # 显示最终面积
-final_convex_area = calculate_area(convex_points)
-final_concave_area = calculate_area(concave_points)
+final_convex_area = abs(polygon_area(convex_points))
+final_concave_area = abs(polygon_area(concave_points))
 print(f"凸多边形面积: {final_convex_area:.2f}")
 print(f"凹多边形面积: {final_concave_area:.2f}") 
\ No newline at end of file
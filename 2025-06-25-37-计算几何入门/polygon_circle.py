@@ -3,6 +3,8 @@ import numpy as np
 from matplotlib.patches import Polygon, Circle
 import matplotlib.patches as patches
 
+from circle_polygon import edge_distances, circle_polygon_area
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -63,57 +65,27 @@ for i, point in enumerate(polygon_points):
     ax_left.plot(point[0], point[1], 'ko', markersize=6)
     ax_left.annotate(f'V{i+1}', (point[0], point[1]), xytext=(3, 3), textcoords='offset points', fontsize=10)
 
-# 绘制线段与圆的关系示例
-# 选择一条边来展示线段与圆相交
-edge_start = polygon_points[1]  # V2
-edge_end = polygon_points[2]    # V3
-
-# 计算线段到圆心的距离
-def point_to_line_distance(point, line_start, line_end):
-    """计算点到线段的距离"""
-    line_vec = line_end - line_start
-    point_vec = point - line_start
-    line_len = np.linalg.norm(line_vec)
-    
-    if line_len == 0:
-        return np.linalg.norm(point_vec)
-    
-    # 投影参数
-    t = np.dot(point_vec, line_vec) / (line_len * line_len)
-    t = max(0, min(1, t))  # 限制在线段范围内
-    
-    # 最近点
-    closest_point = line_start + t * line_vec
-    return np.linalg.norm(point - closest_point)
-
-# 计算这条边到圆心的距离
-dist_to_circle = point_to_line_distance(circle_center, edge_start, edge_end)
-
-# 判断是否相交
-intersects = dist_to_circle <= circle_radius
-
-# 为了确保有红色边，我们强制选择一条与圆相交的边
-# 重新选择一条更明显的边
-edge_start = polygon_points[2]  # V3
-edge_end = polygon_points[3]    # V4
-dist_to_circle = point_to_line_distance(circle_center, edge_start, edge_end)
-intersects = dist_to_circle <= circle_radius
-
-# 绘制这条边，用不同颜色表示是否与圆相交
-if intersects:
-    ax_left.plot([edge_start[0], edge_end[0]], [edge_start[1], edge_end[1]], 'r-', linewidth=3, label='与圆相交的边')
-else:
-    ax_left.plot([edge_start[0], edge_end[0]], [edge_start[1], edge_end[1]], 'g-', linewidth=3, label='不与圆相交的边')
-
-# 添加距离标注
-if intersects:
+# 绘制线段与圆的关系：一次算出圆心到每条边的距离，距离不超过半径的边与圆相交
+dists = edge_distances(circle_center, polygon_points)[0]
+edge_ends = np.roll(polygon_points, -1, axis=0)
+labelled = False
+for edge_start, edge_end, dist_to_circle in zip(polygon_points, edge_ends, dists):
+    if dist_to_circle > circle_radius:
+        continue
+    ax_left.plot([edge_start[0], edge_end[0]], [edge_start[1], edge_end[1]], 'r-', linewidth=3,
+                 label=None if labelled else '与圆相交的边')
+    labelled = True
+    # 添加距离标注
     ax_left.annotate(f'距离: {dist_to_circle:.2f} < 半径: {circle_radius}', 
                 xy=((edge_start[0] + edge_end[0])/2, (edge_start[1] + edge_end[1])/2),
                 xytext=(5, 5), textcoords='offset points', fontsize=10, color='red',
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
 
+# 圆与多边形相交部分的面积
+overlap = circle_polygon_area(circle_center, circle_radius, polygon_points)[0]
+
 # 设置左图标题和标签
-ax_left.set_title('多边形与圆的位置关系示意图', fontsize=16, weight='bold')
+ax_left.set_title(f'多边形与圆的位置关系示意图\n相交部分面积 = {overlap:.3f}', fontsize=16, weight='bold')
 ax_left.set_xlabel('X坐标', fontsize=12)
 ax_left.set_ylabel('Y坐标', fontsize=12)
 
@@ -3,6 +3,8 @@ import numpy as np
 from matplotlib.patches import Polygon
 import matplotlib.patches as patches
 
+from geometry import cross_product
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -90,16 +92,16 @@ for i in range(len(polygon_points)):
     p2 = polygon_points[(i + 1) % len(polygon_points)]
     
     # 计算叉积和y坐标差
-    cross_product = (p2[0] - p1[0]) * (test_point[1] - p1[1]) - (p2[1] - p1[1]) * (test_point[0] - p1[0])
+    cross_val = cross_product(p1, p2, test_point)
     d1 = p1[1] - test_point[1]
     d2 = p2[1] - test_point[1]
     
     # 判断是否贡献flag
     contributes = False
-    if cross_product > 0 and d1 <= 0 and d2 > 0:
+    if cross_val > 0 and d1 <= 0 and d2 > 0:
         flag_count += 1
         contributes = True
-    elif cross_product < 0 and d2 <= 0 and d1 > 0:
+    elif cross_val < 0 and d2 <= 0 and d1 > 0:
         flag_count -= 1
         contributes = True
     
@@ -117,7 +119,7 @@ for i in range(len(polygon_points)):
     mid_x = (p1[0] + p2[0]) / 2
     mid_y = (p1[1] + p2[1]) / 2
     if contributes:
-        ax.annotate(f'边{i+1}\nflag{"++" if cross_product > 0 else "--"}', 
+        ax.annotate(f'边{i+1}\nflag{"++" if cross_val > 0 else "--"}', 
                    (mid_x, mid_y), xytext=(5, 5), textcoords='offset points', 
                    fontsize=9, bbox=dict(boxstyle="round,pad=0.2", facecolor="yellow", alpha=0.7))
     else:
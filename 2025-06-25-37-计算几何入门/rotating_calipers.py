@@ -0,0 +1,136 @@
+"""
+旋转卡壳
+
+输入是点集和凸包顶点的下标（graham_scan、monotone_chain 的输出：逆时针、没有共线的顶点）。
+依次以凸包的每条边 a->b 为底，维护三个"卡壳"顶点：
+- top：离这条边所在直线最远的点（对踵点）
+- right：沿 a->b 方向投影最大的点
+- left：沿 a->b 方向投影最小的点
+边逆时针转一圈时三个点也只会逆时针前进一圈，所以总共 O(h)。
+直径、最小宽度、最小面积外接矩形都由这些状态得到。
+
+trace 的每一步为 (a, b, top, right, left, value)，都是点的下标；value 是这一步的候选值
+（直径为此时两对对踵点的较大距离，宽度为 top 到边的距离，矩形为面积）；不需要的卡壳记为 -1。
+"""
+import math
+
+import numpy as np
+
+
+def _hull_xy(points, hull):
+    """凸包顶点的坐标，转成 Python 的 float 列表，逐条边计算时比 NumPy 逐元素访问快得多"""
+    pts = np.asarray(points, dtype=np.float64)
+    return pts[hull, 0].tolist(), pts[hull, 1].tolist()
+
+
+def _calipers(xs, ys, sides):
+    """
+    逐条边产生 (k, top, right, left)：k 是边 k -> k+1 在凸包中的位置，其余也是凸包中的位置；
+    sides 为 False 时不维护 right、left（记为 -1）
+    """
+    h = len(xs)
+    top = right = left = 1
+    for k in range(h):
+        nk = (k + 1) % h
+        ux, uy = xs[nk] - xs[k], ys[nk] - ys[k]
+        # 叉积越大离边越远，点积越大越靠前；每个指针最多转一圈
+        while ux * (ys[(top + 1) % h] - ys[k]) - uy * (xs[(top + 1) % h] - xs[k]) > \
+                ux * (ys[top] - ys[k]) - uy * (xs[top] - xs[k]):
+            top = (top + 1) % h
+        if not sides:
+            yield k, top, -1, -1
+            continue
+        if k == 0:
+            right = 1
+        while ux * xs[(right + 1) % h] + uy * ys[(right + 1) % h] > ux * xs[right] + uy * ys[right]:
+            right = (right + 1) % h
+        if k == 0:
+            left = top
+        while ux * xs[(left + 1) % h] + uy * ys[(left + 1) % h] < ux * xs[left] + uy * ys[left]:
+            left = (left + 1) % h
+        yield k, top, right, left
+
+
+def diameter(points, hull, trace=None):
+    """
+    凸包直径（点集中距离最远的两点）
+
+    返回:
+    (i, j, dist)：i、j 为点的下标
+    """
+    hull = list(hull)
+    xs, ys = _hull_xy(points, hull)
+    h = len(hull)
+    if h < 3:
+        return hull[0], hull[-1], math.hypot(xs[-1] - xs[0], ys[-1] - ys[0])
+    best = (0, 0, -1.0)  # 凸包中的位置
+    for k, t, _, _ in _calipers(xs, ys, sides=False):
+        nk = (k + 1) % h
+        da = math.hypot(xs[t] - xs[k], ys[t] - ys[k])
+        db = math.hypot(xs[t] - xs[nk], ys[t] - ys[nk])
+        if trace is not None:
+            trace.append((hull[k], hull[nk], hull[t], -1, -1, max(da, db)))
+        if da > best[2]:
+            best = (k, t, da)
+        if db > best[2]:
+            best = (nk, t, db)
+    return hull[best[0]], hull[best[1]], best[2]
+
+
+def min_width(points, hull, trace=None):
+    """
+    最小宽度：夹住点集的两条平行线之间的最小距离，一定有一条线贴着凸包的某条边
+
+    返回:
+    (width, a, b, t)：贴着边 a->b，另一条线过点 t，都是点的下标；点共线时宽度为 0
+    """
+    hull = list(hull)
+    xs, ys = _hull_xy(points, hull)
+    h = len(hull)
+    if h < 3:
+        return 0.0, hull[0], hull[-1], hull[0]
+    best = (math.inf, 0, 0)
+    for k, t, _, _ in _calipers(xs, ys, sides=False):
+        nk = (k + 1) % h
+        ux, uy = xs[nk] - xs[k], ys[nk] - ys[k]
+        width = (ux * (ys[t] - ys[k]) - uy * (xs[t] - xs[k])) / math.hypot(ux, uy)
+        if trace is not None:
+            trace.append((hull[k], hull[nk], hull[t], -1, -1, width))
+        if width < best[0]:
+            best = (width, k, t)
+    width, k, t = best
+    return width, hull[k], hull[(k + 1) % h], hull[t]
+
+
+def min_area_rect(points, hull, trace=None):
+    """
+    面积最小的外接矩形，一定有一条边贴着凸包的某条边
+
+    返回:
+    (area, corners)：corners 为 (4, 2) 的矩形顶点，逆时针，从贴着的那条边上、靠 left 一侧的角开始；
+    点共线时面积为 0，矩形退化为线段
+    """
+    hull = list(hull)
+    xs, ys = _hull_xy(points, hull)
+    h = len(hull)
+    if h < 3:
+        p, q = (xs[0], ys[0]), (xs[-1], ys[-1])
+        return 0.0, np.array([p, q, q, p])
+    best_area, best = math.inf, None
+    for k, t, r, l in _calipers(xs, ys, sides=True):
+        nk = (k + 1) % h
+        ux, uy = xs[nk] - xs[k], ys[nk] - ys[k]
+        norm = math.hypot(ux, uy)
+        ux, uy = ux / norm, uy / norm
+        # 以 u = 边的方向、n = 左法向为坐标轴，矩形是 [lo, hi] × [base, base + height]
+        lo, hi = ux * xs[l] + uy * ys[l], ux * xs[r] + uy * ys[r]
+        base = ux * ys[k] - uy * xs[k]
+        height = ux * (ys[t] - ys[k]) - uy * (xs[t] - xs[k])
+        area = (hi - lo) * height
+        if trace is not None:
+            trace.append((hull[k], hull[nk], hull[t], hull[r], hull[l], area))
+        if area < best_area:
+            best_area, best = area, (ux, uy, lo, hi, base, base + height)
+    ux, uy, lo, hi, b0, b1 = best
+    u, n = np.array([ux, uy]), np.array([-uy, ux])
+    return best_area, np.array([lo * u + b0 * n, hi * u + b0 * n, hi * u + b1 * n, lo * u + b1 * n])